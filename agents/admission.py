@@ -0,0 +1,133 @@
+"""
+Admission control for the candidate agent.
+A pipeline is in flight from the moment a profile is admitted until its
+recommendations (or an error) come back. When too many are in flight (the
+limit is halved while end-to-end latency is over target) or no discovery
+worker is healthy, new requests are queued with a "busy" acknowledgement and started as
+slots free up; low-priority requests (refreshes from candidates who were
+just served) are shed instead.
+"""
+
+import os
+import time
+from collections import Counter, deque
+from typing import Callable, Dict
+
+MAX_IN_FLIGHT = int(os.getenv("MAX_IN_FLIGHT_PIPELINES", "50"))
+MAX_WAITING = int(os.getenv("MAX_WAITING_PIPELINES", "100"))
+# End-to-end latency above this means the pipeline is saturated
+LATENCY_TARGET_SECONDS = float(os.getenv("PIPELINE_LATENCY_TARGET", "60"))
+# Pipelines that never report back stop counting against the limit after this
+PIPELINE_TIMEOUT_SECONDS = float(os.getenv("PIPELINE_TIMEOUT", "180"))
+# A candidate served within this window is sending a refresh (low priority)
+REFRESH_WINDOW_SECONDS = float(os.getenv("REFRESH_WINDOW", "300"))
+LATENCY_SMOOTHING = 0.2
+
+ACCEPT = "accept"
+QUEUE = "queue"
+REJECT = "reject"
+
+
+class AdmissionController:
+    """Tracks in-flight pipelines and decides whether new work is admitted, queued or shed"""
+
+    def __init__(self, max_in_flight: int = MAX_IN_FLIGHT, max_waiting: int = MAX_WAITING):
+        self.max_in_flight = max_in_flight
+        self.max_waiting = max_waiting
+        # candidate id -> start time of their pipeline
+        self.in_flight: Dict[str, float] = {}
+        # (candidate id, queued at, start callback), oldest first
+        self.waiting = deque()
+        # candidate id -> when their last report was delivered
+        self.last_served: Dict[str, float] = {}
+        self.latency_ewma = 0.0
+        self.queue_wait_ewma = 0.0
+        self.healthy_downstream = True
+        self.counters = Counter()
+
+    def _expire(self, now: float):
+        for candidate_id, started in list(self.in_flight.items()):
+            if now - started > PIPELINE_TIMEOUT_SECONDS:
+                del self.in_flight[candidate_id]
+                self.counters['timed_out'] += 1
+
+    def capacity(self) -> int:
+        """In-flight limit, halved while end-to-end latency is over target"""
+        if self.latency_ewma > LATENCY_TARGET_SECONDS:
+            return max(1, self.max_in_flight // 2)
+        return self.max_in_flight
+
+    def overloaded(self) -> bool:
+        return len(self.in_flight) >= self.capacity() or not self.healthy_downstream
+
+    def is_low_priority(self, candidate_id: str) -> bool:
+        served = self.last_served.get(candidate_id)
+        return served is not None and time.monotonic() - served < REFRESH_WINDOW_SECONDS
+
+    def admit(self, candidate_id: str, start: Callable[[], None]) -> str:
+        """
+        Decide on a new request. On ACCEPT the caller starts the pipeline
+        now; on QUEUE `start` is called once a slot frees up.
+        """
+        now = time.monotonic()
+        self._expire(now)
+
+        # A resend replaces the candidate's running pipeline rather than adding load
+        if candidate_id in self.in_flight or not self.overloaded():
+            self.in_flight[candidate_id] = now
+            self.counters['accepted'] += 1
+            return ACCEPT
+
+        if self.is_low_priority(candidate_id) or len(self.waiting) >= self.max_waiting:
+            self.counters['shed'] += 1
+            return REJECT
+
+        # Only the newest request per candidate is kept in the queue
+        self.waiting = deque(item for item in self.waiting if item[0] != candidate_id)
+        self.waiting.append((candidate_id, now, start))
+        self.counters['queued'] += 1
+        return QUEUE
+
+    def release(self, candidate_id: str):
+        """The candidate's pipeline ended without a result (e.g. unparseable input)"""
+        if self.in_flight.pop(candidate_id, None) is not None:
+            self._start_waiting()
+
+    def complete(self, candidate_id: str):
+        """Recommendations or an error came back for the candidate"""
+        now = time.monotonic()
+        started = self.in_flight.pop(candidate_id, None)
+        if started is None:
+            return
+        self.counters['completed'] += 1
+        self.last_served[candidate_id] = now
+        self.latency_ewma += LATENCY_SMOOTHING * ((now - started) - self.latency_ewma)
+        self._start_waiting()
+
+    def set_downstream_health(self, healthy: bool):
+        self.healthy_downstream = healthy
+        if healthy:
+            self._start_waiting()
+
+    def _start_waiting(self):
+        now = time.monotonic()
+        self._expire(now)
+        while self.waiting and len(self.in_flight) < self.capacity() and self.healthy_downstream:
+            candidate_id, queued_at, start = self.waiting.popleft()
+            self.queue_wait_ewma += LATENCY_SMOOTHING * ((now - queued_at) - self.queue_wait_ewma)
+            self.in_flight[candidate_id] = now
+            self.counters['started_from_queue'] += 1
+            start()
+
+    def stats(self) -> dict:
+        return {
+            'in_flight': len(self.in_flight),
+            'waiting': len(self.waiting),
+            'latency_ewma_seconds': round(self.latency_ewma, 2),
+            'queue_wait_ewma_seconds': round(self.queue_wait_ewma, 2),
+            'downstream_healthy': self.healthy_downstream,
+            **self.counters
+        }
+
+    def report(self) -> str:
+        return " | ".join(f"{key}={value}" for key, value in self.stats().items())
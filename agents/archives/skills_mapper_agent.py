@@ -2,6 +2,7 @@ from uagents import Agent, Context, Model
 import os
 from config.agent_addresses import JOB_DISCOVERY_ADDRESS
 from agents.models import CandidateProfile
+from agents.skill_graph import SKILLS_KNOWLEDGE_GRAPH
 # Data Models
 class EnrichedSkillsProfile(Model):
     candidate_id: str
@@ -23,58 +24,6 @@ skills_mapper_agent = Agent(
     endpoint=["http://localhost:8002/submit"]
 )
 
-# MeTTa Knowledge Graph (Simulated)
-SKILLS_KNOWLEDGE_GRAPH = {
-    "python": {
-        "related": ["django", "flask", "pandas", "data science", "machine learning"],
-        "category": "Programming",
-        "demand": "very high",
-        "avg_salary": 120000
-    },
-    "javascript": {
-        "related": ["react", "node.js", "vue.js", "typescript"],
-        "category": "Programming",
-        "demand": "very high",
-        "avg_salary": 115000
-    },
-    "react": {
-        "related": ["javascript", "redux", "next.js", "typescript"],
-        "category": "Frontend",
-        "demand": "very high",
-        "avg_salary": 110000
-    },
-    "machine learning": {
-        "related": ["tensorflow", "pytorch", "python", "data science", "ai"],
-        "category": "AI/ML",
-        "demand": "very high",
-        "avg_salary": 145000
-    },
-    "aws": {
-        "related": ["docker", "kubernetes", "terraform", "devops"],
-        "category": "Cloud",
-        "demand": "very high",
-        "avg_salary": 135000
-    },
-    "docker": {
-        "related": ["kubernetes", "aws", "devops", "ci/cd"],
-        "category": "DevOps",
-        "demand": "very high",
-        "avg_salary": 125000
-    },
-    "sql": {
-        "related": ["postgresql", "mysql", "database", "data analysis"],
-        "category": "Database",
-        "demand": "high",
-        "avg_salary": 105000
-    },
-    "leadership": {
-        "related": ["project management", "agile", "team building"],
-        "category": "Soft Skills",
-        "demand": "very high",
-        "avg_salary": 155000
-    }
-}
-
 def query_metta_knowledge_graph(skills: list) -> dict:
     related_skills = set()
     skill_categories = {}
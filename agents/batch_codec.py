@@ -0,0 +1,120 @@
+"""
+Compact wire encodings for JobListingBatch.
+Jobs are laid out column by column, repeated values (source, location,
+salary, company) are dictionary-encoded, and the result is zlib-compressed
+and base64-wrapped so it still travels as a plain uAgents string field.
+
+Encodings are negotiated: the recommender answers a worker's first batch
+with the BatchEncodings it can decode, and until then the worker sends the
+plain `jobs` list next to any compact payload, so a recommender that only
+reads `jobs` keeps working.
+"""
+
+import base64
+import json
+import os
+import zlib
+from typing import Dict, List, Tuple
+
+ENCODING_JSON = "json"
+ENCODING_ZLIB_COLUMNAR = "zlib-columnar"
+SUPPORTED_ENCODINGS = (ENCODING_JSON, ENCODING_ZLIB_COLUMNAR)
+
+COLUMNAR_VERSION = 1
+COMPRESSION_LEVEL = 1
+# Below this many jobs the plain list is small enough that encoding is not worth it
+MIN_JOBS_TO_COMPRESS = int(os.getenv("JOB_BATCH_MIN_COMPRESS", "5"))
+
+
+def _encode_columns(jobs: List[Dict]) -> Dict:
+    fields = []
+    seen_fields = set()
+    for job in jobs:
+        for field in job:
+            if field not in seen_fields:
+                seen_fields.add(field)
+                fields.append(field)
+
+    columns = {}
+    for field in fields:
+        missing = []
+        values = []
+        for row, job in enumerate(jobs):
+            if field in job:
+                values.append(job[field])
+            else:
+                missing.append(row)
+                values.append(None)
+
+        if all(value is None or isinstance(value, (str, bool, int, float)) for value in values):
+            # Dictionary-encode scalar columns; type is kept in the key so 1 and True stay distinct
+            distinct = []
+            positions = {}
+            indices = []
+            for value in values:
+                key = (type(value).__name__, value)
+                if key not in positions:
+                    positions[key] = len(distinct)
+                    distinct.append(value)
+                indices.append(positions[key])
+            column = {"d": distinct, "i": indices}
+        else:
+            column = {"r": values}
+        if missing:
+            column["x"] = missing
+        columns[field] = column
+
+    return {"v": COLUMNAR_VERSION, "n": len(jobs), "f": fields, "c": columns}
+
+
+def _decode_columns(layout: Dict) -> List[Dict]:
+    if layout.get("v") != COLUMNAR_VERSION:
+        raise ValueError(f"Unsupported columnar version: {layout.get('v')}")
+
+    count = layout["n"]
+    jobs = [{} for _ in range(count)]
+    for field in layout["f"]:
+        column = layout["c"][field]
+        if "d" in column:
+            distinct = column["d"]
+            values = [distinct[index] for index in column["i"]]
+        else:
+            values = column["r"]
+        missing = set(column.get("x", ()))
+        for row, value in enumerate(values):
+            if row not in missing:
+                jobs[row][field] = value
+    return jobs
+
+
+def encode_jobs(jobs: List[Dict], encoding: str = ENCODING_ZLIB_COLUMNAR) -> Tuple[str, str]:
+    """
+    Encode a job list for the wire.
+    Returns (encoding, payload). Falls back to ("json", "") - meaning send the
+    plain `jobs` list - when the encoding is unknown, the batch is small or
+    compression would not shrink it.
+    """
+    if encoding != ENCODING_ZLIB_COLUMNAR or len(jobs) < MIN_JOBS_TO_COMPRESS:
+        return ENCODING_JSON, ""
+
+    try:
+        layout = json.dumps(_encode_columns(jobs), separators=(",", ":"))
+        compressed = zlib.compress(layout.encode("utf-8"), COMPRESSION_LEVEL)
+        payload = base64.b64encode(compressed).decode("ascii")
+    except (TypeError, ValueError):
+        return ENCODING_JSON, ""
+
+    # The columnar layout is already smaller than the plain list, so this is a safe lower bound
+    if len(payload) >= len(layout):
+        return ENCODING_JSON, ""
+    return ENCODING_ZLIB_COLUMNAR, payload
+
+
+def decode_jobs(encoding: str, payload: str, jobs: List[Dict] = None) -> List[Dict]:
+    """Decode a batch payload back into a list of job dicts"""
+    if encoding == ENCODING_JSON or not encoding:
+        return jobs or []
+    if encoding == ENCODING_ZLIB_COLUMNAR:
+        raw = zlib.decompress(base64.b64decode(payload))
+        return _decode_columns(json.loads(raw))
+    raise ValueError(f"Unsupported job batch encoding: {encoding}")
@@ -1,14 +1,23 @@
+from llm_loader import LazyLLM, seconds_since_import
 from datetime import datetime
 from uuid import uuid4
 from uagents import Agent, Context, Protocol
+import asyncio
 import re
-from models import CandidateProfile, RecommendationReport, ErrorReport
+from models import (
+    CancelDiscovery, CandidateProfile, DiscoveryHeartbeat, ErrorReport, JobAlert, PDFResume, RecommendationReport, SavedSearch,
+    job_version, profile_fingerprint
+)
+from hash_ring import HEARTBEAT_INTERVAL, DiscoveryPool
+from admission import QUEUE, REJECT, AdmissionController
+from pdf_text import PDFExtractionError, decode_pdf, extract_pdf_text, shutdown_pool
+from resume_analyzer import SKILL_KEYWORDS, analyze_resume
+from salary import salary_expectation
+from profiling import profiled, profiler, register_profiling
+from memory_monitor import MemoryMonitor, deep_sizeof, register_memory_monitor
 import os 
-from config.agent_addresses import JOB_DISCOVERY_ADDRESS
-import re
+from config.agent_addresses import JOB_DISCOVERY_ADDRESSES
 from typing import List
-from langchain.chat_models import ChatOpenAI
-from langchain.schema import SystemMessage, HumanMessage
 
 from uagents_core.contrib.protocols.chat import (
     ChatAcknowledgement,
@@ -19,46 +28,77 @@ from uagents_core.contrib.protocols.chat import (
 )
 
 agent = Agent()
+register_profiling(agent)
 user_sessions = {}
-
-def extract_skills_from_text(text: str) -> List[str]:
-    """
-    Extract technical skills from resume text using LangChain LLM.
-    Falls back to keyword-based extraction if LLM is unavailable.
-    """
-
-    skill_keywords = [
-        "python", "java", "javascript", "typescript", "react", "node.js", "nodejs", "angular", "vue",
-        "django", "flask", "fastapi", "springboot", "spring", "express", "next.js", "nuxt.js",
-        "aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible",
-        "machine learning", "deep learning", "data science", "ai", "ml",
-        "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy", "matplotlib", "seaborn",
-        "sql", "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
-        "ci/cd", "jenkins", "github actions", "gitlab", "agile", "scrum",
-        "html", "css", "tailwind", "bootstrap", "sass", "git", "rest api", "graphql",
-        "microservices", "linux", "devops", "springboot", "kafka", "rabbitmq",
-        "nginx", "bash", "shell", "powershell", "c++", "c#", "go", "golang", "rust",
-        "php", "ruby", "rails", "frontend", "backend", "fullstack", "cloud", "docker compose"
-    ]
-
-    text_lower = text.lower()
-    found_skills = [skill for skill in skill_keywords if skill in text_lower]
-
-    try:
-        llm = ChatOpenAI(
+# candidate id -> generation of their latest input; results for older inputs are discarded
+request_generations = {}
+# Profiles are sharded across discovery workers by their top skills
+discovery_pool = DiscoveryPool(JOB_DISCOVERY_ADDRESSES)
+# candidate id -> discovery worker running their latest generation, told to cancel it on a resend
+discovery_workers = {}
+# Bounds how many candidate pipelines run at once; the rest are queued or shed
+admission = AdmissionController()
+# Most recently recommended postings remembered per candidate for delta reports
+SEEN_JOBS_LIMIT = int(os.getenv("SEEN_JOBS_LIMIT", "200"))
+# Chat commands for saved-search job alerts
+SUBSCRIBE_COMMANDS = ("subscribe", "alerts on", "subscribe remote")
+UNSUBSCRIBE_COMMANDS = ("unsubscribe", "alerts off", "stop alerts")
+# Admitted pipelines running in the background, kept referenced until they finish
+pipeline_tasks = set()
+
+memory_monitor = MemoryMonitor()
+memory_monitor.gauge("user_sessions", lambda: len(user_sessions))
+memory_monitor.gauge("user_sessions_kb", lambda: deep_sizeof(user_sessions) // 1024)
+memory_monitor.gauge("request_generations", lambda: len(request_generations))
+memory_monitor.gauge("discovery_workers", lambda: len(discovery_workers))
+memory_monitor.gauge("admission_in_flight", lambda: len(admission.in_flight))
+memory_monitor.gauge("admission_waiting", lambda: len(admission.waiting))
+memory_monitor.gauge("admission_last_served", lambda: len(admission.last_served))
+register_memory_monitor(agent, memory_monitor, admission.stats)
+
+
+def _build_skill_extractor():
+    """Import LangChain and build the resume skill extractor (runs in a worker thread)"""
+    from langchain.chat_models import ChatOpenAI
+    from langchain.schema import SystemMessage, HumanMessage
+
+    llm = ChatOpenAI(
         model_name="gpt-4o-mini",
         temperature=0,
         openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+    )
+
+    def extract(text: str) -> str:
         messages = [
             SystemMessage(
                 content="You are an expert resume parser. Extract only technical skills, frameworks, programming languages, or tools mentioned in the text. Return them as a JSON list of lowercase strings."
             ),
             HumanMessage(content=text)
         ]
+        return llm(messages).content.strip()
+
+    return extract
+
+
+# Built lazily; keyword extraction is used until the client has warmed up
+skill_extractor = LazyLLM("Skill extractor LLM", _build_skill_extractor)
+
+def extract_skills_from_text(text: str, found_skills: List[str] = None) -> List[str]:
+    """
+    Extract technical skills from resume text using LangChain LLM.
+    Falls back to keyword-based extraction if LLM is unavailable or still warming up.
+    Keyword matches already found by analyze_resume can be passed in as found_skills.
+    """
 
-        response = llm(messages)
-        content = response.content.strip()
+    if found_skills is None:
+        text_lower = text.lower()
+        found_skills = [skill for skill in SKILL_KEYWORDS if skill in text_lower]
+
+    try:
+        extract = skill_extractor.get_if_ready()
+        if extract is None:
+            raise RuntimeError("LLM client still warming up")
+        content = extract(text)
 
         ai_skills = re.findall(r'"([^"]+)"', content)
         if not ai_skills:
@@ -76,153 +116,154 @@ def extract_skills_from_text(text: str) -> List[str]:
     return sorted(list(set(combined_skills)))
 
 
-def extract_experience_years(text: str) -> int:
-    """Extract years of experience from text"""
-    patterns = [
-        r'(\d+)\+?\s*years?\s*(?:of)?\s*(?:experience)?',
-        r'experience[:\s]+(\d+)\+?\s*years?',
-        r'(\d+)\s*yrs?\.?\s*(?:experience)?',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            return int(match.group(1))
-    return 3  
-
-def is_resume_text(text: str) -> bool:
-    """Detect if text is a resume"""
-    resume_indicators = [
-        'experience', 'education', 'skills', 'work history',
-        'employment', 'university', 'bachelor', 'master',
-        'degree', 'graduated', 'certification', 'project',
-        'responsibilities', 'achievements'
-    ]
-    text_lower = text.lower()
-    matches = sum(1 for indicator in resume_indicators if indicator in text_lower)
-    return matches >= 2 or len(text) > 200
-
-
-
-def extract_work_location(text: str) -> str:
-    """Detect the preferred work location from resume text. Defaults to 'remote'."""
-    text_lower = text.lower()
-
-    patterns = {
-        "remote": [
-            r"\bremote\b",
-            r"work\s*from\s*home",
-            r"telecommute",
-            r"virtually",
-            r"off-site",
-        ],
-        "hybrid": [
-            r"\bhybrid\b",
-            r"partly\s*remote",
-            r"flexible\s*work",
-            r"mix(ed)?\s*(remote|office)",
-        ],
-        "onsite": [
-            r"\bonsite\b",
-            r"on[-\s]*premise",
-            r"office\s*based",
-            r"client\s*location",
-        ],
-    }
-
-    for location, regex_list in patterns.items():
-        for regex in regex_list:
-            if re.search(regex, text_lower):
-                return location
-
-    return "remote"
-
-
-def create_profile_from_input(text: str, sender: str) -> CandidateProfile:
+def create_profile_from_input(text: str, sender: str, analysis: dict = None) -> CandidateProfile:
     """Create candidate profile from any input"""
-    skills = extract_skills_from_text(text)
-    experience_years = extract_experience_years(text)
-    location = extract_work_location(text)
+    if analysis is None:
+        analysis = analyze_resume(text)
+    skills = extract_skills_from_text(text, analysis['skills'])
+    experience_years = analysis['experience_years']
+    location = analysis['work_location']
     
     if not skills:
         return None
     
+    expectation = salary_expectation(text)
     profile = CandidateProfile(
         candidate_id=sender,
         resume_text=text[:3000],
         skills=skills,
         experience_years=experience_years,
         preferences={
-            "remote": "remote" in text.lower() or "wfh" in text.lower(),
-            "salary_min": 80000,
+            "remote": analysis['remote_preference'],
+            # Discovery skips postings known to pay less than this; no floor unless one was stated
+            "salary_min": int(expectation.min) if expectation else None,
+            "salary_currency": expectation.currency if expectation else None,
             "location_preference": "flexible"
         },
         location=location
     )
     return profile
 
-chat_proto = Protocol(spec=chat_protocol_spec)
+def load_seen_jobs(ctx: Context, candidate_id: str, fingerprint: str) -> dict:
+    """Postings already recommended to the candidate, if their profile hasn't changed since"""
+    history = ctx.storage.get(f"history:{candidate_id}")
+    if not history or history.get('fingerprint') != fingerprint:
+        return {}
+    return history.get('jobs', {})
 
-@chat_proto.on_message(ChatMessage)
-async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
-    """Handle incoming chat messages"""
-    ctx.logger.info(f"📨 Message from {sender}")
-    
+
+def remember_jobs(ctx: Context, candidate_id: str, fingerprint: str, job_versions: dict):
+    """Record the postings sent in a report, keeping the newest SEEN_JOBS_LIMIT"""
+    seen = dict(load_seen_jobs(ctx, candidate_id, fingerprint))
+    for job_id, version in job_versions.items():
+        seen.pop(job_id, None)
+        seen[job_id] = version
+    jobs = dict(list(seen.items())[-SEEN_JOBS_LIMIT:])
+    ctx.storage.set(f"history:{candidate_id}", {'fingerprint': fingerprint, 'jobs': jobs})
+
+
+async def send_text(ctx: Context, recipient: str, text: str):
     await ctx.send(
-        sender,
-        ChatAcknowledgement(
-            timestamp=datetime.now(),
-            acknowledged_msg_id=msg.msg_id
-        ),
+        recipient,
+        ChatMessage(
+            timestamp=datetime.utcnow(),
+            msg_id=uuid4(),
+            content=[
+                TextContent(type="text", text=text),
+                EndSessionContent(type="end-session"),
+            ]
+        )
     )
-    
-    text = ''
-    for item in msg.content:
-        if isinstance(item, TextContent):
-            text += item.text
-    
-    text = text.strip()
-    ctx.logger.info(f"📝 Text received ({len(text)} chars): {text[:100]}...")
-    
-    if len(text) < 30:
-        await ctx.send(
-            sender,
-            ChatMessage(
-                timestamp=datetime.utcnow(),
-                msg_id=uuid4(),
-                content=[
-                    TextContent(
-                        type="text",
-                        text="👋 Hi! I help match candidates with jobs.\n\n"
-                             "You can:\n"
-                             "• List your skills (e.g., 'python, react, docker')\n"
-                             "• Paste your full resume\n"
-                             "• Tell me about your experience\n\n"
-                             "What would you like to do?"
-                    ),
-                    EndSessionContent(type="end-session"),
-                ]
-            )
+
+
+async def admit_request(ctx: Context, sender: str, start) -> bool:
+    """
+    Run admission control for a new request. Returns True if the caller
+    should process it now; otherwise the candidate has been told it was
+    queued (and `start()` runs later) or that it was shed.
+    """
+    decision = admission.admit(sender, lambda: start_pipeline(ctx, sender, start()))
+    if decision == REJECT:
+        ctx.logger.warning(f"🚫 Shedding request from {sender} ({admission.report()})")
+        await send_text(
+            ctx, sender,
+            "⏳ We're handling a lot of job searches right now and you were matched recently. "
+            "Please try again in a few minutes."
         )
-        return
-    
+        return False
+    if decision == QUEUE:
+        ctx.logger.info(f"🕒 Queued request from {sender} ({len(admission.waiting)} waiting)")
+        await send_text(
+            ctx, sender,
+            f"⏳ We're busy right now - your request is queued (position {len(admission.waiting)}). "
+            f"We'll start your job search as soon as a slot frees up."
+        )
+        return False
+    return True
+
+
+def start_pipeline(ctx: Context, sender: str, pipeline) -> asyncio.Task:
+    """Run an admitted pipeline in the background so slow steps don't block the agent's message loop"""
+    task = asyncio.create_task(pipeline)
+    pipeline_tasks.add(task)
+    task.add_done_callback(lambda done: _finish_pipeline(ctx, sender, done))
+    return task
+
+
+def _finish_pipeline(ctx: Context, sender: str, task: asyncio.Task):
+    """Free the admission slot of a pipeline that was cancelled or crashed before handing off"""
+    pipeline_tasks.discard(task)
+    if task.cancelled():
+        admission.release(sender)
+    elif task.exception() is not None:
+        ctx.logger.exception(f"❌ Pipeline failed for {sender}", exc_info=task.exception())
+        admission.release(sender)
+
+
+@profiled
+async def process_profile_text(ctx: Context, sender: str, text: str, source: str = "text"):
+    """Build a profile from resume/skills text, send it to discovery and reply to the candidate"""
     try:
         ctx.logger.info(f"🧠 Processing profile for {sender}...")
-        profile = create_profile_from_input(text, sender)
+        analysis = analyze_resume(text)
+        profile = create_profile_from_input(text, sender, analysis)
         
         if profile is None :
+            admission.release(sender)
             await ctx.send(sender,"Please send the correct skillset or a parseable resume")
             return 
         
+        # A new input supersedes anything still in flight for this candidate
+        profile.generation = request_generations.get(sender, 0) + 1
+        request_generations[sender] = profile.generation
+        
+        # Same profile as last time: discovery only needs to look for what's new
+        fingerprint = profile_fingerprint(profile)
+        profile.seen_jobs = load_seen_jobs(ctx, sender, fingerprint)
+        
         user_sessions[sender] = {
             'profile': profile,
+            'fingerprint': fingerprint,
             'timestamp': datetime.now()
         }
         
-        ctx.logger.info(f"✅ Profile created - Skills: {profile.skills}, Experience: {profile.experience_years}y")
+        ctx.logger.info(
+            f"✅ Profile created - Skills: {profile.skills}, Experience: {profile.experience_years}y, "
+            f"generation {profile.generation}"
+        )
+        if profile.seen_jobs:
+            ctx.logger.info(f"🆕 Returning candidate, requesting delta over {len(profile.seen_jobs)} seen jobs")
         
-        await ctx.send(JOB_DISCOVERY_ADDRESS, profile)
+        worker = discovery_pool.route(profile.skills)
+        # Different top skills can shard the resend elsewhere; the old worker cancels its run
+        previous = discovery_workers.get(sender)
+        if previous is not None and previous != worker:
+            await ctx.send(previous, CancelDiscovery(candidate_id=sender, generation=profile.generation))
+        discovery_workers[sender] = worker
+        await ctx.send(worker, profile)
+        ctx.logger.info(f"🧭 Routed to discovery worker {worker[:20]}...")
         
-        if is_resume_text(text):
+        if source == "pdf" or analysis['is_resume']:
             response_text = (
                 f"✅ Resume processed successfully!\n\n"
                 f"📊 Profile Summary:\n"
@@ -239,6 +280,8 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
                 f"💼 Experience: {profile.experience_years} years\n\n"
                 f"🔍 Searching job boards... I'll send you the best matches!"
             )
+        if profile.seen_jobs:
+            response_text += "\n\n🆕 Welcome back! I'll only send postings that are new since your last search."
         
         await ctx.send(
             sender,
@@ -254,6 +297,7 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
         
     except Exception as e:
         ctx.logger.error(f"❌ Error: {e}")
+        admission.release(sender)
         await ctx.send(
             sender,
             ChatMessage(
@@ -269,6 +313,87 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
             )
         )
 
+
+chat_proto = Protocol(spec=chat_protocol_spec)
+
+@chat_proto.on_message(ChatMessage)
+async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
+    """Handle incoming chat messages"""
+    ctx.logger.info(f"📨 Message from {sender}")
+    
+    await ctx.send(
+        sender,
+        ChatAcknowledgement(
+            timestamp=datetime.now(),
+            acknowledged_msg_id=msg.msg_id
+        ),
+    )
+    
+    text = ''
+    for item in msg.content:
+        if isinstance(item, TextContent):
+            text += item.text
+    
+    text = text.strip()
+    ctx.logger.info(f"📝 Text received ({len(text)} chars): {text[:100]}...")
+    
+    command = text.lower().rstrip("!. ")
+    if command in SUBSCRIBE_COMMANDS or command in UNSUBSCRIBE_COMMANDS:
+        await handle_alert_command(ctx, sender, command)
+        return
+    
+    if len(text) < 30:
+        await ctx.send(
+            sender,
+            ChatMessage(
+                timestamp=datetime.utcnow(),
+                msg_id=uuid4(),
+                content=[
+                    TextContent(
+                        type="text",
+                        text="👋 Hi! I help match candidates with jobs.\n\n"
+                             "You can:\n"
+                             "• List your skills (e.g., 'python, react, docker')\n"
+                             "• Paste your full resume\n"
+                             "• Tell me about your experience\n"
+                             "• Reply 'subscribe' after a search to get alerts for new matching jobs\n\n"
+                             "What would you like to do?"
+                    ),
+                    EndSessionContent(type="end-session"),
+                ]
+            )
+        )
+        return
+    
+    if await admit_request(ctx, sender, lambda: process_profile_text(ctx, sender, text)):
+        await process_profile_text(ctx, sender, text)
+
+
+async def handle_alert_command(ctx: Context, sender: str, command: str):
+    """Save or cancel the candidate's search on every discovery worker"""
+    session = user_sessions.get(sender)
+    if command in SUBSCRIBE_COMMANDS and session is None:
+        await send_text(ctx, sender, "🔔 Send me your skills or resume first, then reply 'subscribe' to get job alerts.")
+        return
+    
+    if command in SUBSCRIBE_COMMANDS:
+        profile = session['profile']
+        search = SavedSearch(candidate_id=sender, skills=profile.skills, remote_only=command.endswith("remote"))
+        reply = (
+            f"🔔 Job alerts on! I'll message you when new {'remote ' if search.remote_only else ''}postings "
+            f"match {', '.join(profile.skills[:5])}. Reply 'unsubscribe' to stop."
+        )
+    else:
+        search = SavedSearch(candidate_id=sender, skills=[], active=False)
+        reply = "🔕 Job alerts off. Reply 'subscribe' any time to turn them back on."
+    
+    # Every worker ingests postings, so each one holds the saved searches
+    for address in discovery_pool.addresses:
+        await ctx.send(address, search)
+    ctx.logger.info(f"🔔 Saved search {'updated' if search.active else 'removed'} for {sender}")
+    await send_text(ctx, sender, reply)
+
+
 @chat_proto.on_message(ChatAcknowledgement)
 async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
     """Handle acknowledgements"""
@@ -278,10 +403,24 @@ async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
 agent.include(chat_proto, publish_manifest=True)
 
 
+def is_superseded(candidate_id: str, generation: int) -> bool:
+    """True when the candidate has sent newer input than the one this result is for"""
+    return generation < request_generations.get(candidate_id, 0)
+
+
 @agent.on_message(model=RecommendationReport)
 async def handle_recommendation(ctx: Context, sender: str, msg: RecommendationReport):
     """Receive and forward job recommendations"""
     ctx.logger.info(f"📬 Recommendations for {msg.candidate_id}")
+    if is_superseded(msg.candidate_id, msg.generation):
+        ctx.logger.info(f"🗑️ Discarding recommendations for an older input (generation {msg.generation})")
+        return
+    admission.complete(msg.candidate_id)
+    discovery_workers.pop(msg.candidate_id, None)
+    
+    session = user_sessions.get(msg.candidate_id)
+    if msg.job_versions and session is not None:
+        remember_jobs(ctx, msg.candidate_id, session['fingerprint'], msg.job_versions)
     
     try:
         await ctx.send(
@@ -302,10 +441,44 @@ async def handle_recommendation(ctx: Context, sender: str, msg: RecommendationRe
     except Exception as e:
         ctx.logger.error(f"Error sending recommendations: {e}")
 
+@agent.on_message(model=JobAlert)
+async def handle_job_alert(ctx: Context, sender: str, msg: JobAlert):
+    """Forward postings matching a saved search, skipping ones the candidate has already seen"""
+    history = ctx.storage.get(f"history:{msg.candidate_id}") or {}
+    seen = history.get('jobs', {})
+    jobs = [job for job in msg.jobs if seen.get(job.get('job_id')) != job_version(job)]
+    if not jobs:
+        return
+    # Only extend an existing history: storing it under an empty fingerprint
+    # would make the next search look like a changed profile and drop the deltas
+    if history.get('fingerprint'):
+        remember_jobs(
+            ctx, msg.candidate_id, history['fingerprint'],
+            {job['job_id']: job_version(job) for job in jobs}
+        )
+    
+    lines = [f"🔔 {len(jobs)} new posting(s) match your saved search:", ""]
+    for job in jobs:
+        lines.append(
+            f"• {job.get('title', 'N/A')} at {job.get('company', 'N/A')} - {job.get('location', 'N/A')}"
+            f"{' (Remote)' if job.get('remote') else ''} | {job.get('salary', 'Not specified')} | {job.get('url', '#')}"
+        )
+    lines.extend(["", "Reply 'unsubscribe' to stop alerts."])
+    try:
+        await send_text(ctx, msg.candidate_id, "\n".join(lines))
+        ctx.logger.info(f"🔔 Sent {len(jobs)} job alert(s) to {msg.candidate_id}")
+    except Exception as e:
+        ctx.logger.error(f"Error sending job alert: {e}")
+
+
 @agent.on_message(model=ErrorReport)
 async def handle_errors(ctx:Context, sender : str, msg:ErrorReport):
     """ Handle errors if the skills donot match any job listing """
     ctx.logger.info(f"Some error occurred in the job discovery phase")
+    if is_superseded(msg.candidate_id, msg.generation):
+        return
+    admission.complete(msg.candidate_id)
+    discovery_workers.pop(msg.candidate_id, None)
     try:
         await ctx.send(
             msg.candidate_id,
@@ -326,15 +499,92 @@ async def handle_errors(ctx:Context, sender : str, msg:ErrorReport):
     
 
 
+@agent.on_message(model=PDFResume)
+async def handle_pdf_resume(ctx: Context, sender: str, msg: PDFResume):
+    """Extract text from an uploaded PDF resume and process it like a pasted one"""
+    ctx.logger.info(f"📄 PDF resume from {sender} ({len(msg.content)} base64 chars)")
+    if await admit_request(ctx, sender, lambda: process_pdf_resume(ctx, sender, msg.content)):
+        # Extraction can take up to PDF_EXTRACT_TIMEOUT; don't hold up other sessions meanwhile
+        start_pipeline(ctx, sender, process_pdf_resume(ctx, sender, msg.content))
+
+
+@profiled
+async def process_pdf_resume(ctx: Context, sender: str, content: str):
+    text = ""
+    reason = "No text found - the PDF may be a scanned image"
+    try:
+        data = decode_pdf(content)
+        text = await extract_pdf_text(data)
+    except PDFExtractionError as e:
+        ctx.logger.warning(f"⚠️ PDF rejected for {sender}: {e}")
+        reason = str(e)
+    except Exception as e:
+        ctx.logger.error(f"❌ PDF extraction failed for {sender}: {e}")
+        reason = "the PDF reader failed"
+    finally:
+        # Nothing goes downstream without text, so free the slot (also when cancelled)
+        if len(text) < 30:
+            admission.release(sender)
+
+    if len(text) < 30:
+        await send_text(
+            ctx, sender,
+            f"❌ Couldn't read your PDF resume: {reason}.\n\n"
+            f"Please paste your resume text or list your skills instead."
+        )
+        return
+
+    ctx.logger.info(f"📝 Extracted {len(text)} chars from PDF")
+    await process_profile_text(ctx, sender, text, source="pdf")
+
+
+@agent.on_message(model=DiscoveryHeartbeat)
+async def handle_discovery_heartbeat(ctx: Context, sender: str, msg: DiscoveryHeartbeat):
+    """Keep a live discovery worker on the routing ring"""
+    if discovery_pool.heartbeat(sender):
+        ctx.logger.info(f"💚 Discovery worker {sender[:20]}... is back ({len(discovery_pool.healthy)} healthy)")
+
+
+@agent.on_interval(period=HEARTBEAT_INTERVAL)
+async def check_discovery_workers(ctx: Context):
+    """Stop routing to discovery workers that have gone quiet and report admission stats"""
+    for address in discovery_pool.prune():
+        ctx.logger.warning(
+            f"💔 Discovery worker {address[:20]}... missed heartbeats, rebalancing "
+            f"({len(discovery_pool.healthy)} healthy)"
+        )
+    admission.set_downstream_health(bool(discovery_pool.healthy))
+    if admission.in_flight or admission.waiting:
+        ctx.logger.info(f"📊 Admission: {admission.report()}")
+
+
 @agent.on_event("startup")
 async def startup(ctx: Context):
     """Startup event"""
     ctx.logger.info("="*70)
     ctx.logger.info("🚀 CANDIDATE PROFILE AGENT (JOB MATCHER)")
     ctx.logger.info(f"📍 Address: {ctx.agent.address}")
-    ctx.logger.info(f"🔗 Job Discovery: {JOB_DISCOVERY_ADDRESS}")
+    ctx.logger.info(f"🔗 Job Discovery workers: {len(discovery_pool.addresses)}")
+    ctx.logger.info(f"🚦 Admission: {admission.max_in_flight} in flight, {admission.max_waiting} waiting")
+    ctx.logger.info(f"🔬 Profiling: {profiler.report()}")
     ctx.logger.info(f"💬 Chat Protocol: Enabled")
+    ctx.logger.info(f"⏱️ Ready to accept messages {seconds_since_import():.2f}s after import")
     ctx.logger.info("="*70)
+    asyncio.create_task(warm_up_llm(ctx))
+
+
+@agent.on_event("shutdown")
+async def shutdown(ctx: Context):
+    shutdown_pool()
+
+
+async def warm_up_llm(ctx: Context):
+    """Load the LLM stack in the background; keyword extraction serves requests meanwhile"""
+    await skill_extractor.warmup()
+    if skill_extractor.ready:
+        ctx.logger.info(f"✅ {skill_extractor.report()}")
+    else:
+        ctx.logger.warning(f"⚠️ {skill_extractor.report()} - using keyword extraction only")
 
 if __name__ == "__main__":
     agent.run()
\ No newline at end of file
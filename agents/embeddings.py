@@ -0,0 +1,144 @@
+"""
+Offline-capable embeddings and nearest-neighbor search for job matching.
+The default HashingEmbedder needs no model download: it hashes canonical
+skill tokens and bigrams (with aliases like "k8s" -> "kubernetes" and
+skill-graph neighbors at reduced weight) into a fixed-size vector. Any
+object with `dim` and `embed_batch(texts)` can be plugged in instead via
+JOBMATE_EMBEDDER="package.module:ClassName".
+
+Vectors are L2-normalized float32, so inner product is cosine similarity.
+FAISS is used for search when installed, otherwise a numpy brute-force
+index with the same interface.
+"""
+
+import importlib
+import math
+import os
+import zlib
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from job_text import NormalizedText, TOKEN_RE, strip_html
+from skill_graph import SKILL_ALIASES, canonical_skill, skill_graph
+
+try:
+    import faiss
+except ImportError:  # faiss-cpu is optional; fall back to numpy search
+    faiss = None
+
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "256"))
+RELATED_SKILL_WEIGHT = 0.5
+# Words that aren't known skills still count, but much less, so long descriptions don't drown the skills
+OTHER_TOKEN_WEIGHT = 0.1
+# Minimum cosine similarity for a job that names none of the skills literally
+SEMANTIC_MATCH_THRESHOLD = float(os.getenv("SEMANTIC_MATCH_THRESHOLD", "0.3"))
+
+# Multi-word aliases are matched on bigrams
+_PHRASE_ALIASES = {alias: skill for alias, skill in SKILL_ALIASES.items() if " " in alias}
+KNOWN_SKILLS = frozenset(skill_graph.node_ids) | frozenset(SKILL_ALIASES.values())
+
+
+def _bucket(feature: str, dim: int) -> Tuple[int, float]:
+    """Stable hash of a feature to (bucket, sign)"""
+    digest = zlib.crc32(feature.encode("utf-8"))
+    return digest % dim, (1.0 if digest & 0x80000000 else -1.0)
+
+
+class HashingEmbedder:
+    """Feature-hashing embedder over canonical skill tokens and bigrams"""
+
+    def __init__(self, dim: int = EMBEDDING_DIM, use_skill_graph: bool = True):
+        self.dim = dim
+        self.use_skill_graph = use_skill_graph
+        self._feature_cache = {}
+
+    def _features(self, text: str) -> dict:
+        tokens = [token.rstrip("./-") for token in TOKEN_RE.findall(text)]
+        counts = {}
+        for i, token in enumerate(tokens):
+            if len(token) < 2:
+                continue
+            canonical = canonical_skill(token)
+            counts[canonical] = counts.get(canonical, 0) + 1
+            if i + 1 < len(tokens):
+                bigram = f"{token} {tokens[i + 1]}"
+                bigram = _PHRASE_ALIASES.get(bigram, bigram)
+                counts[bigram] = counts.get(bigram, 0) + 1
+
+        weights = {
+            feature: (1.0 + math.log(count)) * (1.0 if feature in KNOWN_SKILLS else OTHER_TOKEN_WEIGHT)
+            for feature, count in counts.items()
+        }
+        if self.use_skill_graph:
+            for feature, weight in list(weights.items()):
+                if feature not in KNOWN_SKILLS:
+                    continue
+                for related, credit in skill_graph.related(feature).items():
+                    if credit >= RELATED_SKILL_WEIGHT:
+                        boost = weight * credit * RELATED_SKILL_WEIGHT
+                        if boost > weights.get(related, 0.0):
+                            weights[related] = boost
+        return weights
+
+    def _bucket(self, feature: str) -> Tuple[int, float]:
+        cached = self._feature_cache.get(feature)
+        if cached is None:
+            cached = _bucket(feature, self.dim)
+            if len(self._feature_cache) < 200000:
+                self._feature_cache[feature] = cached
+        return cached
+
+    def embed_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed lowercase plain texts into an (n, dim) float32 matrix"""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vector = matrix[row]
+            for feature, weight in self._features(text).items():
+                bucket, sign = self._bucket(feature)
+                vector[bucket] += sign * weight
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return matrix
+
+
+def _load_embedder():
+    spec = os.getenv("JOBMATE_EMBEDDER")
+    if not spec:
+        return HashingEmbedder()
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+embedder = _load_embedder()
+
+
+def _as_text(text) -> str:
+    if isinstance(text, NormalizedText):
+        return text.text
+    return strip_html(text).lower()
+
+
+def embed_texts(texts: Iterable) -> np.ndarray:
+    """Embed raw strings or NormalizedText objects in one batch"""
+    return embedder.embed_batch([_as_text(text) for text in texts])
+
+
+def embed_text(text) -> np.ndarray:
+    return embed_texts([text])[0]
+
+
+def embed_profile(skills: List[str]) -> np.ndarray:
+    """Profile vector: skills are embedded separately so they don't form spurious bigrams"""
+    if not skills:
+        return np.zeros(embedder.dim, dtype=np.float32)
+    vector = embed_texts(skills).sum(axis=0)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def similarity(job_vector: np.ndarray, profile_vector: Optional[np.ndarray]) -> float:
+    if profile_vector is None:
+        return 0.0
+    return float(job_vector @ profile_vector)
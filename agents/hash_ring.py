@@ -0,0 +1,117 @@
+"""
+Consistent-hash routing of candidate profiles across Job Discovery workers.
+Profiles are keyed by their normalized top skills, so the same search
+always lands on the same worker and reuses its description cache, rate
+limiter response cache and job index. A resend whose top skills changed
+may route elsewhere; the Candidate agent then tells the worker that ran the
+previous generation to cancel it. Workers announce themselves with
+DiscoveryHeartbeat messages; one that misses too many heartbeats is taken
+off the ring and only its share of the keys moves to the others.
+"""
+
+import bisect
+import hashlib
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+from job_text import normalize_skills
+from skill_graph import canonical_skill
+
+VIRTUAL_NODES = int(os.getenv("HASH_RING_VIRTUAL_NODES", "100"))
+HEARTBEAT_INTERVAL = float(os.getenv("DISCOVERY_HEARTBEAT_INTERVAL", "15"))
+MAX_MISSED_HEARTBEATS = int(os.getenv("DISCOVERY_MAX_MISSED_HEARTBEATS", "3"))
+# The upstream searches are built from the first two skills, so they decide the shard
+SHARD_SKILLS = 2
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+
+def shard_key(skills: Iterable[str]) -> str:
+    """Routing key for a profile: its top skills, lowercased and de-aliased"""
+    top = [canonical_skill(skill) for skill in normalize_skills(skills)[:SHARD_SKILLS]]
+    return "|".join(top)
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes"""
+
+    def __init__(self, nodes: Iterable[str] = (), virtual_nodes: int = VIRTUAL_NODES):
+        self.virtual_nodes = virtual_nodes
+        self._points: List[int] = []
+        self._owners: Dict[int, str] = {}
+        self.nodes = set()
+        for node in nodes:
+            self.add(node)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add(self, node: str):
+        if node in self.nodes:
+            return
+        self.nodes.add(node)
+        for i in range(self.virtual_nodes):
+            point = _hash(f"{node}#{i}")
+            self._owners[point] = node
+            bisect.insort(self._points, point)
+
+    def remove(self, node: str):
+        if node not in self.nodes:
+            return
+        self.nodes.discard(node)
+        self._points = [point for point in self._points if self._owners[point] != node]
+        self._owners = {point: self._owners[point] for point in self._points}
+
+    def get(self, key: str) -> Optional[str]:
+        """Node owning `key`: the first virtual node clockwise from its hash"""
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[self._points[index]]
+
+
+class DiscoveryPool:
+    """Configured discovery workers, with unhealthy ones taken off the ring"""
+
+    def __init__(self, addresses: List[str]):
+        self.addresses = list(dict.fromkeys(addresses))
+        self.ring = HashRing(self.addresses)
+        # Workers get one full grace period after startup before a missing heartbeat counts
+        started = time.monotonic()
+        self.last_seen: Dict[str, float] = {address: started for address in self.addresses}
+
+    def heartbeat(self, address: str) -> bool:
+        """Record a heartbeat; returns True if the worker was off the ring and is back"""
+        if address not in self.last_seen:
+            return False
+        self.last_seen[address] = time.monotonic()
+        if address not in self.ring.nodes:
+            self.ring.add(address)
+            return True
+        return False
+
+    def prune(self) -> List[str]:
+        """Take workers that missed too many heartbeats off the ring; returns those removed"""
+        # A single worker is always routed to; there is nowhere else to send profiles
+        if len(self.addresses) == 1:
+            return []
+        deadline = time.monotonic() - HEARTBEAT_INTERVAL * MAX_MISSED_HEARTBEATS
+        removed = [
+            address for address in list(self.ring.nodes)
+            if self.last_seen[address] < deadline
+        ]
+        for address in removed:
+            self.ring.remove(address)
+        return removed
+
+    def route(self, skills: Iterable[str]) -> str:
+        """Discovery worker for a profile; falls back to all configured workers if none are healthy"""
+        key = shard_key(skills)
+        return self.ring.get(key) or HashRing(self.addresses).get(key)
+
+    @property
+    def healthy(self) -> List[str]:
+        return sorted(self.ring.nodes)
@@ -2,28 +2,99 @@ from uagents import Agent, Context
 import os
 import aiohttp
 import asyncio
+import json
+import time
 from typing import List, Dict
 from urllib.parse import quote_plus
 from datetime import datetime, timedelta
-from models import CandidateProfile, JobListingBatch, ErrorReport
+from models import (
+    BatchEncodings, CancelDiscovery, CandidateProfile, DiscoveryHeartbeat, ErrorReport, JobAlert, JobListingBatch, SavedSearch,
+    job_version, profile_fingerprint
+)
+from batch_codec import ENCODING_JSON, encode_jobs
+from job_text import DESCRIPTION_LIMIT, NormalizedText, clean_description, description_cache, job_match_text, normalize_job_text, normalize_skills
+from skill_graph import skill_graph
+from embeddings import SEMANTIC_MATCH_THRESHOLD, embed_profile, embed_text
+from job_index import PersistentJobIndex
+from hash_ring import HEARTBEAT_INTERVAL
+from rate_limiter import RATE_LIMIT_DB, RATE_LIMIT_MAX_WAIT, rate_limiter
+from saved_search import SAVED_SEARCH_PATH, SavedSearchIndex
+from salary import DEFAULT_CURRENCY, SalaryRange, SalaryRangeIndex, meets_salary_floor, salary_fields
+from profiling import profiled, profiler, register_profiling
+from memory_monitor import MemoryMonitor, register_memory_monitor
 
 # Agentverse Agent id 
 RECOMMENDATION_ADDRESS = "agent1q2g24508ufjrlcusjxk7cmg53f7udtu4a49a5e76zfj77x207sj5us5xwt6"
 CANDIDATE_AGENT_ADDRESS = "agent1q08kycnalue0xwhgl888cwlaxlfaqmyyfmzrlvqqpd38c9xh57hlgk893l8"
 
+# Persisted job-vector index, opened on startup
+JOB_INDEX_PATH = os.getenv("JOB_INDEX_PATH", "data/job_index")
+INDEX_SNAPSHOT_INTERVAL = float(os.getenv("INDEX_SNAPSHOT_INTERVAL", "300"))
+job_index = None
+# Saved searches percolated against every fresh posting, opened on startup
+saved_searches = SavedSearchIndex()
+# Indexed postings sorted by annual salary, so salary floors skip them before scoring
+salary_index = SalaryRangeIndex()
+
+# candidate id -> (generation, task) of the discovery run in flight
+in_flight = {}
+
+# Job-board API base URLs. JOB_BOARD_BASE_URL points all four at one host,
+# e.g. the local mock server in tools/mock_job_board.py for offline load tests
+_JOB_BOARD_BASE_URL = os.getenv("JOB_BOARD_BASE_URL", "").rstrip("/")
+ADZUNA_BASE_URL = os.getenv("ADZUNA_BASE_URL", _JOB_BOARD_BASE_URL or "https://api.adzuna.com")
+FINDWORK_BASE_URL = os.getenv("FINDWORK_BASE_URL", _JOB_BOARD_BASE_URL or "https://findwork.dev")
+SERPAPI_BASE_URL = os.getenv("SERPAPI_BASE_URL", _JOB_BOARD_BASE_URL or "https://serpapi.com")
+REMOTIVE_BASE_URL = os.getenv("REMOTIVE_BASE_URL", _JOB_BOARD_BASE_URL or "https://remotive.com")
+
+# Wire encoding for job batches ("json" or "zlib-columnar"), see batch_codec
+JOB_BATCH_ENCODING = os.getenv("JOB_BATCH_ENCODING", ENCODING_JSON)
+# recipient address -> encodings it has said it can decode (BatchEncodings)
+recipient_encodings = {}
+# Recommender queue priority: first-time searches have nothing yet, returning
+# candidates already hold a report and only wait for what's new
+BATCH_PRIORITY_FULL = 1
+BATCH_PRIORITY_DELTA = 0
+
 
 agent = Agent()
+register_profiling(agent)
+
+memory_monitor = MemoryMonitor()
+memory_monitor.gauge("in_flight", lambda: len(in_flight))
+memory_monitor.gauge("job_index", lambda: len(job_index) if job_index is not None else 0)
+memory_monitor.gauge("saved_searches", lambda: len(saved_searches))
+memory_monitor.gauge("percolated_jobs", lambda: len(saved_searches.percolated))
+memory_monitor.gauge("response_cache", rate_limiter.cache_size)
+memory_monitor.gauge("response_cache_kb", lambda: rate_limiter.cache_bytes() // 1024)
+memory_monitor.gauge("description_cache", lambda: len(description_cache))
+memory_monitor.gauge("salary_index", lambda: len(salary_index))
+register_memory_monitor(
+    agent, memory_monitor,
+    lambda: {source: dict(counts) for source, counts in rate_limiter.stats.items()}
+)
 
 class JobBoardAggregator:
     """Aggregates jobs from multiple sources with intelligent filtering"""
     
-    def __init__(self):
+    def __init__(self, job_index: PersistentJobIndex = None):
+        self.job_index = job_index
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         self.max_jobs_per_source = 5
         self.max_jobs_total = 15
         self.days_filter = 14 
+        # Postings fetched upstream by the last aggregate_jobs call, for saved-search alerts
+        self.fresh_jobs = []
+        # Candidate's stated minimum annual salary; postings known to pay less are skipped unscored
+        self.salary_floor = None
+        self.salary_currency = DEFAULT_CURRENCY
+        self.salary_filtered = 0
+        # skill -> {related skill: partial credit}, filled per request from the skill graph
+        self.skill_expansions = {}
+        # Embedded skill profile for semantic matching, set per request
+        self.profile_vector = None
     
     def _is_recent_job(self, date_str: str) -> bool:
         """Check if job was posted in last 14 days"""
@@ -42,28 +113,89 @@ class JobBoardAggregator:
         except:
             return True
     
-    def _quick_skill_match(self, job_text: str, skills: List[str]) -> bool:
-        """Check if ANY skill matches"""
-        job_text_lower = job_text.lower()
-        
+    def _quick_skill_match(self, job_text: NormalizedText, skills: List[str]) -> bool:
+        """Check if ANY skill (or a skill closely related to a top skill) matches"""
         for skill in skills[:5]:
-            if skill.lower() in job_text_lower:
+            if job_text.contains(skill):
                 return True
+        for skill in skills[:3]:
+            for related in self.skill_expansions.get(skill, ()):
+                if job_text.has_term(related):
+                    return True
         return False
     
-    def _calculate_match_score(self, job_text: str, skills: List[str]) -> float:
-        """Calculate match score based on skill overlap"""
-        job_text_lower = job_text.lower()
+    def _related_credit(self, job_text: NormalizedText, skill: str) -> float:
+        """Best partial credit from skills related to `skill` found in the job"""
+        best = 0.0
+        for related, credit in self.skill_expansions.get(skill, {}).items():
+            if credit > best and job_text.has_term(related):
+                best = credit
+        return best
+    
+    def _calculate_match_score(self, job_text: NormalizedText, skills: List[str]) -> float:
+        """Calculate match score based on skill overlap (skills are already lowercased)"""
         matches = 0
-        total_skills = len(skills[:5])
         
         for i, skill in enumerate(skills[:5]):
-            if skill.lower() in job_text_lower:
-                weight = 0.25 if i < 3 else 0.15
+            weight = 0.25 if i < 3 else 0.15
+            if job_text.contains(skill):
                 matches += weight
+            else:
+                matches += weight * self._related_credit(job_text, skill)
         
         return min(matches, 1.0)
     
+    def _score_job(self, job_text: NormalizedText, skills: List[str], similarity: float = None) -> float:
+        """
+        Literal/related skill score, or a semantic score for jobs that name
+        none of the skills but are close to the profile in embedding space
+        """
+        if self._quick_skill_match(job_text, skills):
+            return self._calculate_match_score(job_text, skills)
+        if self.profile_vector is not None:
+            if similarity is None:
+                similarity = float(embed_text(job_text) @ self.profile_vector)
+            if similarity >= SEMANTIC_MATCH_THRESHOLD:
+                return round(min(similarity, 1.0) * 0.5, 3)
+        return 0.0
+    
+    def _salary(self, salary) -> Dict:
+        """Numeric salary fields, or None when the posting pays below the floor"""
+        fields = salary_fields(salary)
+        if not meets_salary_floor(fields, self.salary_floor, self.salary_currency):
+            self.salary_filtered += 1
+            return None
+        return fields
+    
+    def _job_id(self, source: str, upstream_id, url: str) -> str:
+        """Stable job id used for caching cleaned descriptions"""
+        return f"{source}_{upstream_id or url}"
+    
+    async def _get_json(self, source: str, session: aiohttp.ClientSession, url: str, **kwargs):
+        """
+        GET a job-board API through the shared rate limiter. A query repeated
+        within RESPONSE_FRESH_TTL is answered from the response cache without a
+        request; throttled or 429'd requests get the last good response instead.
+        """
+        query = json.dumps(kwargs.get('params') or {}, sort_keys=True)
+        data = rate_limiter.fresh(source, query)
+        if data is not None:
+            return data
+        if not await rate_limiter.acquire(source):
+            return rate_limiter.cached(source, query)
+        
+        async with session.get(url, **kwargs) as response:
+            if response.status == 200:
+                body = await response.read()
+                data = json.loads(body)
+                rate_limiter.store(source, query, data, len(body))
+                return data
+            if response.status == 429:
+                await rate_limiter.record_429(source, response.headers.get('Retry-After'))
+                return rate_limiter.cached(source, query)
+            print(f"{source} API error: {response.status}")
+            return None
+    
     async def fetch_adzuna_jobs(self, skills: List[str]) -> List[Dict]:
         """Fetch from Adzuna API"""
         jobs = []
@@ -78,7 +210,7 @@ class JobBoardAggregator:
         try:
             async with aiohttp.ClientSession() as session:
                 skill_query = quote_plus(skills[0] if skills else "software developer")
-                url = f"https://api.adzuna.com/v1/api/jobs/us/search/1"
+                url = f"{ADZUNA_BASE_URL}/v1/api/jobs/us/search/1"
                 
                 params = {
                     'app_id': app_id,
@@ -89,40 +221,42 @@ class JobBoardAggregator:
                     'sort_by': 'date'
                 }
                 
-                async with session.get(url, params=params, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
+                data = await self._get_json('Adzuna', session, url, params=params, timeout=10)
+                if data is not None:
+                    for job in data.get('results', []):
+                        salary_min = job.get('salary_min', 0)
+                        salary_max = job.get('salary_max', 0) or salary_min
+                        salary = f"${salary_min:,.0f}-${salary_max:,.0f}" if salary_min else "Not specified"
+                        pay = self._salary(SalaryRange(salary_min, salary_max, 'USD', 'year') if salary_min else None)
+                        if pay is None:
+                            continue
                         
-                        for job in data.get('results', []):
-                            job_text = f"{job.get('title', '')} {job.get('description', '')}"
-                            
-                            if not self._quick_skill_match(job_text, skills):
-                                continue
-                            
-                            score = self._calculate_match_score(job_text, skills)
-                            
-                            if score >= 0.15:
-                                salary_min = job.get('salary_min', 0)
-                                salary_max = job.get('salary_max', 0)
-                                salary = f"${salary_min:,.0f}-${salary_max:,.0f}" if salary_min else "Not specified"
-                                
-                                jobs.append({
-                                    'title': job.get('title', 'N/A'),
-                                    'company': job.get('company', {}).get('display_name', 'N/A'),
-                                    'location': job.get('location', {}).get('display_name', 'Remote'),
-                                    'description': job.get('description', 'N/A')[:500],
-                                    'url': job.get('redirect_url', 'N/A'),
-                                    'salary': salary,
-                                    'remote': 'remote' in job_text.lower(),
-                                    'source': 'Adzuna',
-                                    'match_score': score,
-                                    'requirements': []
-                                })
+                        job_text = normalize_job_text(job.get('title', ''), job.get('description', ''))
+                        
+                        score = self._score_job(job_text, skills)
+                        
+                        if score >= 0.15:
+                            job_id = self._job_id('Adzuna', job.get('id'), job.get('redirect_url'))
                             
-                            if len(jobs) >= self.max_jobs_per_source:
-                                break
-                    else:
-                        print(f"Adzuna API error: {response.status}")
+                            jobs.append({
+                                'job_id': job_id,
+                                'title': job.get('title', 'N/A'),
+                                'company': job.get('company', {}).get('display_name', 'N/A'),
+                                'location': job.get('location', {}).get('display_name', 'Remote'),
+                                'description': clean_description(job.get('description', ''), job_id) or 'N/A',
+                                'match_text': job_text.text[:DESCRIPTION_LIMIT],
+                                'url': job.get('redirect_url', 'N/A'),
+                                'salary': salary,
+                                **pay,
+                                'remote': job_text.contains('remote'),
+                                'source': 'Adzuna',
+                                'posted_at': job.get('created'),
+                                'match_score': score,
+                                'requirements': []
+                            })
+                        
+                        if len(jobs) >= self.max_jobs_per_source:
+                            break
         except Exception as e:
             print(f"Adzuna fetch error: {e}")
         
@@ -140,7 +274,7 @@ class JobBoardAggregator:
         
         try:
             async with aiohttp.ClientSession() as session:
-                url = "https://findwork.dev/api/jobs/"
+                url = f"{FINDWORK_BASE_URL}/api/jobs/"
                 
                 headers = {
                     'Authorization': f'Token {api_key}',
@@ -152,40 +286,40 @@ class JobBoardAggregator:
                     'sort_by': 'date'
                 }
                 
-                async with session.get(url, headers=headers, params=params, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        results = data.get('results', [])
+                data = await self._get_json('FindWork', session, url, headers=headers, params=params, timeout=10)
+                if data is not None:
+                    results = data.get('results', [])
+                    
+                    for job in results:
+                        if not self._is_recent_job(job.get('date_posted')):
+                            continue
                         
-                        for job in results:
-                            if not self._is_recent_job(job.get('date_posted')):
-                                continue
-                            
-                            job_text = f"{job.get('role', '')} {job.get('text', '')} {job.get('keywords', '')}"
-                            
-                            if not self._quick_skill_match(job_text, skills):
-                                continue
-                            
-                            score = self._calculate_match_score(job_text, skills)
-                            
-                            if score >= 0.15:
-                                jobs.append({
-                                    'title': job.get('role', 'N/A'),
-                                    'company': job.get('company_name', 'N/A'),
-                                    'location': job.get('location', 'Remote'),
-                                    'description': job.get('text', 'N/A')[:500],
-                                    'url': job.get('url', 'N/A'),
-                                    'salary': 'Not specified',
-                                    'remote': job.get('remote', False),
-                                    'source': 'FindWork',
-                                    'match_score': score,
-                                    'requirements': job.get('keywords', '').split(',')[:5] if job.get('keywords') else []
-                                })
+                        job_text = normalize_job_text(job.get('role', ''), job.get('text', ''), job.get('keywords', ''))
+                        
+                        score = self._score_job(job_text, skills)
+                        
+                        if score >= 0.15:
+                            job_id = self._job_id('FindWork', job.get('id'), job.get('url'))
                             
-                            if len(jobs) >= self.max_jobs_per_source:
-                                break
-                    else:
-                        print(f"FindWork API error: {response.status}")
+                            jobs.append({
+                                'job_id': job_id,
+                                'title': job.get('role', 'N/A'),
+                                'company': job.get('company_name', 'N/A'),
+                                'location': job.get('location', 'Remote'),
+                                'description': clean_description(job.get('text', ''), job_id) or 'N/A',
+                                'match_text': job_text.text[:DESCRIPTION_LIMIT],
+                                'url': job.get('url', 'N/A'),
+                                'salary': 'Not specified',
+                                **salary_fields(None),
+                                'remote': job.get('remote', False),
+                                'source': 'FindWork',
+                                'posted_at': job.get('date_posted'),
+                                'match_score': score,
+                                'requirements': job.get('keywords', '').split(',')[:5] if job.get('keywords') else []
+                            })
+                        
+                        if len(jobs) >= self.max_jobs_per_source:
+                            break
         except Exception as e:
             print(f"FindWork fetch error: {e}")
         
@@ -203,7 +337,7 @@ class JobBoardAggregator:
         
         try:
             async with aiohttp.ClientSession() as session:
-                url = "https://serpapi.com/search"
+                url = f"{SERPAPI_BASE_URL}/search"
                 
                 search_query = " OR ".join(skills[:2]) + " jobs"
                 
@@ -215,41 +349,39 @@ class JobBoardAggregator:
                     'num': 10
                 }
                 
-                async with session.get(url, params=params, timeout=15) as response:
-                    if response.status == 200:
-                        data = await response.json()
+                data = await self._get_json('Google Jobs', session, url, params=params, timeout=15)
+                if data is not None:
+                    for job in data.get('jobs_results', []):
+                        salary = job.get('detected_extensions', {}).get('salary') or "Not specified"
+                        pay = self._salary(salary)
+                        if pay is None:
+                            continue
                         
-                        for job in data.get('jobs_results', []):
-                            job_text = f"{job.get('title', '')} {job.get('description', '')}"
-                            
-                            if not self._quick_skill_match(job_text, skills):
-                                continue
-                            
-                            score = self._calculate_match_score(job_text, skills)
-                            
-                            if score >= 0.15:
-                                salary = "Not specified"
-                                extensions = job.get('detected_extensions', {})
-                                if extensions.get('salary'):
-                                    salary = extensions['salary']
-                                
-                                jobs.append({
-                                    'title': job.get('title', 'N/A'),
-                                    'company': job.get('company_name', 'N/A'),
-                                    'location': job.get('location', 'Remote'),
-                                    'description': job.get('description', 'N/A')[:500],
-                                    'url': job.get('share_link', job.get('apply_link', 'N/A')),
-                                    'salary': salary,
-                                    'remote': 'remote' in job_text.lower(),
-                                    'source': 'Google Jobs',
-                                    'match_score': score,
-                                    'requirements': []
-                                })
+                        job_text = normalize_job_text(job.get('title', ''), job.get('description', ''))
+                        
+                        score = self._score_job(job_text, skills)
+                        
+                        if score >= 0.15:
+                            job_id = self._job_id('GoogleJobs', job.get('job_id'), job.get('share_link'))
                             
-                            if len(jobs) >= self.max_jobs_per_source:
-                                break
-                    else:
-                        print(f"SerpAPI error: {response.status}")
+                            jobs.append({
+                                'job_id': job_id,
+                                'title': job.get('title', 'N/A'),
+                                'company': job.get('company_name', 'N/A'),
+                                'location': job.get('location', 'Remote'),
+                                'description': clean_description(job.get('description', ''), job_id) or 'N/A',
+                                'match_text': job_text.text[:DESCRIPTION_LIMIT],
+                                'url': job.get('share_link', job.get('apply_link', 'N/A')),
+                                'salary': salary,
+                                **pay,
+                                'remote': job_text.contains('remote'),
+                                'source': 'Google Jobs',
+                                'match_score': score,
+                                'requirements': []
+                            })
+                        
+                        if len(jobs) >= self.max_jobs_per_source:
+                            break
         except Exception as e:
             print(f"SerpAPI fetch error: {e}")
         
@@ -261,52 +393,83 @@ class JobBoardAggregator:
         
         try:
             async with aiohttp.ClientSession() as session:
-                url = "https://remotive.com/api/remote-jobs"
+                url = f"{REMOTIVE_BASE_URL}/api/remote-jobs"
                 
-                async with session.get(url, headers=self.headers, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
+                data = await self._get_json('Remotive', session, url, headers=self.headers, timeout=10)
+                if data is not None:
+                    for job in data.get('jobs', []):
+                        if not self._is_recent_job(job.get('publication_date')):
+                            continue
+                        pay = self._salary(job.get('salary'))
+                        if pay is None:
+                            continue
                         
-                        for job in data.get('jobs', []):
-                            if not self._is_recent_job(job.get('publication_date')):
-                                continue
-                            
-                            job_text = f"{job.get('title', '')} {job.get('description', '')} {job.get('category', '')}"
-                            
-                            if not self._quick_skill_match(job_text, skills):
-                                continue
-                            
-                            score = self._calculate_match_score(job_text, skills)
-                            
-                            if score >= 0.15:
-                                jobs.append({
-                                    'title': job.get('title', 'N/A'),
-                                    'company': job.get('company_name', 'N/A'),
-                                    'location': job.get('candidate_required_location', 'Remote'),
-                                    'description': job.get('description', 'N/A')[:500],
-                                    'url': job.get('url', 'N/A'),
-                                    'salary': job.get('salary', 'Not specified'),
-                                    'remote': True,
-                                    'source': 'Remotive',
-                                    'match_score': score,
-                                    'requirements': []
-                                })
+                        job_text = normalize_job_text(job.get('title', ''), job.get('description', ''), job.get('category', ''))
+                        
+                        score = self._score_job(job_text, skills)
+                        
+                        if score >= 0.15:
+                            job_id = self._job_id('Remotive', job.get('id'), job.get('url'))
                             
-                            if len(jobs) >= self.max_jobs_per_source:
-                                break
+                            jobs.append({
+                                'job_id': job_id,
+                                'title': job.get('title', 'N/A'),
+                                'company': job.get('company_name', 'N/A'),
+                                'location': job.get('candidate_required_location', 'Remote'),
+                                'description': clean_description(job.get('description', ''), job_id) or 'N/A',
+                                'match_text': job_text.text[:DESCRIPTION_LIMIT],
+                                'url': job.get('url', 'N/A'),
+                                'salary': job.get('salary') or 'Not specified',
+                                **pay,
+                                'remote': True,
+                                'source': 'Remotive',
+                                'posted_at': job.get('publication_date'),
+                                'match_score': score,
+                                'requirements': []
+                            })
+                        
+                        if len(jobs) >= self.max_jobs_per_source:
+                            break
         except Exception as e:
             print(f"Remotive fetch error: {e}")
         
         return jobs
     
-    async def aggregate_jobs(self, skills: List[str], location: str = "United States") -> List[Dict]:
-        """Fetch from all sources in parallel"""
+    async def fetch_indexed_jobs(self, skills: List[str]) -> List[Dict]:
+        """Serve previously seen postings from the persisted vector index (no re-embedding)"""
+        jobs = []
+        if self.job_index is None or not len(self.job_index):
+            return jobs
+        
+        # Underpaid postings are excluded inside the vector search, which then fills up from the rest
+        underpaid = salary_index.below(self.salary_floor) if self.salary_currency == salary_index.currency else []
+        self.salary_filtered += len(underpaid)
+        for job, similarity in self.job_index.search(self.profile_vector, self.max_jobs_total, exclude=underpaid):
+            job_text = job_match_text(job)
+            score = self._score_job(job_text, skills, similarity)
+            if score >= 0.15:
+                jobs.append({**job, 'match_text': job_text.text[:DESCRIPTION_LIMIT], 'match_score': score})
+        
+        return jobs
+    
+    async def aggregate_jobs(self, skills: List[str], location: str = "United States", salary_min: int = None,
+                             salary_currency: str = DEFAULT_CURRENCY) -> List[Dict]:
+        """Fetch from all sources in parallel, skipping postings known to pay below `salary_min`"""
+        skills = normalize_skills(skills)
+        self.salary_floor = salary_min
+        self.salary_currency = salary_currency
+        self.skill_expansions = {
+            skill: {related: credit for related, credit in skill_graph.related(skill).items() if credit >= 0.5}
+            for skill in skills[:5]
+        }
+        self.profile_vector = embed_profile(skills)
         
         tasks = [
             self.fetch_adzuna_jobs(skills),
             self.fetch_findwork_jobs(skills),
             self.fetch_serpapi_jobs(skills, location),
-            self.fetch_remotive_jobs(skills)
+            self.fetch_remotive_jobs(skills),
+            self.fetch_indexed_jobs(skills)
         ]
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -316,6 +479,18 @@ class JobBoardAggregator:
             if isinstance(result, list):
                 all_jobs.extend(result)
         
+        # Fresh postings (without the per-candidate score), indexed for later queries
+        # and kept for matching against saved searches
+        self.fresh_jobs = [
+            {k: v for k, v in job.items() if k != 'match_score'}
+            for result in results[:-1] if isinstance(result, list)
+            for job in result
+        ]
+        if self.job_index is not None:
+            self.job_index.upsert(self.fresh_jobs)
+            for job in self.fresh_jobs:
+                salary_index.add(job)
+        
         # Remove duplicates based on title + company
         seen = set()
         unique_jobs = []
@@ -332,6 +507,47 @@ class JobBoardAggregator:
 
 @agent.on_message(model=CandidateProfile)
 async def discover_jobs(ctx: Context, sender: str, msg: CandidateProfile):
+    """
+    Start discovery for a profile in the background so other candidates
+    aren't blocked, cancelling the candidate's older run if one is in flight.
+    """
+    current = in_flight.get(msg.candidate_id)
+    if current is not None:
+        generation, task = current
+        if msg.generation < generation:
+            ctx.logger.info(f"🗑️ Ignoring outdated profile for {msg.candidate_id} (generation {msg.generation})")
+            return
+        if not task.done():
+            task.cancel()
+            ctx.logger.info(f"🛑 Cancelled discovery for generation {generation} of {msg.candidate_id}")
+    
+    task = asyncio.create_task(run_discovery(ctx, msg))
+    in_flight[msg.candidate_id] = (msg.generation, task)
+    task.add_done_callback(lambda done: _forget_run(ctx, msg.candidate_id, done))
+
+
+@agent.on_message(model=CancelDiscovery)
+async def cancel_discovery(ctx: Context, sender: str, msg: CancelDiscovery):
+    """Cancel a run superseded by a resend that was sharded to another worker"""
+    current = in_flight.get(msg.candidate_id)
+    if current is None:
+        return
+    generation, task = current
+    if generation < msg.generation and not task.done():
+        task.cancel()
+        ctx.logger.info(f"🛑 Cancelled discovery for generation {generation} of {msg.candidate_id} (resent elsewhere)")
+
+
+def _forget_run(ctx: Context, candidate_id: str, task: asyncio.Task):
+    """Drop a finished run and log its failure, which nothing else would observe"""
+    if in_flight.get(candidate_id, (None, None))[1] is task:
+        del in_flight[candidate_id]
+    if not task.cancelled() and task.exception() is not None:
+        ctx.logger.exception(f"❌ Discovery failed for {candidate_id}", exc_info=task.exception())
+
+
+@profiled
+async def run_discovery(ctx: Context, msg: CandidateProfile):
     ctx.logger.info(f"📥 Profile received for: {msg.candidate_id}")
     ctx.logger.info(f"🎯 Skills: {msg.skills[:5]}")
     ctx.logger.info(f"💼 Experience: {msg.experience_years} years")
@@ -341,9 +557,11 @@ async def discover_jobs(ctx: Context, sender: str, msg: CandidateProfile):
     if len(skills_fetched)<1 :
         errorReport = ErrorReport(
             candidate_id=msg.candidate_id,
-            content="Error fetching jobs, try sending a more structured resume"
+            content="Error fetching jobs, try sending a more structured resume",
+            generation=msg.generation
         )
         await ctx.send(CANDIDATE_AGENT_ADDRESS,errorReport)
+        return
 
     location = msg.preferences.get('location_preference', 'United States')
     if location == 'flexible':
@@ -351,14 +569,30 @@ async def discover_jobs(ctx: Context, sender: str, msg: CandidateProfile):
     
     ctx.logger.info(f" Location: {location}")
     
-    aggregator = JobBoardAggregator()
-    filtered_jobs = await aggregator.aggregate_jobs(msg.skills, location)
+    aggregator = JobBoardAggregator(job_index)
+    salary_min = msg.preferences.get('salary_min')
+    salary_currency = msg.preferences.get('salary_currency') or DEFAULT_CURRENCY
+    filtered_jobs = await aggregator.aggregate_jobs(msg.skills, location, salary_min, salary_currency)
     
     ctx.logger.info(f"Found {len(filtered_jobs)} matching jobs")
+    if salary_min and aggregator.salary_filtered:
+        ctx.logger.info(f"💰 Skipped {aggregator.salary_filtered} postings paying under {salary_min:,} {salary_currency}/year")
+    ctx.logger.info(f"🚦 API rate limits: {rate_limiter.report()}")
+    await send_job_alerts(ctx, aggregator.fresh_jobs, msg.candidate_id)
+    
+    # Returning candidate: only postings that are new or changed since their last report
+    delta = bool(msg.seen_jobs)
+    unchanged_count = 0
+    if delta:
+        new_jobs = [job for job in filtered_jobs if msg.seen_jobs.get(job.get('job_id')) != job_version(job)]
+        unchanged_count = len(filtered_jobs) - len(new_jobs)
+        filtered_jobs = new_jobs
+        ctx.logger.info(f"🆕 Delta run: {len(new_jobs)} new or changed, {unchanged_count} already recommended")
     
-    if not filtered_jobs:
+    if not filtered_jobs and not delta:
         ctx.logger.warning("⚠️ No matching jobs found, sending empty batch")
         filtered_jobs = [{
+            'job_id': f"Fallback_{msg.candidate_id}",
             'title': f"{msg.skills[0].title()} Developer Position",
             'company': "Various Companies",
             'requirements': msg.skills[:5],
@@ -378,19 +612,59 @@ async def discover_jobs(ctx: Context, sender: str, msg: CandidateProfile):
             f"(Score: {job['match_score']:.2f}, Source: {job['source']})"
         )
     
-    # Create and send batch
+    # Create and send batch, falling back to the plain job list when compact encoding doesn't pay off.
+    # The plain list also travels until the recommender has said it can decode the compact one
+    encoding, payload = encode_jobs(filtered_jobs, JOB_BATCH_ENCODING)
+    negotiated = encoding != ENCODING_JSON and encoding in recipient_encodings.get(RECOMMENDATION_ADDRESS, ())
     batch = JobListingBatch(
         candidate_id=msg.candidate_id,
-        jobs=filtered_jobs,
-        total_count=len(filtered_jobs)
+        jobs=[] if negotiated else filtered_jobs,
+        total_count=len(filtered_jobs),
+        encoding=encoding,
+        payload=payload,
+        candidate_skills=msg.skills,
+        experience_years=msg.experience_years,
+        work_location=getattr(msg.location, 'value', msg.location),
+        profile_fingerprint=profile_fingerprint(msg),
+        priority=BATCH_PRIORITY_DELTA if delta else BATCH_PRIORITY_FULL,
+        generation=msg.generation,
+        delta=delta,
+        unchanged_count=unchanged_count
     )
     
     try:
         await ctx.send(RECOMMENDATION_ADDRESS, batch)
-        ctx.logger.info(f"✅ Sent batch of {len(filtered_jobs)} jobs to Recommendation Agent")
+        ctx.logger.info(f"✅ Sent batch of {len(filtered_jobs)} jobs to Recommendation Agent (encoding: {encoding})")
     except Exception as e:
         ctx.logger.error(f"❌ Failed to send batch: {e}")
 
+@agent.on_message(model=BatchEncodings)
+async def handle_batch_encodings(ctx: Context, sender: str, msg: BatchEncodings):
+    """Remember which batch encodings a recommender can decode"""
+    recipient_encodings[sender] = set(msg.encodings)
+    ctx.logger.info(f"🗜️ {sender[:20]}... decodes job batches as: {', '.join(msg.encodings)}")
+
+async def send_job_alerts(ctx: Context, fresh_jobs: List[Dict], searcher: str):
+    """Notify candidates with saved searches about postings this run ingested"""
+    alerts = saved_searches.percolate(fresh_jobs, exclude=searcher)
+    for candidate_id, jobs in alerts.items():
+        try:
+            await ctx.send(CANDIDATE_AGENT_ADDRESS, JobAlert(candidate_id=candidate_id, jobs=jobs))
+        except Exception as e:
+            ctx.logger.error(f"❌ Failed to send job alert: {e}")
+    if alerts:
+        ctx.logger.info(f"🔔 Sent job alerts to {len(alerts)} saved search(es)")
+
+
+@agent.on_message(model=SavedSearch)
+async def handle_saved_search(ctx: Context, sender: str, msg: SavedSearch):
+    if msg.active:
+        saved_searches.subscribe(msg.candidate_id, msg.skills, msg.remote_only)
+        ctx.logger.info(f"🔔 Saved search for {msg.candidate_id[:20]}...: {msg.skills[:5]} ({len(saved_searches)} total)")
+    elif saved_searches.unsubscribe(msg.candidate_id):
+        ctx.logger.info(f"🔕 Removed saved search for {msg.candidate_id[:20]}... ({len(saved_searches)} total)")
+
+
 @agent.on_event("startup")
 async def startup(ctx: Context):
     ctx.logger.info("="*70)
@@ -406,6 +680,9 @@ async def startup(ctx: Context):
     ctx.logger.info(f"   • Max total jobs: 15")
     ctx.logger.info(f"   • Date filter: Last 14 days")
     ctx.logger.info(f"   • Min match score: 0.15")
+    ctx.logger.info(f"   • Batch encoding: {JOB_BATCH_ENCODING}")
+    ctx.logger.info(f"   • Rate limits: {RATE_LIMIT_DB or 'per process'} (max wait {RATE_LIMIT_MAX_WAIT:.0f}s)")
+    ctx.logger.info(f"   • Profiling: {profiler.report()}")
     ctx.logger.info(f"📤 Sends to: {RECOMMENDATION_ADDRESS}")
     ctx.logger.info("="*70)
     
@@ -428,6 +705,67 @@ async def startup(ctx: Context):
         ctx.logger.warning("   ⚠️ SerpAPI key missing")
     
     ctx.logger.info("   ✅ Remotive (no auth required)\n")
+    
+    global job_index
+    started = time.perf_counter()
+    try:
+        job_index = PersistentJobIndex.open(JOB_INDEX_PATH)
+        expired = job_index.expire(JobBoardAggregator().days_filter)
+        salary_index.rebuild(entry['job'] for entry in job_index.entries.values())
+        ctx.logger.info(
+            f"🗂️ Job index loaded from {JOB_INDEX_PATH}: {len(job_index)} jobs "
+            f"({job_index.backend}, {expired} expired, {len(salary_index)} with salaries) "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+    except Exception as e:
+        ctx.logger.error(f"❌ Could not load job index, starting empty: {e}")
+        job_index = PersistentJobIndex(JOB_INDEX_PATH)
+    
+    global saved_searches
+    try:
+        saved_searches = SavedSearchIndex.open(SAVED_SEARCH_PATH)
+        ctx.logger.info(f"🔔 Saved searches loaded from {SAVED_SEARCH_PATH}: {len(saved_searches)}")
+    except Exception as e:
+        ctx.logger.error(f"❌ Could not load saved searches, starting empty: {e}")
+
+
+@agent.on_interval(period=HEARTBEAT_INTERVAL)
+async def send_heartbeat(ctx: Context):
+    """Tell the candidate agent this worker is alive so it stays on the routing ring"""
+    try:
+        await ctx.send(CANDIDATE_AGENT_ADDRESS, DiscoveryHeartbeat(in_flight=len(in_flight)))
+    except Exception as e:
+        ctx.logger.warning(f"⚠️ Heartbeat failed: {e}")
+
+
+@agent.on_interval(period=INDEX_SNAPSHOT_INTERVAL)
+async def snapshot_job_index(ctx: Context):
+    """Age out postings older than the discovery window and snapshot the indexes if they changed"""
+    if saved_searches.dirty:
+        try:
+            saved_searches.save(SAVED_SEARCH_PATH)
+        except Exception as e:
+            ctx.logger.error(f"❌ Saved search snapshot failed: {e}")
+    if job_index is None:
+        return
+    expired = job_index.expire(JobBoardAggregator().days_filter)
+    if expired:
+        salary_index.rebuild(entry['job'] for entry in job_index.entries.values())
+    if job_index.dirty:
+        try:
+            job_index.save()
+            ctx.logger.info(f"💾 Job index snapshot saved: {len(job_index)} jobs ({expired} expired)")
+        except Exception as e:
+            ctx.logger.error(f"❌ Job index snapshot failed: {e}")
+
+
+@agent.on_event("shutdown")
+async def shutdown(ctx: Context):
+    if saved_searches.dirty:
+        saved_searches.save(SAVED_SEARCH_PATH)
+    if job_index is not None and job_index.dirty:
+        job_index.save()
+        ctx.logger.info(f"💾 Job index saved on shutdown: {len(job_index)} jobs")
 
 if __name__ == "__main__":
     agent.run()
@@ -0,0 +1,266 @@
+"""
+Persistent, incrementally updatable job-vector index.
+Jobs are embedded once when first seen, added or replaced by job id, and
+removed once they age out of the discovery window. The index is written
+to disk as a snapshot (FAISS index or numpy arrays plus a JSON metadata
+file) and reloaded at startup without re-embedding anything.
+
+Each snapshot goes into its own directory, and the CURRENT file names the
+live one. Only CURRENT is replaced in place, so a reader always sees the
+vectors and metadata of one snapshot together.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from embeddings import embed_texts, embedder, faiss
+from job_text import job_match_text
+
+INDEX_FILE = "jobs.faiss"
+VECTORS_FILE = "vectors.npy"
+IDS_FILE = "ids.npy"
+METADATA_FILE = "jobs.json"
+CURRENT_FILE = "CURRENT"
+SNAPSHOT_PREFIX = "snapshot-"
+
+
+def _content_hash(job: dict) -> str:
+    text = f"{job.get('title', '')}\n{job.get('company', '')}\n{job.get('description', '')}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _parse_timestamp(value) -> Optional[float]:
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class PersistentJobIndex:
+    """Job vectors keyed by job id, with incremental add/delete and disk snapshots"""
+
+    def __init__(self, path: str, dim: int = None):
+        self.path = path
+        self.dim = dim or embedder.dim
+        self.next_id = 0
+        self.ids_by_key: Dict[str, int] = {}
+        # int id -> {'job': dict, 'hash': str, 'posted_at': float, 'indexed_at': float}
+        self.entries: Dict[int, dict] = {}
+        self.dirty = False
+        if faiss is not None:
+            self._index = faiss.IndexIDMap2(faiss.IndexFlatIP(self.dim))
+        else:
+            self._index = None
+            self._ids = np.zeros(0, dtype=np.int64)
+            self._matrix = np.zeros((0, self.dim), dtype=np.float32)
+
+    @property
+    def backend(self) -> str:
+        return "faiss" if self._index is not None else "numpy"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, job_key: str) -> bool:
+        return job_key in self.ids_by_key
+
+    # ---- updates -------------------------------------------------------
+
+    def _add_vectors(self, ids: np.ndarray, vectors: np.ndarray):
+        if self._index is not None:
+            self._index.add_with_ids(vectors, ids)
+        else:
+            self._ids = np.concatenate([self._ids, ids])
+            self._matrix = np.vstack([self._matrix, vectors])
+
+    def _remove_vectors(self, ids: List[int]):
+        if not ids:
+            return
+        ids = np.asarray(ids, dtype=np.int64)
+        if self._index is not None:
+            self._index.remove_ids(ids)
+        else:
+            keep = ~np.isin(self._ids, ids)
+            self._ids = self._ids[keep]
+            self._matrix = self._matrix[keep]
+
+    def upsert(self, jobs: List[dict]) -> int:
+        """
+        Add new jobs and re-embed ones whose content changed.
+        Unchanged jobs are skipped, so re-fetching the same postings costs nothing.
+        Returns the number of jobs embedded.
+        """
+        now = time.time()
+        pending = []
+        replaced = []
+        for job in jobs:
+            job_key = job.get('job_id')
+            if not job_key:
+                continue
+            content_hash = _content_hash(job)
+            existing = self.ids_by_key.get(job_key)
+            if existing is not None:
+                if self.entries[existing]['hash'] == content_hash:
+                    continue
+                replaced.append(existing)
+            pending.append((job_key, job, content_hash))
+
+        if not pending:
+            return 0
+
+        self._remove_vectors(replaced)
+        for old_id in replaced:
+            del self.entries[old_id]
+
+        vectors = embed_texts([job_match_text(job) for _, job, _ in pending])
+        ids = np.arange(self.next_id, self.next_id + len(pending), dtype=np.int64)
+        self.next_id += len(pending)
+        self._add_vectors(ids, np.ascontiguousarray(vectors, dtype=np.float32))
+
+        for job_id, (job_key, job, content_hash) in zip(ids.tolist(), pending):
+            self.ids_by_key[job_key] = job_id
+            self.entries[job_id] = {
+                'job': job,
+                'hash': content_hash,
+                'posted_at': _parse_timestamp(job.get('posted_at')),
+                'indexed_at': now
+            }
+        self.dirty = True
+        return len(pending)
+
+    def delete(self, job_keys: List[str]) -> int:
+        ids = [self.ids_by_key.pop(key) for key in job_keys if key in self.ids_by_key]
+        self._remove_vectors(ids)
+        for job_id in ids:
+            del self.entries[job_id]
+        if ids:
+            self.dirty = True
+        return len(ids)
+
+    def expire(self, max_age_days: int) -> int:
+        """Drop postings older than the discovery window (by posted date, else first-seen date)"""
+        cutoff = time.time() - max_age_days * 86400
+        expired = [
+            entry['job']['job_id'] for entry in self.entries.values()
+            if (entry['posted_at'] or entry['indexed_at']) < cutoff
+        ]
+        return self.delete(expired)
+
+    # ---- queries -------------------------------------------------------
+
+    def search(self, query: np.ndarray, k: int = 15, min_score: float = 0.0,
+               exclude: Iterable[str] = ()) -> List[Tuple[dict, float]]:
+        """
+        Nearest jobs to a profile vector as (job dict, similarity) pairs.
+        Jobs keyed in `exclude` are filtered inside the search, so up to `k`
+        results still come back from the remaining jobs.
+        """
+        excluded = np.asarray(
+            [self.ids_by_key[key] for key in exclude if key in self.ids_by_key], dtype=np.int64
+        )
+        k = min(k, len(self.entries) - len(excluded))
+        if k <= 0:
+            return []
+        query = np.ascontiguousarray(np.atleast_2d(query), dtype=np.float32)
+
+        if self._index is not None:
+            params = None
+            if len(excluded):
+                batch = faiss.IDSelectorBatch(excluded)
+                params = faiss.SearchParameters(sel=faiss.IDSelectorNot(batch))
+            scores, ids = self._index.search(query, k, params=params)
+            hits = zip(ids[0].tolist(), scores[0].tolist())
+        else:
+            similarities = (self._matrix @ query[0])
+            if len(excluded):
+                similarities[np.isin(self._ids, excluded)] = -np.inf
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top])]
+            hits = zip(self._ids[top].tolist(), similarities[top].tolist())
+
+        return [
+            (self.entries[job_id]['job'], score)
+            for job_id, score in hits
+            if job_id >= 0 and score >= min_score and job_id in self.entries
+        ]
+
+    # ---- persistence ---------------------------------------------------
+
+    def save(self):
+        """Write a new snapshot directory, then switch CURRENT to it and drop older snapshots"""
+        os.makedirs(self.path, exist_ok=True)
+        name = f"{SNAPSHOT_PREFIX}{time.time_ns()}"
+        directory = os.path.join(self.path, name)
+        os.makedirs(directory)
+
+        def target(file_name):
+            return os.path.join(directory, file_name)
+
+        if self._index is not None:
+            faiss.write_index(self._index, target(INDEX_FILE))
+        else:
+            with open(target(VECTORS_FILE), "wb") as f:
+                np.save(f, self._matrix)
+            with open(target(IDS_FILE), "wb") as f:
+                np.save(f, self._ids)
+
+        metadata = {
+            'dim': self.dim,
+            'backend': self.backend,
+            'next_id': self.next_id,
+            'entries': {str(job_id): entry for job_id, entry in self.entries.items()}
+        }
+        with open(target(METADATA_FILE), "w", encoding="utf-8") as f:
+            json.dump(metadata, f, separators=(",", ":"))
+
+        current = os.path.join(self.path, CURRENT_FILE)
+        with open(current + ".tmp", "w", encoding="utf-8") as f:
+            f.write(name)
+        os.replace(current + ".tmp", current)
+        self.dirty = False
+
+        for entry in os.listdir(self.path):
+            if entry.startswith(SNAPSHOT_PREFIX) and entry != name:
+                shutil.rmtree(os.path.join(self.path, entry), ignore_errors=True)
+
+    @classmethod
+    def open(cls, path: str) -> "PersistentJobIndex":
+        """Load the snapshot at `path`, or start an empty index if there is none"""
+        index = cls(path)
+        try:
+            with open(os.path.join(path, CURRENT_FILE), encoding="utf-8") as f:
+                snapshot = os.path.join(path, f.read().strip())
+        except FileNotFoundError:
+            # Snapshots written before CURRENT existed kept their files directly in `path`
+            snapshot = path
+        metadata_path = os.path.join(snapshot, METADATA_FILE)
+        if not os.path.exists(metadata_path):
+            return index
+
+        with open(metadata_path, encoding="utf-8") as f:
+            metadata = json.load(f)
+        if metadata.get('dim') != index.dim or metadata.get('backend') != index.backend:
+            # Embedding size or backend changed; the old vectors can't be reused
+            return index
+
+        if index._index is not None:
+            index._index = faiss.read_index(os.path.join(snapshot, INDEX_FILE))
+        else:
+            index._matrix = np.load(os.path.join(snapshot, VECTORS_FILE))
+            index._ids = np.load(os.path.join(snapshot, IDS_FILE))
+
+        index.next_id = metadata['next_id']
+        index.entries = {int(job_id): entry for job_id, entry in metadata['entries'].items()}
+        index.ids_by_key = {entry['job']['job_id']: job_id for job_id, entry in index.entries.items()}
+        return index
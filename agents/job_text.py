@@ -0,0 +1,223 @@
+"""
+Job text normalization shared by the Job Discovery and Recommendation agents.
+Each job's text (title plus full description) is cleaned and lowercased once
+at ingest and scored there; the first DESCRIPTION_LIMIT characters are carried
+with the job as `match_text`, so downstream scorers work on the same text
+without re-normalizing their own copy or growing every batch message.
+Upstream HTML descriptions are converted to plain text before truncation.
+"""
+
+import html
+import re
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+TAG_RE = re.compile(r"<[^>]*>")
+WHITESPACE_RE = re.compile(r"\s+")
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+# Characters of cleaned description (and of carried match text) kept per job
+DESCRIPTION_LIMIT = 500
+
+
+def strip_html(text: str) -> str:
+    """Remove tags and entities, collapsing whitespace"""
+    if not text:
+        return ""
+    if "<" in text:
+        text = TAG_RE.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+class _StopParsing(Exception):
+    """Raised once enough text has been collected"""
+
+
+class HTMLTextExtractor(HTMLParser):
+    """
+    Streaming HTML-to-text converter.
+    Drops script/style content, turns block tags into spaces and stops
+    parsing as soon as `limit` characters of visible text are collected.
+    """
+
+    SKIP_TAGS = {"script", "style", "head", "noscript"}
+    BREAK_TAGS = {
+        "br", "p", "div", "li", "ul", "ol", "tr", "td", "th", "table",
+        "h1", "h2", "h3", "h4", "h5", "h6", "section", "article", "hr",
+    }
+
+    def __init__(self, limit: int = 0):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.parts = []
+        self.size = 0
+        self._skip_depth = 0
+        self._pending_space = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BREAK_TAGS:
+            self._pending_space = True
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in self.BREAK_TAGS:
+            self._pending_space = True
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag in self.BREAK_TAGS:
+            self._pending_space = True
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        chunk = WHITESPACE_RE.sub(" ", data)
+        if not chunk.strip():
+            self._pending_space = self._pending_space or bool(chunk)
+            return
+        if (self._pending_space or chunk[0] == " ") and self.parts:
+            self.parts.append(" ")
+            self.size += 1
+        self._pending_space = chunk[-1] == " "
+        chunk = chunk.strip()
+        self.parts.append(chunk)
+        self.size += len(chunk)
+        if self.limit and self.size >= self.limit:
+            raise _StopParsing()
+
+    def text(self) -> str:
+        return "".join(self.parts)
+
+
+def html_to_text(raw: str, limit: int = 0, chunk_size: int = 4096) -> str:
+    """
+    Convert an HTML fragment to plain text, feeding it in chunks so long
+    descriptions stop being parsed once `limit` characters are collected.
+    """
+    if not raw:
+        return ""
+    if "<" not in raw and "&" not in raw:
+        text = WHITESPACE_RE.sub(" ", raw).strip()
+        return text[:limit] if limit else text
+
+    parser = HTMLTextExtractor(limit)
+    try:
+        for start in range(0, len(raw), chunk_size):
+            parser.feed(raw[start:start + chunk_size])
+        parser.close()
+    except _StopParsing:
+        pass
+    text = parser.text()
+    return text[:limit] if limit else text
+
+
+class DescriptionCache:
+    """Bounded LRU cache of cleaned descriptions keyed by (job id, limit)"""
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, int]) -> Optional[str]:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Tuple[str, int], value: str):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+description_cache = DescriptionCache()
+
+
+def clean_description(raw: str, job_id: str = None, limit: int = DESCRIPTION_LIMIT) -> str:
+    """
+    Clean an upstream description to plain text and truncate it.
+    Results are cached by job id, since the same postings come back on
+    every search for similar skills.
+    """
+    if job_id:
+        cached = description_cache.get((job_id, limit))
+        if cached is not None:
+            return cached
+    text = html_to_text(raw, limit)
+    if job_id:
+        description_cache.put((job_id, limit), text)
+    return text
+
+
+class NormalizedText:
+    """Canonical lowercase, HTML-stripped view of a job's text"""
+
+    __slots__ = ("text", "_tokens")
+
+    def __init__(self, raw: str):
+        self.text = strip_html(raw).lower()
+        self._tokens = None
+
+    @classmethod
+    def from_normalized(cls, text: str) -> "NormalizedText":
+        """Wrap text that was already normalized (a job's `match_text`) without re-cleaning it"""
+        normalized = cls.__new__(cls)
+        normalized.text = text
+        normalized._tokens = None
+        return normalized
+
+    @property
+    def tokens(self) -> FrozenSet[str]:
+        """Token set, built on first use"""
+        if self._tokens is None:
+            self._tokens = frozenset(
+                token.rstrip("./-") for token in TOKEN_RE.findall(self.text)
+            )
+        return self._tokens
+
+    def contains(self, term: str) -> bool:
+        """Substring check for an already-lowercased term"""
+        return term in self.text
+
+    def has_term(self, term: str) -> bool:
+        """Whole-token check for single words, substring check for phrases"""
+        if " " in term:
+            return term in self.text
+        return term in self.tokens
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+
+def normalize_job_text(*parts: str) -> NormalizedText:
+    """Join the raw fields of a job and normalize them once"""
+    return NormalizedText(" ".join(part for part in parts if part))
+
+
+def job_match_text(job: dict) -> NormalizedText:
+    """
+    The normalized text a job was scored on at ingest, or - for jobs from
+    before `match_text` was carried - its title and description normalized now
+    """
+    match_text = job.get('match_text')
+    if isinstance(match_text, str):
+        return NormalizedText.from_normalized(match_text)
+    return normalize_job_text(job.get('title', ''), job.get('description', ''))
+
+
+def normalize_skills(skills: Iterable[str]) -> List[str]:
+    """Lowercase and strip a skill list once per request"""
+    return [skill.strip().lower() for skill in skills if skill and skill.strip()]
@@ -0,0 +1,72 @@
+"""
+Lazy loading for the LangChain/OpenAI stack.
+Importing langchain and building a client takes seconds, so agents wrap the
+construction in a LazyLLM, start warming it in a background thread after
+startup and keep serving their local/fallback paths until it is ready.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# Set when the first agent module imports this one, to report cold-start cost
+PROCESS_IMPORT_STARTED = time.perf_counter()
+
+
+class LazyLLM:
+    """Builds an LLM client on first use or during a background warmup"""
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        self.name = name
+        self._factory = factory
+        self._value = None
+        self._lock = threading.Lock()
+        self._warmup_future = None
+        self.load_seconds = None
+        self.error = None
+
+    @property
+    def ready(self) -> bool:
+        return self._value is not None
+
+    def get(self) -> Any:
+        """Build the client if needed (blocking) and return it"""
+        if self._value is not None:
+            return self._value
+        with self._lock:
+            if self._value is None and self.error is None:
+                started = time.perf_counter()
+                try:
+                    self._value = self._factory()
+                except Exception as e:
+                    self.error = e
+                finally:
+                    self.load_seconds = time.perf_counter() - started
+        return self._value
+
+    def get_if_ready(self) -> Optional[Any]:
+        """Return the client without blocking, or None while it is still warming up"""
+        return self._value
+
+    async def warmup(self) -> Optional[Any]:
+        """Build the client in a worker thread so the event loop keeps serving messages"""
+        if self._value is not None:
+            return self._value
+        if self._warmup_future is None:
+            loop = asyncio.get_running_loop()
+            self._warmup_future = loop.run_in_executor(None, self.get)
+        return await self._warmup_future
+
+    def report(self) -> str:
+        """One-line load report for startup logs"""
+        if self.error is not None:
+            return f"{self.name}: failed after {self.load_seconds:.2f}s ({self.error})"
+        if self.ready:
+            return f"{self.name}: ready in {self.load_seconds:.2f}s"
+        return f"{self.name}: not loaded"
+
+
+def seconds_since_import() -> float:
+    """Time elapsed since the agent process started importing modules"""
+    return time.perf_counter() - PROCESS_IMPORT_STARTED
@@ -0,0 +1,182 @@
+"""
+Memory accounting for long-running agents.
+Every MEMORY_CHECK_INTERVAL seconds the monitor logs the process RSS and a
+gauge per registered structure (sessions, caches, queues), warns when RSS
+crosses MEMORY_ALARM_MB, and - with MEMORY_TRACEMALLOC=1 - logs the source
+lines whose allocations grew most since the previous tracemalloc snapshot.
+The same numbers are served at GET /metrics on the agent's HTTP port.
+
+tracemalloc slows allocation-heavy code noticeably, so it is opt-in; the
+gauges and RSS are always collected.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from uagents import Agent, Context
+
+from models import MetricsResponse
+
+MEMORY_CHECK_INTERVAL = float(os.getenv("MEMORY_CHECK_INTERVAL", "300"))
+MEMORY_ALARM_MB = float(os.getenv("MEMORY_ALARM_MB", "1024"))
+MEMORY_TRACEMALLOC = os.getenv("MEMORY_TRACEMALLOC", "0") == "1"
+TRACEMALLOC_FRAMES = int(os.getenv("MEMORY_TRACEMALLOC_FRAMES", "1"))
+TOP_ALLOCATIONS = int(os.getenv("MEMORY_TOP_ALLOCATIONS", "10"))
+# Stop walking a structure after this many objects; the byte gauge is then a lower bound
+DEEP_SIZEOF_LIMIT = 200000
+
+_IGNORED_TRACES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def deep_sizeof(obj, limit: int = DEEP_SIZEOF_LIMIT) -> int:
+    """Approximate bytes held by `obj` and everything reachable through containers and attributes"""
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack and len(seen) < limit:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, type):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item, 0)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__dict__'):
+            stack.append(vars(item))
+        elif hasattr(item, '__slots__'):
+            stack.extend(getattr(item, slot) for slot in item.__slots__ if hasattr(item, slot))
+    return total
+
+
+def rss_mb() -> float:
+    """Current resident set size, falling back to the peak where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Reported in KiB on Linux, bytes on macOS
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+class MemoryMonitor:
+    """Collects RSS, structure gauges and tracemalloc growth for one agent"""
+
+    def __init__(self, alarm_mb: float = MEMORY_ALARM_MB):
+        self.alarm_mb = alarm_mb
+        self.gauges: Dict[str, Callable[[], float]] = {}
+        self.started = time.time()
+        self.peak_rss_mb = 0.0
+        self.alarms = 0
+        self._alarm_raised = False
+        self._snapshot = None
+        self.top_growth: List[str] = []
+
+    def gauge(self, name: str, read: Callable[[], float]):
+        """Register a size to report, e.g. monitor.gauge("user_sessions", lambda: len(user_sessions))"""
+        self.gauges[name] = read
+
+    def read_gauges(self) -> dict:
+        values = {}
+        for name, read in self.gauges.items():
+            try:
+                values[name] = read()
+            except Exception as e:
+                values[name] = f"error: {e}"
+        return values
+
+    def start(self):
+        if MEMORY_TRACEMALLOC and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+    def _allocation_growth(self) -> List[str]:
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is None:
+            return []
+        growth = []
+        for stat in snapshot.compare_to(previous, "lineno")[:TOP_ALLOCATIONS]:
+            if stat.size_diff <= 0:
+                break
+            frame = stat.traceback[0]
+            growth.append(
+                f"{os.path.basename(frame.filename)}:{frame.lineno} "
+                f"+{stat.size_diff / 1024:.1f} KiB ({stat.size / 1024:.1f} KiB, {stat.count} blocks)"
+            )
+        return growth
+
+    def memory(self) -> dict:
+        rss = rss_mb()
+        self.peak_rss_mb = max(self.peak_rss_mb, rss)
+        memory = {
+            'rss_mb': round(rss, 1),
+            'peak_rss_mb': round(self.peak_rss_mb, 1),
+            'alarm_mb': self.alarm_mb,
+            'alarms': self.alarms,
+            'uptime_hours': round((time.time() - self.started) / 3600, 2),
+        }
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            memory['traced_mb'] = round(current / 2 ** 20, 1)
+            memory['traced_peak_mb'] = round(peak / 2 ** 20, 1)
+        return memory
+
+    def check(self, ctx: Context):
+        """Log memory and gauges, raise the alarm on crossing the threshold and log allocation growth"""
+        memory = self.memory()
+        gauges = self.read_gauges()
+        ctx.logger.info(
+            f"🧠 Memory: {memory['rss_mb']:.0f} MB RSS (peak {memory['peak_rss_mb']:.0f} MB) | "
+            + " | ".join(f"{name}={value}" for name, value in gauges.items())
+        )
+        if memory['rss_mb'] > self.alarm_mb:
+            if not self._alarm_raised:
+                self.alarms += 1
+                self._alarm_raised = True
+                ctx.logger.warning(f"🚨 Memory alarm: RSS {memory['rss_mb']:.0f} MB is above {self.alarm_mb:.0f} MB")
+        elif self._alarm_raised:
+            self._alarm_raised = False
+            ctx.logger.info(f"✅ Memory back under {self.alarm_mb:.0f} MB")
+
+        if tracemalloc.is_tracing():
+            self.top_growth = self._allocation_growth()
+            for line in self.top_growth:
+                ctx.logger.info(f"   📈 {line}")
+
+
+def register_memory_monitor(agent: Agent, monitor: MemoryMonitor, stats: Callable[[], dict] = None):
+    """Check memory on an interval and serve it, plus `stats()`, at GET /metrics"""
+
+    @agent.on_event("startup")
+    async def start_memory_monitor(ctx: Context):
+        monitor.start()
+        ctx.logger.info(
+            f"🧠 Memory monitor: every {MEMORY_CHECK_INTERVAL:.0f}s, alarm at {monitor.alarm_mb:.0f} MB, "
+            f"tracemalloc {'on' if tracemalloc.is_tracing() else 'off'}"
+        )
+
+    @agent.on_interval(period=MEMORY_CHECK_INTERVAL)
+    async def check_memory(ctx: Context):
+        monitor.check(ctx)
+
+    @agent.on_rest_get("/metrics", MetricsResponse)
+    async def get_metrics(ctx: Context) -> MetricsResponse:
+        return MetricsResponse(
+            agent=ctx.agent.address,
+            memory=monitor.memory(),
+            gauges=monitor.read_gauges(),
+            top_growth=monitor.top_growth,
+            stats=stats() if stats is not None else {}
+        )
@@ -1,5 +1,7 @@
 from uagents import Model
 from enum import Enum
+import hashlib
+import json
 
 class Worklocation(str,Enum):
     remote = "remote"
@@ -14,6 +16,9 @@ class CandidateProfile(Model):
     experience_years: int
     preferences: dict
     location : Worklocation
+    generation: int = 0  # Bumped per candidate on every new input; older in-flight work is cancelled
+    # job_id -> job_version of postings already recommended; when set, discovery only returns what's new
+    seen_jobs: dict = {}
 
 class JobListing(Model):
     """Individual job - sent from Job Discovery to Recommendation"""
@@ -34,18 +39,91 @@ class RecommendationReport(Model):
     candidate_id: str
     report: str
     top_matches: list
+    generation: int = 0
+    job_versions: dict = {}  # job_id -> job_version of the postings included in the report
 
 class JobListingBatch(Model):
     """Batch of job listings - sent from Job Discovery to Recommendation"""
     candidate_id: str
     jobs: list  # List of job dictionaries
     total_count: int
+    encoding: str = "json"  # "json" uses `jobs`; compact encodings use `payload` (see batch_codec)
+    payload: str = ""
+    # Candidate context so the recommender can score without re-fetching the profile
+    candidate_skills: list = []
+    experience_years: int = 2
+    work_location: str = ""
+    profile_fingerprint: str = ""
+    priority: int = 0  # Higher is served first by the recommender's queue (full batches before deltas)
+    generation: int = 0
+    delta: bool = False  # Only postings new or changed since the candidate's last report
+    unchanged_count: int = 0  # Previously recommended postings left out of a delta batch
+
+class BatchEncodings(Model):
+    """Job batch encodings a Recommendation agent can decode - sent back to each Job Discovery worker"""
+    encodings: list
+
+class CancelDiscovery(Model):
+    """Stop a superseded discovery run - sent from Candidate to the Job Discovery worker that started it"""
+    candidate_id: str
+    generation: int = 0  # The superseding generation; runs for older ones are cancelled
 
 class ErrorReport(Model):
     candidate_id: str
     content : str
+    generation: int = 0
+
+class DiscoveryHeartbeat(Model):
+    """Liveness signal - sent periodically from each Job Discovery worker to Candidate"""
+    in_flight: int = 0  # Discovery runs currently in progress on the worker
+
+class SavedSearch(Model):
+    """Subscribe to (or cancel) job alerts - sent from Candidate to every Job Discovery worker"""
+    candidate_id: str
+    skills: list
+    remote_only: bool = False
+    active: bool = True  # False cancels the candidate's saved search
+
+class JobAlert(Model):
+    """Newly ingested jobs matching a saved search - sent from Job Discovery to Candidate"""
+    candidate_id: str
+    jobs: list
+
+class ProfilingControl(Model):
+    """Turn handler profiling on or off at runtime - sent by an operator to any agent (see profiling)"""
+    next_requests: int = 0  # Profile this many of the next calls
+    sample_rate: float = 0.0  # Then this fraction of calls
+    handlers: list = []  # Handler names to profile; empty means all
+    mode: str = "cprofile"  # "cprofile" or "sampling"
+
+class MetricsResponse(Model):
+    """Served at GET /metrics by every agent (see memory_monitor)"""
+    agent: str
+    memory: dict  # RSS, peak, alarm threshold, tracemalloc totals
+    gauges: dict  # Size of each registered structure
+    top_growth: list = []  # Source lines that grew most between the last two tracemalloc snapshots
+    stats: dict = {}  # Agent-specific counters
 
 class PDFResume(Model):
     """PDF resume upload"""
     content: str  # base64 encoded
 
+
+def profile_fingerprint(profile: CandidateProfile) -> str:
+    """Stable hash of the profile fields that affect matching and scoring"""
+    location = getattr(profile.location, "value", profile.location)
+    key = json.dumps(
+        [sorted(skill.lower() for skill in profile.skills), profile.experience_years, location, profile.preferences],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def job_version(job: dict) -> str:
+    """Hash of the posting fields a candidate sees, so a changed posting counts as new"""
+    key = json.dumps(
+        [job.get(field) for field in ('title', 'company', 'location', 'salary', 'remote', 'description')],
+        default=str
+    )
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
@@ -0,0 +1,115 @@
+"""
+PDF resume text extraction.
+The base64 payload is size-checked before decoding and decoded straight
+into a single bytes object. Each PDF is then sent once to one process-pool
+worker, which parses it a single time and extracts up to MAX_PDF_PAGES
+pages, so large PDFs don't hold the GIL or block the agent's event loop.
+PDF_WORKERS bounds how many PDFs are read at once.
+
+A running worker can't be cancelled, so when a PDF overruns its timeout
+the pool's processes are terminated and a fresh pool takes over. Other
+extractions that were running in the old pool are retried on the new one
+within their own timeout.
+"""
+
+import asyncio
+import binascii
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # pypdf is optional; PDF uploads are rejected without it
+    PdfReader = None
+
+MAX_PDF_BYTES = int(os.getenv("MAX_PDF_BYTES", str(5 * 1024 * 1024)))
+MAX_PDF_PAGES = int(os.getenv("MAX_PDF_PAGES", "30"))
+PDF_EXTRACT_TIMEOUT = float(os.getenv("PDF_EXTRACT_TIMEOUT", "20"))
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+_executor = None
+
+
+class PDFExtractionError(Exception):
+    """Raised with a user-facing message when a PDF can't be read"""
+
+
+def decode_pdf(content: str) -> bytes:
+    """Decode a base64 PDF, rejecting oversized or non-PDF payloads before doing any work"""
+    if len(content) * 3 // 4 > MAX_PDF_BYTES:
+        raise PDFExtractionError(f"PDF is larger than {MAX_PDF_BYTES // (1024 * 1024)} MB")
+    try:
+        # a2b_base64 reads the str directly, so the only new buffer is the decoded PDF
+        data = binascii.a2b_base64(content)
+    except (binascii.Error, ValueError):
+        raise PDFExtractionError("PDF content is not valid base64")
+    if memoryview(data)[:5] != b"%PDF-":
+        raise PDFExtractionError("File is not a PDF")
+    return data
+
+
+def _extract_text(data: bytes, max_pages: int) -> str:
+    """Worker: parse the PDF once and join the text of its first `max_pages` pages"""
+    try:
+        reader = PdfReader(io.BytesIO(data))
+        pages = reader.pages[:max_pages]
+    except Exception:
+        raise PDFExtractionError("PDF could not be parsed")
+    texts = []
+    for page in pages:
+        try:
+            texts.append(page.extract_text() or "")
+        except Exception:
+            texts.append("")
+    return "\n".join(texts).strip()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+    return _executor
+
+
+def _terminate_pool(executor: ProcessPoolExecutor):
+    """Kill the pool's workers (a stuck extraction can't be cancelled) so the next call starts a new pool"""
+    global _executor
+    if _executor is executor:
+        _executor = None
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+    # Queued extractions fail with BrokenProcessPool rather than being cancelled, so their callers retry
+    executor.shutdown(wait=False)
+
+
+async def extract_pdf_text(data: bytes, timeout: float = PDF_EXTRACT_TIMEOUT) -> str:
+    """Extract text from PDF bytes in the process pool"""
+    if PdfReader is None:
+        raise PDFExtractionError("PDF support is not installed (pip install pypdf)")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        executor = _get_executor()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(executor, _extract_text, data, MAX_PDF_PAGES),
+                max(deadline - loop.time(), 0)
+            )
+        except asyncio.TimeoutError:
+            _terminate_pool(executor)
+            raise PDFExtractionError(f"PDF took longer than {timeout:.0f}s to read")
+        except BrokenProcessPool:
+            # Another PDF's timeout (or a crashed worker) took the pool down; retry on a new one
+            _terminate_pool(executor)
+            if deadline <= loop.time():
+                raise PDFExtractionError("PDF reader crashed")
+
+
+def shutdown_pool():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,192 @@
+"""
+On-demand profiling for agent handlers.
+Wrap a handler with @profiled and turn profiling on for the next N calls
+or a fraction of traffic, either at startup through env vars or at runtime
+with a ProfilingControl message:
+
+    PROFILE_NEXT=20                 profile the next 20 calls
+    PROFILE_SAMPLE_RATE=0.01        then 1% of calls
+    PROFILE_HANDLERS=run_discovery  only these handlers (comma separated; empty = all)
+    PROFILE_MODE=sampling           "cprofile" (deterministic) or "sampling" (stack sampler)
+    PROFILE_DIR=data/profiles       where profiles are written
+    PROFILING_CONTROLLERS=agent1... addresses allowed to send ProfilingControl
+
+Each profiled call writes one file to PROFILE_DIR named
+<time>_<handler>_<candidate>: a pstats dump (.prof, for snakeviz or
+pstats) in cprofile mode, or folded stacks (.folded, for flamegraph.pl or
+speedscope) in sampling mode. Both profilers see everything the event loop
+runs while the handler is awaited, not just the handler's own frames.
+When profiling is off a wrapped call costs one attribute check.
+"""
+
+import cProfile
+import functools
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from uagents import Agent, Context
+
+from models import ProfilingControl
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", "data/profiles")
+SAMPLE_INTERVAL_SECONDS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "5")) / 1000
+MODES = ("cprofile", "sampling")
+
+
+class StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval into folded-stack counts"""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL_SECONDS):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+    def dump(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    """Decides which handler calls are profiled and writes their profiles"""
+
+    def __init__(self):
+        self.handlers = set()
+        self.remaining = 0
+        self.sample_rate = 0.0
+        self.mode = "cprofile"
+        self.active = False
+        self.written = 0
+        # cProfile allows one active profiler per thread; overlapping calls are skipped
+        self._busy = False
+
+    def configure(self, next_requests: int = 0, sample_rate: float = 0.0, handlers=(), mode: str = "cprofile"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode {mode!r}, expected one of {MODES}")
+        self.remaining = max(0, next_requests)
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.handlers = {handler for handler in handlers if handler}
+        self.mode = mode
+        self.active = self.remaining > 0 or self.sample_rate > 0
+
+    def configure_from_env(self):
+        self.configure(
+            int(os.getenv("PROFILE_NEXT", "0")),
+            float(os.getenv("PROFILE_SAMPLE_RATE", "0")),
+            os.getenv("PROFILE_HANDLERS", "").split(","),
+            os.getenv("PROFILE_MODE", "cprofile")
+        )
+
+    def should_profile(self, handler: str) -> bool:
+        if self._busy or (self.handlers and handler not in self.handlers):
+            return False
+        if self.remaining > 0:
+            self.remaining -= 1
+            self.active = self.remaining > 0 or self.sample_rate > 0
+            return True
+        return random.random() < self.sample_rate
+
+    def _path(self, handler: str, candidate_id: Optional[str], extension: str) -> str:
+        tag = re.sub(r"[^A-Za-z0-9]", "", candidate_id or "")[-12:] or "none"
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return os.path.join(PROFILE_DIR, f"{stamp}_{self.written:05d}_{handler}_{tag}.{extension}")
+
+    async def run(self, func, handler: str, candidate_id: Optional[str], args, kwargs):
+        self._busy = True
+        if self.mode == "sampling":
+            collector = StackSampler(threading.get_ident())
+            collector.start()
+        else:
+            collector = cProfile.Profile()
+            collector.enable()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            if self.mode == "sampling":
+                collector.stop()
+                collector.dump(self._path(handler, candidate_id, "folded"))
+            else:
+                collector.disable()
+                collector.dump_stats(self._path(handler, candidate_id, "prof"))
+            self.written += 1
+            self._busy = False
+
+    def report(self) -> str:
+        if not self.active:
+            return f"off ({self.written} profiles written)"
+        return (
+            f"{self.mode}, next {self.remaining} + {self.sample_rate:.1%} of "
+            f"{', '.join(sorted(self.handlers)) or 'all handlers'} -> {PROFILE_DIR}"
+        )
+
+
+profiler = Profiler()
+profiler.configure_from_env()
+
+
+def _candidate_id(args, kwargs) -> Optional[str]:
+    """The candidate a handler call is for: a message's candidate_id, an entry's, or the sender"""
+    values = list(args) + list(kwargs.values())
+    for value in values:
+        candidate_id = getattr(value, 'candidate_id', None)
+        if candidate_id is None and isinstance(value, dict):
+            candidate_id = value.get('candidate_id')
+        if isinstance(candidate_id, str):
+            return candidate_id
+    if len(args) > 1 and isinstance(args[1], str):
+        return args[1]
+    return kwargs.get('sender')
+
+
+def profiled(func):
+    """Profile calls of an async handler when the profiler selects them"""
+    handler = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not profiler.active or not profiler.should_profile(handler):
+            return await func(*args, **kwargs)
+        return await profiler.run(func, handler, _candidate_id(args, kwargs), args, kwargs)
+
+    return wrapper
+
+
+def register_profiling(agent: Agent):
+    """Accept ProfilingControl messages from the addresses in PROFILING_CONTROLLERS"""
+    controllers = {address.strip() for address in os.getenv("PROFILING_CONTROLLERS", "").split(",") if address.strip()}
+
+    @agent.on_message(model=ProfilingControl)
+    async def handle_profiling_control(ctx: Context, sender: str, msg: ProfilingControl):
+        if sender not in controllers:
+            ctx.logger.warning(f"⚠️ Ignoring profiling control from unauthorized sender {sender[:20]}...")
+            return
+        try:
+            profiler.configure(msg.next_requests, msg.sample_rate, msg.handlers, msg.mode)
+        except ValueError as e:
+            ctx.logger.error(f"❌ {e}")
+            return
+        ctx.logger.info(f"🔬 Profiling: {profiler.report()}")
@@ -0,0 +1,225 @@
+"""
+Token-bucket rate limiting for the job-board APIs.
+Each source gets a bucket sized to its quota. A request reserves a token
+and waits for it if it will be available before the deadline, otherwise
+it is throttled and the fetcher falls back to the last good response for
+the same query. A query repeated within RESPONSE_FRESH_TTL is answered
+from that cache before any token is taken, so repeat searches (returning
+candidates, identical profiles) don't call upstream at all. Setting RATE_LIMIT_DB to a SQLite file makes the buckets
+shared by every discovery process on the host.
+
+Limits are "requests/seconds", overridable per source with e.g.
+RATE_LIMIT_ADZUNA="25/60".
+"""
+
+import asyncio
+import os
+import sqlite3
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Optional, Tuple
+
+# source -> (requests, per seconds)
+DEFAULT_LIMITS = {
+    'Adzuna': (25, 60),
+    'FindWork': (60, 60),
+    'Google Jobs': (5, 60),
+}
+RATE_LIMIT_DB = os.getenv("RATE_LIMIT_DB", "")
+# How long a fetch may wait in the queue for a token
+RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "3"))
+# How long a cached response answers a repeated query without calling upstream
+RESPONSE_FRESH_TTL = float(os.getenv("RESPONSE_FRESH_TTL", "300"))
+# How long a cached response may stand in for a throttled request
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "900"))
+RESPONSE_CACHE_SIZE = 64
+
+
+def _parse_limit(value: str) -> Tuple[float, float]:
+    requests, _, seconds = value.partition("/")
+    return float(requests), float(seconds or 1)
+
+
+def _refill(tokens: float, updated: float, now: float, rate: float, capacity: float) -> float:
+    return min(capacity, tokens + (now - updated) * rate)
+
+
+class TokenBucket:
+    """
+    In-process token bucket. Reservations may drive the balance negative,
+    which queues later callers behind earlier ones without a lock.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """Take a token; returns seconds to wait for it, or None if that exceeds max_wait"""
+        now = time.monotonic()
+        self.tokens = _refill(self.tokens, self.updated, now, self.rate, self.capacity)
+        self.updated = now
+        wait = max(0.0, (1 - self.tokens) / self.rate)
+        if wait > max_wait:
+            return None
+        self.tokens -= 1
+        return wait
+
+    def penalize(self, seconds: float):
+        """Push the next available token `seconds` into the future (after a 429)"""
+        self.tokens = min(self.tokens, 1 - seconds * self.rate)
+        self.updated = time.monotonic()
+
+
+class SQLiteTokenBucket:
+    """Token bucket stored in a SQLite row so several processes share one quota"""
+
+    def __init__(self, path: str, source: str, rate: float, capacity: float):
+        self.path = path
+        self.source = source
+        self.rate = rate
+        self.capacity = capacity
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (source TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+            db.execute(
+                "INSERT OR IGNORE INTO buckets VALUES (?, ?, ?)", (source, capacity, time.time())
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    def _update(self, change) -> Optional[float]:
+        db = self._connect()
+        try:
+            # BEGIN IMMEDIATE takes the write lock, so read-modify-write is atomic across processes
+            db.execute("BEGIN IMMEDIATE")
+            tokens, updated = db.execute(
+                "SELECT tokens, updated FROM buckets WHERE source = ?", (self.source,)
+            ).fetchone()
+            now = time.time()
+            tokens, result = change(_refill(tokens, updated, now, self.rate, self.capacity))
+            db.execute(
+                "UPDATE buckets SET tokens = ?, updated = ? WHERE source = ?", (tokens, now, self.source)
+            )
+            db.execute("COMMIT")
+            return result
+        finally:
+            db.close()
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        def take(tokens):
+            wait = max(0.0, (1 - tokens) / self.rate)
+            if wait > max_wait:
+                return tokens, None
+            return tokens - 1, wait
+        return self._update(take)
+
+    def penalize(self, seconds: float):
+        self._update(lambda tokens: (min(tokens, 1 - seconds * self.rate), None))
+
+
+class RateLimiter:
+    """Per-source buckets, a last-good-response cache and throttling counters"""
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]] = None, db_path: str = RATE_LIMIT_DB):
+        self.buckets = {}
+        for source, (requests, seconds) in (limits or DEFAULT_LIMITS).items():
+            env_name = "RATE_LIMIT_" + source.upper().replace(" ", "_")
+            if os.getenv(env_name):
+                requests, seconds = _parse_limit(os.getenv(env_name))
+            rate = requests / seconds
+            if db_path:
+                self.buckets[source] = SQLiteTokenBucket(db_path, source, rate, requests)
+            else:
+                self.buckets[source] = TokenBucket(rate, requests)
+        self.stats: Dict[str, Counter] = {}
+        # (source, query) -> (stored at, response data, response size in bytes)
+        self._responses: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._response_bytes = 0
+
+    def _count(self, source: str, event: str):
+        self.stats.setdefault(source, Counter())[event] += 1
+
+    async def _call(self, bucket, method: str, *args):
+        func = getattr(bucket, method)
+        if isinstance(bucket, SQLiteTokenBucket):
+            # The SQLite lock can block briefly under contention; keep it off the event loop
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def acquire(self, source: str, max_wait: float = RATE_LIMIT_MAX_WAIT) -> bool:
+        """Wait for a request slot; False means the source is throttled past the deadline"""
+        bucket = self.buckets.get(source)
+        if bucket is None:
+            return True
+        wait = await self._call(bucket, 'reserve', max_wait)
+        if wait is None:
+            self._count(source, 'throttled')
+            return False
+        if wait > 0:
+            self._count(source, 'queued')
+            await asyncio.sleep(wait)
+        self._count(source, 'sent')
+        return True
+
+    async def record_429(self, source: str, retry_after: Optional[str] = None):
+        """Note a 429 and hold the bucket back for Retry-After (default one refill interval)"""
+        self._count(source, 'http_429')
+        bucket = self.buckets.get(source)
+        if bucket is None:
+            return
+        try:
+            seconds = float(retry_after)
+        except (TypeError, ValueError):
+            seconds = 1 / bucket.rate
+        await self._call(bucket, 'penalize', seconds)
+
+    def store(self, source: str, query: str, data, size: int = 0):
+        """Cache a good response; `size` is its body length, tracked for cache_bytes()"""
+        key = (source, query)
+        previous = self._responses.pop(key, None)
+        if previous is not None:
+            self._response_bytes -= previous[2]
+        self._responses[key] = (time.monotonic(), data, size)
+        self._response_bytes += size
+        while len(self._responses) > RESPONSE_CACHE_SIZE:
+            self._response_bytes -= self._responses.popitem(last=False)[1][2]
+
+    def cache_size(self) -> int:
+        return len(self._responses)
+
+    def cache_bytes(self) -> int:
+        """Total body size of the cached responses, as received from upstream"""
+        return self._response_bytes
+
+    def fresh(self, source: str, query: str):
+        """Cached response recent enough to answer a repeated query without a request, else None"""
+        entry = self._responses.get((source, query))
+        if entry is None or time.monotonic() - entry[0] > RESPONSE_FRESH_TTL:
+            return None
+        self._count(source, 'cache_hit')
+        return entry[1]
+
+    def cached(self, source: str, query: str):
+        """Last good response for this query if still fresh, else None"""
+        entry = self._responses.get((source, query))
+        if entry is None or time.monotonic() - entry[0] > RESPONSE_CACHE_TTL:
+            self._count(source, 'dropped')
+            return None
+        self._count(source, 'served_from_cache')
+        return entry[1]
+
+    def report(self) -> str:
+        if not self.stats:
+            return "no API requests yet"
+        return " | ".join(
+            f"{source}: " + ", ".join(f"{event}={count}" for event, count in sorted(counts.items()))
+            for source, counts in sorted(self.stats.items())
+        )
+
+
+rate_limiter = RateLimiter()
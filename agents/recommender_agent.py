@@ -7,57 +7,168 @@ Features:
 - Production-ready error handling
 """
 
+from llm_loader import LazyLLM, seconds_since_import
 from uagents import Agent, Context
-from models import JobListingBatch, RecommendationReport
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from collections import Counter
+from models import BatchEncodings, ErrorReport, JobListingBatch, RecommendationReport, job_version
+from collections import Counter, OrderedDict
+from batch_codec import SUPPORTED_ENCODINGS, decode_jobs
+from job_text import NormalizedText, job_match_text
+from skill_graph import skill_graph
+from scoring_service import score_batches
+from salary import rank_by_salary
+from profiling import profiled, profiler, register_profiling
+from memory_monitor import MemoryMonitor, deep_sizeof, register_memory_monitor
+import asyncio
+import itertools
 import os
+import time
 from config.agent_addresses import CANDIDATE_AGENT_ADDRESS
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Batch queue / LLM worker pool settings
+BATCH_QUEUE_SIZE = int(os.getenv("BATCH_QUEUE_SIZE", "100"))
+LLM_WORKERS = int(os.getenv("LLM_WORKERS", "4"))
+MAX_BATCHES_PER_PASS = int(os.getenv("MAX_BATCHES_PER_PASS", "32"))
+# Latency budget: a report is due this many seconds after its batch arrives. The LLM
+# only gets the time left over, and is skipped outright when the queue is this deep
+REPORT_DEADLINE_SECONDS = float(os.getenv("REPORT_DEADLINE_SECONDS", "12"))
+MIN_LLM_SECONDS = float(os.getenv("MIN_LLM_SECONDS", "2"))
+LLM_SKIP_QUEUE_DEPTH = int(os.getenv("LLM_SKIP_QUEUE_DEPTH", "20"))
+
 agent = Agent()
+register_profiling(agent)
+
+# Created on startup, inside the agent's event loop
+batch_queue = None
+llm_slots = None
+_batch_sequence = itertools.count()
+queue_metrics = {
+    'queue_depth': 0,
+    'batches_processed': 0,
+    'total_wait': 0.0,
+    'max_wait': 0.0,
+    'stale_dropped': 0,
+    'reports_cancelled': 0,
+    'ai_reports': 0,
+    'local_reports': 0,
+    'llm_timeouts': 0,
+    'delta_reports': 0
+}
+# Discovery workers already told which batch encodings this agent decodes
+encodings_advertised = set()
+# candidate id -> newest batch generation received; older batches are dropped
+latest_generations = {}
+# candidate id -> (generation, task) of the report being generated
+report_tasks = {}
+
+
+def _build_report_chain():
+    """Import LangChain and build the report chain (runs in a worker thread)"""
+    from langchain_openai import ChatOpenAI
+    from langchain_core.prompts import ChatPromptTemplate
+    
+    llm = ChatOpenAI(
+        model="gpt-4o-mini", 
+        temperature=0.7,
+        openai_api_key=OPENAI_API_KEY,
+        max_retries=2,
+        request_timeout=30
+    )
+    return ChatPromptTemplate.from_messages(COMPREHENSIVE_REPORT_MESSAGES) | llm
+
+
+# Built lazily so the agent accepts messages while LangChain is still importing
+report_chain = LazyLLM("Report LLM", _build_report_chain)
+
+# Local analyses keyed by (profile fingerprint, job key); a profile that comes back
+# with the same skills/experience reuses them instead of recomputing
+ANALYSIS_CACHE_SIZE = int(os.getenv("ANALYSIS_CACHE_SIZE", "10000"))
+analysis_cache = OrderedDict()
 
-llm = ChatOpenAI(
-    model="gpt-4o-mini", 
-    temperature=0.7,
-    openai_api_key=OPENAI_API_KEY,
-    max_retries=2,
-    request_timeout=30
-)
 
-def analyze_skill_match_local(job: dict, candidate_skills: list) -> dict:
+memory_monitor = MemoryMonitor()
+memory_monitor.gauge("batch_queue", lambda: batch_queue.qsize() if batch_queue is not None else 0)
+memory_monitor.gauge("report_tasks", lambda: len(report_tasks))
+memory_monitor.gauge("latest_generations", lambda: len(latest_generations))
+memory_monitor.gauge("analysis_cache", lambda: len(analysis_cache))
+memory_monitor.gauge("analysis_cache_kb", lambda: deep_sizeof(analysis_cache) // 1024)
+register_memory_monitor(agent, memory_monitor, lambda: dict(queue_metrics))
+
+
+def _job_key(job: dict) -> str:
+    return job.get('job_id') or f"{job.get('title', '')}-{job.get('company', '')}".lower()
+
+
+def _cached_analysis(fingerprint: str, job: dict):
+    if not fingerprint:
+        return None
+    key = (fingerprint, _job_key(job))
+    cached = analysis_cache.get(key)
+    if cached is not None:
+        analysis_cache.move_to_end(key)
+    return cached
+
+
+def _store_analysis(fingerprint: str, job: dict, skill_analysis: dict, readiness: dict):
+    if not fingerprint:
+        return
+    analysis_cache[(fingerprint, _job_key(job))] = (skill_analysis, readiness)
+    if len(analysis_cache) > ANALYSIS_CACHE_SIZE:
+        analysis_cache.popitem(last=False)
+
+
+def analyze_skill_match_local(
+    job: dict,
+    candidate_skills: list,
+    job_text: NormalizedText = None,
+    skills_lower: list = None,
+    expanded_skills: dict = None
+) -> dict:
     """
     Fast local skill analysis without AI calls.
     Matches candidate skills against job requirements.
+    The job's text is the `match_text` discovery normalized at ingest; it and
+    the lowercased skills can be passed in so a batch wraps each only once. Missing requirements that are
+    related to the candidate's skills in the skill graph earn partial credit.
     """
     job_requirements = job.get('requirements', [])
-    job_description = job.get('description', '').lower()
+    if job_text is None:
+        job_text = job_match_text(job)
+    if skills_lower is None:
+        skills_lower = [skill.lower() for skill in candidate_skills]
+    if expanded_skills is None:
+        expanded_skills = skill_graph.expand(skills_lower)
+    requirements_lower = [req.lower() for req in job_requirements]
     
     matching_skills = []
     missing_skills = []
     
-    for skill in candidate_skills:
-        skill_lower = skill.lower()
-        if any(skill_lower in req.lower() or req.lower() in skill_lower for req in job_requirements):
+    for skill, skill_lower in zip(candidate_skills, skills_lower):
+        if any(skill_lower in req_lower or req_lower in skill_lower for req_lower in requirements_lower):
             matching_skills.append(skill)
-        elif skill_lower in job_description:
+        elif job_text.contains(skill_lower):
             matching_skills.append(skill)
     
-    for req in job_requirements[:8]: 
-        req_lower = req.lower()
-        if not any(skill.lower() in req_lower or req_lower in skill.lower() for skill in candidate_skills):
+    adjacent_skills = []
+    partial_credit = 0.0
+    for req, req_lower in zip(job_requirements[:8], requirements_lower):
+        if not any(skill_lower in req_lower or req_lower in skill_lower for skill_lower in skills_lower):
             missing_skills.append(req)
+            credit = expanded_skills.get(req_lower.strip(), 0.0)
+            if credit:
+                adjacent_skills.append(req)
+                partial_credit += credit
     
     total_skills = len(matching_skills) + len(missing_skills)
     if total_skills > 0:
-        skill_match_pct = (len(matching_skills) / total_skills) * 100
+        skill_match_pct = ((len(matching_skills) + partial_credit) / total_skills) * 100
     else:
         skill_match_pct = 50 
     
     return {
         'matching_skills': matching_skills[:8],
         'missing_skills': missing_skills[:5],
+        'adjacent_skills': adjacent_skills[:5],  # Missing but related to skills you have
         'skill_match_percentage': round(skill_match_pct, 1)
     }
 
@@ -144,7 +255,7 @@ def calculate_readiness_score_local(
     }
 
 
-COMPREHENSIVE_REPORT_PROMPT = ChatPromptTemplate.from_messages([
+COMPREHENSIVE_REPORT_MESSAGES = [
     ("system", """You are an expert career advisor and technical recruiter creating a comprehensive, personalized job search report.
 
 Your task: Analyze all job opportunities together and create ONE cohesive, actionable report that helps the candidate succeed.
@@ -220,19 +331,39 @@ End with genuine encouragement and confidence-building message.
 ---
 
 Generate the complete report now:""")
-])
+]
+
+
+def _local_report(job_analyses: list, candidate_skills: list, experience_years: int, reason: str) -> tuple:
+    queue_metrics['local_reports'] += 1
+    return generate_fallback_report(job_analyses, candidate_skills, experience_years, reason), "local"
 
 
 async def generate_comprehensive_ai_report(
     job_analyses: list,
     candidate_skills: list,
     experience_years: int,
-    ctx: Context
-) -> str:
+    ctx: Context,
+    deadline: float = None
+) -> tuple:
     """
     Generate comprehensive report with single AI call.
     Synthesizes all job data into actionable insights.
+    The LLM gets whatever is left of the batch's latency budget (`deadline`,
+    a time.monotonic() value); if that is too little, the queue is backed up
+    or the call overruns, the templated local report is used instead.
+    Returns (report text, "ai" or "local").
     """
+    queue_depth = batch_queue.qsize() if batch_queue is not None else 0
+    if queue_depth >= LLM_SKIP_QUEUE_DEPTH:
+        ctx.logger.warning(f"🚦 Queue depth {queue_depth}, skipping LLM for a local report")
+        return _local_report(job_analyses, candidate_skills, experience_years, "high demand")
+    
+    budget = (deadline - time.monotonic()) if deadline is not None else REPORT_DEADLINE_SECONDS
+    if budget < MIN_LLM_SECONDS:
+        ctx.logger.warning(f"⏱️ Only {budget:.1f}s left in the latency budget, using local report")
+        return _local_report(job_analyses, candidate_skills, experience_years, "high demand")
+    
     try:
         # job summaries 
         job_summaries = []
@@ -269,11 +400,14 @@ async def generate_comprehensive_ai_report(
         skills_text = ', '.join(candidate_skills) if candidate_skills else 'Not specified - general technical background'
         missing_skills_text = ', '.join(common_missing) if common_missing else 'None identified - strong skill coverage'
         
-        chain = COMPREHENSIVE_REPORT_PROMPT | llm
+        chain = report_chain.get_if_ready()
+        if chain is None:
+            ctx.logger.warning("⏳ LLM client still warming up, using local report")
+            return _local_report(job_analyses, candidate_skills, experience_years, "warming up")
         
-        ctx.logger.info("🤖 Calling OpenAI for comprehensive report generation...")
+        ctx.logger.info(f"🤖 Calling OpenAI for comprehensive report generation ({budget:.1f}s budget)...")
         
-        response = await chain.ainvoke({
+        response = await asyncio.wait_for(chain.ainvoke({
             "experience_years": experience_years,
             "candidate_skills": skills_text,
             "job_analyses": '\n'.join(job_summaries),
@@ -282,75 +416,240 @@ async def generate_comprehensive_ai_report(
             "ready_count": ready_count,
             "remote_count": remote_count,
             "common_missing_skills": missing_skills_text
-        })
+        }), timeout=budget)
         
         ctx.logger.info("✅ AI report generated successfully")
-        return response.content
+        queue_metrics['ai_reports'] += 1
+        return response.content, "ai"
     
+    except asyncio.TimeoutError:
+        queue_metrics['llm_timeouts'] += 1
+        ctx.logger.warning(f"⏱️ LLM missed its {budget:.1f}s budget, using local report")
+        return _local_report(job_analyses, candidate_skills, experience_years, "slow response")
     except Exception as e:
         ctx.logger.error(f"❌ AI report generation failed: {e}")
-        return generate_fallback_report(job_analyses, candidate_skills, experience_years)
+        return _local_report(job_analyses, candidate_skills, experience_years, "unavailable")
 
-# generating fallback report if the main path fails
+# templated local report, used when the LLM is unavailable, slow or overloaded
 def generate_fallback_report(
     job_analyses: list, 
     candidate_skills: list, 
-    experience_years: int
+    experience_years: int,
+    reason: str = ""
 ) -> str:
     """
-    Fallback report if AI fails.
-    Provides basic but useful information.
+    Full report built from the local job analyses without AI:
+    summary, prioritized applications, a skill roadmap from the most
+    common gaps and an application strategy.
     """
+    total = len(job_analyses)
+    ready = [a for a in job_analyses if a['readiness']['score'] >= 65]
+    prepare = [a for a in job_analyses if 50 <= a['readiness']['score'] < 65]
+    remote_count = sum(1 for a in job_analyses if a['job'].get('remote', False))
+    avg_readiness = sum(a['readiness']['score'] for a in job_analyses) / total if total else 0
+    
+    matched = Counter(skill.lower() for a in job_analyses for skill in a['skill_analysis']['matching_skills'])
+    missing = Counter(skill for a in job_analyses for skill in a['skill_analysis']['missing_skills'])
+    adjacent = {skill for a in job_analyses for skill in a['skill_analysis'].get('adjacent_skills', [])}
+    
+    if ready:
+        outlook = f"**{len(ready)} of {total}** positions are a strong fit right now"
+    elif prepare:
+        outlook = f"**{len(prepare)} of {total}** positions are within reach with some preparation"
+    else:
+        outlook = f"these {total} positions mostly call for skills you are still building"
+    
     lines = [
         "## 🎯 YOUR JOB MATCHES REPORT",
-        "",
-        "### Executive Summary",
-        f"We've analyzed {len(job_analyses)} job opportunities that match your profile. "
-        f"With {experience_years} years of experience, you have several promising opportunities ahead.",
-        "",
-        "### Key Recommendations",
-        "1. **Apply immediately** to jobs with a readiness score of 65 or higher",
-        "2. **Customize each application** highlighting your relevant skills and experience",
-        "3. **Address skill gaps** by starting online courses or building portfolio projects",
-        "",
-        "### Skills Development",
-        "Focus on developing the most commonly required skills across these positions:",
     ]
+    if reason:
+        lines.append(f"*Generated from our local analysis ({reason}); full AI insights are skipped for this report.*")
+    lines.extend([
+        "",
+        "### 📌 Executive Summary",
+        f"We analyzed **{total}** opportunities against your profile. With **{experience_years} years** "
+        f"of experience, {outlook}. Your average readiness is **{avg_readiness:.0f}/100** and "
+        f"**{remote_count}** of the roles are remote-friendly.",
+    ])
+    if matched:
+        strengths = ', '.join(f"**{skill}**" for skill, _ in matched.most_common(4))
+        lines.append(f"Your strongest selling points across these roles: {strengths}.")
     
-    # Find common missing skills
-    all_missing = []
-    for a in job_analyses:
-        all_missing.extend(a['skill_analysis']['missing_skills'])
+    lines.extend(["", "### 🚀 Prioritized Applications"])
+    priorities = (ready or prepare or job_analyses)[:5]
+    for i, analysis in enumerate(priorities, 1):
+        job = analysis['job']
+        gaps = analysis['skill_analysis']['missing_skills'][:2]
+        gap_note = f" - brush up on {', '.join(gaps)}" if gaps else " - no major gaps"
+        lines.append(
+            f"{i}. **{job.get('title', 'N/A')}** at {job.get('company', 'N/A')} "
+            f"(readiness {analysis['readiness']['score']}/100, {analysis['readiness']['level']}){gap_note}"
+        )
     
-    common_skills = Counter(all_missing).most_common(3)
-    for skill, count in common_skills:
-        lines.append(f"- **{skill}** (required in {count} positions)")
+    lines.extend(["", "### 📚 Skills Development Roadmap"])
+    if missing:
+        lines.append("The skills that would unlock the most of these positions:")
+        for skill, count in missing.most_common(3):
+            if skill in adjacent:
+                note = "builds on skills you already have, so expect a short ramp-up"
+            else:
+                note = "start with the official documentation and a small portfolio project"
+            category = skill_graph.category(skill)
+            label = f" ({category})" if category else ""
+            lines.append(f"- **{skill}**{label} - required in {count} of {total} positions; {note}")
+    else:
+        lines.append("- No recurring skill gaps - your skill set covers these roles well. Deepen your strongest skills.")
     
     lines.extend([
         "",
-        "### Application Strategy",
-        "- Start with the highest readiness score jobs",
-        "- Research each company before applying",
-        "- Tailor your resume to each job's requirements",
-        "- Prepare examples demonstrating your skills",
+        "### 📝 Application Strategy",
+        "- Apply to the prioritized roles above first, starting with the highest readiness score",
+    ])
+    if matched:
+        lines.append(f"- Lead your resume with concrete results using {', '.join(skill for skill, _ in matched.most_common(3))}")
+    if missing:
+        lines.append(f"- Address gaps openly: mention what you are learning ({missing.most_common(1)[0][0]}) and how fast you pick up tools")
+    lines.extend([
+        "- Research each company and tailor the first lines of your cover letter to their product",
         "",
-        "### Next Steps",
+        "### ➡️ Next Steps",
         "Review the detailed job breakdown below and start applying today!",
         ""
     ])
     
     return "\n".join(lines)
 
+def create_delta_report(job_analyses: list, unchanged_count: int) -> str:
+    """
+    Short report for a returning candidate with an unchanged profile: only
+    the postings that are new or changed since their last report, built
+    locally without an AI call.
+    """
+    lines = ["# 🆕 WHAT'S NEW SINCE YOUR LAST SEARCH", ""]
+    if not job_analyses:
+        lines.extend([
+            f"No new or updated postings match your profile yet"
+            f"{f' - the {unchanged_count} we recommended before are unchanged' if unchanged_count else ''}.",
+            "",
+            "*Check back in a day or two, or send an updated resume to widen the search.*",
+            ""
+        ])
+        return "\n".join(lines)
+    
+    lines.extend([
+        f"**{len(job_analyses)}** new or updated posting(s) match your profile"
+        f"{f' ({unchanged_count} from your last report are unchanged)' if unchanged_count else ''}.",
+        ""
+    ])
+    for i, analysis in enumerate(job_analyses[:5], 1):
+        job = analysis['job']
+        gaps = analysis['skill_analysis']['missing_skills'][:2]
+        lines.extend([
+            f"**{i}. {job.get('title', 'N/A')}** at {job.get('company', 'N/A')}",
+            f"- Readiness {analysis['readiness']['score']}/100 ({analysis['readiness']['level']}) | "
+            f"Compatibility {analysis.get('compatibility', 0)}/100",
+            f"- {job.get('location', 'N/A')}{' (Remote)' if job.get('remote') else ''} | "
+            f"Salary: {job.get('salary', 'Not specified')}",
+            f"- {'Brush up on ' + ', '.join(gaps) if gaps else 'No major skill gaps'} | "
+            f"[Apply Here]({job.get('url', '#')})",
+            ""
+        ])
+    if len(job_analyses) > 5:
+        lines.append(f"*...and {len(job_analyses) - 5} more. Send an updated resume for a full report.*")
+    return "\n".join(lines)
+
+
+def analyze_jobs_local(
+    jobs: list,
+    candidate_skills: list,
+    experience_years: int,
+    fingerprint: str = "",
+    job_texts: dict = None,
+    compatibility=None
+) -> tuple:
+    """
+    Run local skill/readiness analysis for one candidate's jobs.
+    `job_texts` maps job keys to NormalizedText and can be shared across
+    candidates so a job seen in several batches is normalized once.
+    `compatibility` holds the jobs' scores from scoring_service when they
+    were computed for a whole pass; otherwise they are scored here.
+    Returns (job_analyses sorted by readiness then compatibility, cache_hits).
+    """
+    if job_texts is None:
+        job_texts = {}
+    jobs = jobs[:15]  # Process up to 15 jobs
+    if compatibility is None:
+        compatibility = score_batches([(jobs, candidate_skills)])[0]
+    
+    # Normalize and expand skills once for the whole batch
+    skills_lower = [skill.lower() for skill in candidate_skills]
+    expanded_skills = skill_graph.expand(skills_lower)
+    
+    job_analyses = []
+    cache_hits = 0
+    for job, compatibility_score in zip(jobs, compatibility):
+        cached = _cached_analysis(fingerprint, job)
+        if cached is not None:
+            skill_analysis, readiness = cached
+            cache_hits += 1
+        else:
+            key = _job_key(job)
+            job_text = job_texts.get(key)
+            if job_text is None:
+                job_text = job_texts[key] = job_match_text(job)
+            skill_analysis = analyze_skill_match_local(job, candidate_skills, job_text, skills_lower, expanded_skills)
+            readiness = calculate_readiness_score_local(skill_analysis, experience_years, job)
+            _store_analysis(fingerprint, job, skill_analysis, readiness)
+        
+        job_analyses.append({
+            'job': job,
+            'skill_analysis': skill_analysis,
+            'readiness': readiness,
+            'compatibility': round(float(compatibility_score), 1)
+        })
+    
+    # Sort by readiness score (best matches first); compatibility, then pay, break ties
+    job_analyses.sort(
+        key=lambda x: (x['readiness']['score'], x['compatibility'], x['job'].get('salary_max') or 0),
+        reverse=True
+    )
+    return job_analyses, cache_hits
+
+
+def analyze_batches_local(entries: list) -> list:
+    """
+    Local analysis for many queued candidate batches in a single pass.
+    Normalized job text is shared across all candidates in the pass, and
+    compatibility scores for every batch come from one vectorized call.
+    """
+    job_texts = {}
+    compatibility = score_batches((entry['jobs'][:15], entry['candidate_skills']) for entry in entries)
+    return [
+        analyze_jobs_local(
+            entry['jobs'],
+            entry['candidate_skills'],
+            entry['experience_years'],
+            entry['fingerprint'],
+            job_texts,
+            scores
+        )
+        for entry, scores in zip(entries, compatibility)
+    ]
+
+
 async def create_optimized_report(
     jobs: list, 
     candidate_skills: list, 
     experience_years: int,
-    ctx: Context
+    ctx: Context,
+    fingerprint: str = "",
+    local_analysis: tuple = None,
+    deadline: float = None
 ) -> str:
     """
     Create comprehensive report with optimized workflow:
-    1. Fast local analysis for all jobs
-    2. Single AI call for strategic insights
+    1. Fast local analysis for all jobs (skipped if `local_analysis` is given)
+    2. Single AI call for strategic insights, within the latency budget
     3. Assemble complete report
     """
     
@@ -363,32 +662,21 @@ async def create_optimized_report(
 • Try again in a few days as new positions are posted daily
 • Consider related job titles or industries"""
     
-    
-    ctx.logger.info(f"⚡ Running local analysis on {len(jobs)} jobs...")
-    
-    job_analyses = []
-    for job in jobs[:15]:  # Process up to 15 jobs
-        skill_analysis = analyze_skill_match_local(job, candidate_skills)
-        readiness = calculate_readiness_score_local(skill_analysis, experience_years, job)
-        
-        job_analyses.append({
-            'job': job,
-            'skill_analysis': skill_analysis,
-            'readiness': readiness
-        })
-    
-    # Sort by readiness score (best matches first)
-    job_analyses.sort(key=lambda x: x['readiness']['score'], reverse=True)
+    if local_analysis is None:
+        ctx.logger.info(f"⚡ Running local analysis on {len(jobs)} jobs...")
+        local_analysis = analyze_jobs_local(jobs, candidate_skills, experience_years, fingerprint)
+    job_analyses, cache_hits = local_analysis
     
     top_score = job_analyses[0]['readiness']['score'] if job_analyses else 0
-    ctx.logger.info(f"✅ Local analysis complete. Top match score: {top_score}/100")
+    ctx.logger.info(f"✅ Local analysis complete. Top match score: {top_score}/100 (cached: {cache_hits})")
     
     
-    ai_generated_report = await generate_comprehensive_ai_report(
+    ai_generated_report, report_source = await generate_comprehensive_ai_report(
         job_analyses,
         candidate_skills,
         experience_years,
-        ctx
+        ctx,
+        deadline
     )
     
     
@@ -421,6 +709,7 @@ async def create_optimized_report(
             f"- **Location:** {job.get('location', 'N/A')} {'🌍 (Remote)' if job.get('remote') else '🏢 (On-site)'}",
             f"- **Salary:** {job.get('salary', 'Not specified')}",
             f"- **Skill Match:** {skill_analysis['skill_match_percentage']}%",
+            f"- **Compatibility:** {analysis.get('compatibility', 0)}/100",
             f"- **Application Link:** [Apply Here]({job.get('url', '#')})",
             ""
         ])
@@ -441,6 +730,12 @@ async def create_optimized_report(
                 ""
             ])
         
+        if skill_analysis.get('adjacent_skills'):
+            report_lines.extend([
+                f"**🔗 Close to What You Know:** {', '.join(skill_analysis['adjacent_skills'][:4])}",
+                ""
+            ])
+        
         report_lines.append("**💡 Why This Match:**")
         for reason in readiness['reasons']:
             report_lines.append(f"- {reason}")
@@ -460,9 +755,26 @@ async def create_optimized_report(
         f"- **Remote Opportunities:** {remote_count}/{len(job_analyses)}",
         f"- **Total Jobs Analyzed:** {len(jobs)}",
         "",
+    ])
+    
+    best_paying = rank_by_salary((analysis['job'] for analysis in job_analyses), 3)
+    if best_paying:
+        report_lines.append("**💰 Best-Paying Matches:**")
+        for job in best_paying:
+            annualized = ""
+            if job.get('salary_period') != 'year' and job.get('salary_currency') == 'USD':
+                annualized = f" (~${job['salary_max']:,}/yr)"
+            report_lines.append(
+                f"- {job.get('title', 'N/A')} at {job.get('company', 'N/A')}: "
+                f"{job.get('salary', 'Not specified')}{annualized}"
+            )
+        report_lines.append("")
+    
+    report_lines.extend([
         "=" * 70,
         "",
-        "*Report generated using AI-powered analysis. Good luck with your applications!* 🚀",
+        f"*Report generated using {'AI-powered' if report_source == 'ai' else 'local'} analysis. "
+        f"Good luck with your applications!* 🚀",
         ""
     ])
     
@@ -470,18 +782,49 @@ async def create_optimized_report(
 
 
 @agent.on_message(model=JobListingBatch)
+@profiled
 async def handle_job_batch(ctx: Context, sender: str, msg: JobListingBatch):
     """
     Handle incoming job batch from Scraper Agent.
-    Generate personalized recommendations and send to Candidate Agent.
+    Batches are queued; the dispatcher analyzes queued batches together and
+    generates reports through a bounded pool of LLM workers.
     """
     
     candidate_id = msg.candidate_id
-    jobs = msg.jobs
     total_count = msg.total_count
     
-    candidate_skills = getattr(msg, 'candidate_skills', [])
-    experience_years = getattr(msg, 'experience_years', 2)
+    try:
+        jobs = decode_jobs(msg.encoding, msg.payload, msg.jobs)
+    except Exception as e:
+        ctx.logger.error(f"❌ Could not decode job batch ({msg.encoding}): {e}")
+        # Without a reply the candidate's admission slot stays held until PIPELINE_TIMEOUT
+        await ctx.send(CANDIDATE_AGENT_ADDRESS, ErrorReport(
+            candidate_id=candidate_id,
+            content="Couldn't read the job listings found for you, please try again",
+            generation=msg.generation
+        ))
+        return
+    
+    if sender not in encodings_advertised:
+        # Until a worker hears this, it sends the plain job list alongside any compact payload
+        encodings_advertised.add(sender)
+        await ctx.send(sender, BatchEncodings(encodings=list(SUPPORTED_ENCODINGS)))
+    
+    candidate_skills = msg.candidate_skills
+    experience_years = msg.experience_years
+    
+    if msg.generation < latest_generations.get(candidate_id, 0):
+        queue_metrics['stale_dropped'] += 1
+        ctx.logger.info(f"🗑️ Dropping batch for an older input of {candidate_id[:20]}... (generation {msg.generation})")
+        return
+    latest_generations[candidate_id] = msg.generation
+    
+    # A newer input makes the report still being written for this candidate useless
+    running = report_tasks.get(candidate_id)
+    if running is not None and running[0] < msg.generation and not running[1].done():
+        running[1].cancel()
+        queue_metrics['reports_cancelled'] += 1
+        ctx.logger.info(f"🛑 Cancelled report for generation {running[0]} of {candidate_id[:20]}...")
     
     ctx.logger.info("=" * 70)
     ctx.logger.info("📦 JOB BATCH RECEIVED FROM SCRAPER")
@@ -490,10 +833,28 @@ async def handle_job_batch(ctx: Context, sender: str, msg: JobListingBatch):
     ctx.logger.info(f"📊 Total Jobs: {total_count}")
     ctx.logger.info(f"🎯 Candidate Skills: {len(candidate_skills)}")
     ctx.logger.info(f"📈 Experience: {experience_years} years")
-    ctx.logger.info(f"⚡ Processing Strategy: Local analysis + Single AI call")
+    ctx.logger.info(f"🔑 Profile fingerprint: {msg.profile_fingerprint or 'n/a'}")
+    ctx.logger.info(f"⚡ Processing Strategy: Queued local analysis + pooled AI calls")
+    
+    if not jobs and msg.delta:
+        # Nothing new for a returning candidate: answer right away, no queue or LLM
+        queue_metrics['delta_reports'] += 1
+        await ctx.send(CANDIDATE_AGENT_ADDRESS, RecommendationReport(
+            candidate_id=candidate_id,
+            report=create_delta_report([], msg.unchanged_count),
+            top_matches=[],
+            generation=msg.generation
+        ))
+        ctx.logger.info(f"🆕 No new postings for {candidate_id[:20]}..., sent short update")
+        return
     
     if not jobs:
         ctx.logger.warning("⚠️ Empty job batch received")
+        await ctx.send(CANDIDATE_AGENT_ADDRESS, ErrorReport(
+            candidate_id=candidate_id,
+            content="No job listings came back for your profile, try adding more skills",
+            generation=msg.generation
+        ))
         return
 
     ctx.logger.info(f"📋 Sample jobs:")
@@ -502,31 +863,132 @@ async def handle_job_batch(ctx: Context, sender: str, msg: JobListingBatch):
     if len(jobs) > 3:
         ctx.logger.info(f"  ... and {len(jobs) - 3} more")
     
-    ctx.logger.info("🎨 Generating personalized report...")
-    report_text = await create_optimized_report(
-        jobs, 
-        candidate_skills, 
-        experience_years, 
-        ctx
-    )
-    
-    ctx.logger.info(f"✅ Report generated successfully ({len(report_text)} characters)")
-    
-    top_titles = [job.get('title', 'N/A') for job in jobs[:5]]
+    entry = {
+        'candidate_id': candidate_id,
+        'jobs': jobs,
+        'candidate_skills': candidate_skills,
+        'experience_years': experience_years,
+        'fingerprint': msg.profile_fingerprint,
+        'priority': msg.priority,
+        'generation': msg.generation,
+        'delta': msg.delta,
+        'unchanged_count': msg.unchanged_count,
+        'enqueued_at': time.monotonic()
+    }
     
-    report = RecommendationReport(
-        candidate_id=candidate_id,
-        report=report_text,
-        top_matches=top_titles
-    )
+    # put() blocks while the queue is full, which pushes back on the sender
+    await batch_queue.put((-msg.priority, next(_batch_sequence), entry))
+    ctx.logger.info(f"📥 Batch queued (queue depth: {batch_queue.qsize()})")
 
+
+@profiled
+async def send_batch_report(ctx: Context, entry: dict, local_analysis: tuple):
+    """Generate the report for one queued batch and send it to the Candidate Agent"""
+    jobs = entry['jobs']
     try:
+        if entry['delta']:
+            ctx.logger.info(f"🆕 Generating delta report for {entry['candidate_id'][:20]}...")
+            report_text = create_delta_report(local_analysis[0], entry['unchanged_count'])
+            queue_metrics['delta_reports'] += 1
+            shown = local_analysis[0][:5]
+        else:
+            ctx.logger.info(f"🎨 Generating personalized report for {entry['candidate_id'][:20]}...")
+            report_text = await create_optimized_report(
+                jobs,
+                entry['candidate_skills'],
+                entry['experience_years'],
+                ctx,
+                entry['fingerprint'],
+                local_analysis,
+                entry['enqueued_at'] + REPORT_DEADLINE_SECONDS
+            )
+            shown = local_analysis[0][:10]
+        
+        ctx.logger.info(f"✅ Report generated successfully ({len(report_text)} characters)")
+        
+        top_titles = [job.get('title', 'N/A') for job in jobs[:5]]
+        # Postings the candidate has now seen, so their next search can be a delta
+        job_versions = {
+            analysis['job']['job_id']: job_version(analysis['job'])
+            for analysis in shown
+            if analysis['job'].get('job_id') and analysis['job'].get('source') != 'Fallback'
+        }
+        
+        report = RecommendationReport(
+            candidate_id=entry['candidate_id'],
+            report=report_text,
+            top_matches=top_titles,
+            generation=entry['generation'],
+            job_versions=job_versions
+        )
+        
         await ctx.send(CANDIDATE_AGENT_ADDRESS, report)
         ctx.logger.info("✅ Report sent to Candidate Agent successfully")
         ctx.logger.info("=" * 70)
+    except asyncio.CancelledError:
+        ctx.logger.info(f"🛑 Report for {entry['candidate_id'][:20]}... abandoned for a newer input")
+        raise
     except Exception as e:
         ctx.logger.error(f"❌ Failed to send report: {e}")
 
+
+def _report_done(candidate_id: str, task: asyncio.Task):
+    # Runs even for tasks cancelled before they started, so the slot is never leaked
+    llm_slots.release()
+    if report_tasks.get(candidate_id, (None, None))[1] is task:
+        del report_tasks[candidate_id]
+
+
+def is_stale(entry: dict) -> bool:
+    return entry['generation'] < latest_generations.get(entry['candidate_id'], 0)
+
+
+async def dispatch_batches(ctx: Context):
+    """
+    Drain the batch queue: analyze every waiting batch locally in one pass,
+    then hand them to the LLM worker pool in priority order.
+    """
+    while True:
+        entries = [(await batch_queue.get())[2]]
+        while len(entries) < MAX_BATCHES_PER_PASS and not batch_queue.empty():
+            entries.append(batch_queue.get_nowait()[2])
+        
+        # Batches superseded while they waited in the queue are never analyzed
+        current = [entry for entry in entries if not is_stale(entry)]
+        queue_metrics['stale_dropped'] += len(entries) - len(current)
+        entries = current
+        if not entries:
+            continue
+        
+        try:
+            now = time.monotonic()
+            waits = [now - entry['enqueued_at'] for entry in entries]
+            queue_metrics['batches_processed'] += len(entries)
+            queue_metrics['total_wait'] += sum(waits)
+            queue_metrics['max_wait'] = max(queue_metrics['max_wait'], max(waits))
+            queue_metrics['queue_depth'] = batch_queue.qsize()
+            
+            analyses = analyze_batches_local(entries)
+            ctx.logger.info(
+                f"⚡ Analyzed {len(entries)} batch(es) in one pass | "
+                f"queue depth: {queue_metrics['queue_depth']} | "
+                f"max wait: {max(waits):.2f}s | "
+                f"avg wait: {queue_metrics['total_wait'] / queue_metrics['batches_processed']:.2f}s"
+            )
+            
+            for entry, local_analysis in zip(entries, analyses):
+                # Wait for a free LLM worker; while all are busy the queue fills up
+                await llm_slots.acquire()
+                if is_stale(entry):
+                    llm_slots.release()
+                    queue_metrics['stale_dropped'] += 1
+                    continue
+                task = asyncio.create_task(send_batch_report(ctx, entry, local_analysis))
+                report_tasks[entry['candidate_id']] = (entry['generation'], task)
+                task.add_done_callback(lambda done, candidate_id=entry['candidate_id']: _report_done(candidate_id, done))
+        except Exception as e:
+            ctx.logger.error(f"❌ Batch dispatch failed: {e}")
+
 # AGENT main events 
 
 @agent.on_event("startup")
@@ -542,12 +1004,25 @@ async def startup(ctx: Context):
     ctx.logger.info("   • Fast local skill matching")
     ctx.logger.info("   • Single AI call for comprehensive report")
     ctx.logger.info("   • Batch processing (up to 15 jobs)")
+    ctx.logger.info("   • Queued multi-candidate analysis with pooled AI calls")
     ctx.logger.info("   • Smart fallback handling")
     ctx.logger.info("   • Personalized career insights")
     ctx.logger.info("")
     ctx.logger.info(f"🎯 Target Candidate Agent: {CANDIDATE_AGENT_ADDRESS}")
+    ctx.logger.info(f"📥 Batch queue size: {BATCH_QUEUE_SIZE} | LLM workers: {LLM_WORKERS}")
+    ctx.logger.info(f"🔬 Profiling: {profiler.report()}")
+    ctx.logger.info(
+        f"⏱️ Report deadline: {REPORT_DEADLINE_SECONDS:.0f}s | local reports when the queue reaches {LLM_SKIP_QUEUE_DEPTH}"
+    )
     ctx.logger.info("=" * 70)
     
+    global batch_queue, llm_slots
+    batch_queue = asyncio.PriorityQueue(maxsize=BATCH_QUEUE_SIZE)
+    llm_slots = asyncio.Semaphore(LLM_WORKERS)
+    asyncio.create_task(dispatch_batches(ctx))
+    asyncio.create_task(warm_up_llm(ctx))
+    ctx.logger.info(f"⏱️ Ready to accept batches {seconds_since_import():.2f}s after import")
+    
     # Validate API key
     if OPENAI_API_KEY == "your-api-key-here":
         ctx.logger.warning("⚠️  WARNING: OpenAI API key not configured!")
@@ -557,6 +1032,16 @@ async def startup(ctx: Context):
         ctx.logger.info("✅ OpenAI API key configured")
 
 
+async def warm_up_llm(ctx: Context):
+    """Load the LLM stack in the background; reports use the local fallback until it is ready"""
+    ctx.logger.info("🔥 Warming up LLM client in the background...")
+    await report_chain.warmup()
+    if report_chain.ready:
+        ctx.logger.info(f"✅ {report_chain.report()}")
+    else:
+        ctx.logger.warning(f"⚠️ {report_chain.report()} - reports will use fallback mode")
+
+
 @agent.on_event("shutdown")
 async def shutdown(ctx: Context):
     """Agent shutdown event"""
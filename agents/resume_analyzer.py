@@ -0,0 +1,183 @@
+"""
+Resume analyzer.
+Lowercases the text once and derives skill keywords, experience (falling
+back to employment date ranges), work location, resume indicators and the
+remote preference together, replacing the separate passes made by
+extract_skills_from_text, extract_experience_years, extract_work_location
+and is_resume_text (kept in benchmarks/bench_resume_analyzer.py as the
+reference). Patterns are precompiled, every search stops at its first hit,
+and regexes that re can't skip ahead on are guarded by a substring check.
+Results match those functions, except that date ranges now fill in
+experience when no "N years" phrase is present.
+
+Keyword substring checks dominate the cost and are the same work as
+before, so resumes that hit a location cue early run at about the old
+speed; without one the guarded location search makes it 2-4x faster.
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, List
+
+SKILL_KEYWORDS = [
+    "python", "java", "javascript", "typescript", "react", "node.js", "nodejs", "angular", "vue",
+    "django", "flask", "fastapi", "springboot", "spring", "express", "next.js", "nuxt.js",
+    "aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible",
+    "machine learning", "deep learning", "data science", "ai", "ml",
+    "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy", "matplotlib", "seaborn",
+    "sql", "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
+    "ci/cd", "jenkins", "github actions", "gitlab", "agile", "scrum",
+    "html", "css", "tailwind", "bootstrap", "sass", "git", "rest api", "graphql",
+    "microservices", "linux", "devops", "springboot", "kafka", "rabbitmq",
+    "nginx", "bash", "shell", "powershell", "c++", "c#", "go", "golang", "rust",
+    "php", "ruby", "rails", "frontend", "backend", "fullstack", "cloud", "docker compose"
+]
+
+RESUME_INDICATORS = [
+    'experience', 'education', 'skills', 'work history',
+    'employment', 'university', 'bachelor', 'master',
+    'degree', 'graduated', 'certification', 'project',
+    'responsibilities', 'achievements'
+]
+
+REMOTE_PREFERENCE_TERMS = ["remote", "wfh"]
+
+# Checked in this order; the first pattern with any match decides
+EXPERIENCE_PATTERNS = [
+    r'(\d+)\+?\s*years?\s*(?:of)?\s*(?:experience)?',
+    r'experience[:\s]+(\d+)\+?\s*years?',
+    r'(\d+)\s*yrs?\.?\s*(?:experience)?',
+]
+
+# Checked in this order; the first location with any match wins
+LOCATION_PATTERNS = {
+    "remote": [
+        r"\bremote\b",
+        r"work\s*from\s*home",
+        r"telecommute",
+        r"virtually",
+        r"off-site",
+    ],
+    "hybrid": [
+        r"\bhybrid\b",
+        r"partly\s*remote",
+        r"flexible\s*work",
+        r"mix(?:ed)?\s*(?:remote|office)",
+    ],
+    "onsite": [
+        r"\bonsite\b",
+        r"on[-\s]*premise",
+        r"office\s*based",
+        r"client\s*location",
+    ],
+}
+
+DATE_RANGE_PATTERN = r'(?P<range_start>(?:19|20)\d{2})\s*(?:-|–|—|to)\s*(?P<range_end>(?:19|20)\d{2}|present|current|now)'
+EDUCATION_HINTS = ('university', 'college', 'bachelor', 'master', 'degree', 'education', 'school', 'b.sc', 'm.sc', 'phd')
+
+DEFAULT_EXPERIENCE_YEARS = 3
+DEFAULT_WORK_LOCATION = "remote"
+
+_LITERALS = tuple(dict.fromkeys(SKILL_KEYWORDS + RESUME_INDICATORS + REMOTE_PREFERENCE_TERMS))
+_INDICATOR_SET = frozenset(RESUME_INDICATORS)
+
+_SKILL_ORDER = tuple(dict.fromkeys(SKILL_KEYWORDS))
+_WORD_PATTERN_RE = re.compile(r"\\b(\w+)\\b")
+
+
+def _guarded(pattern: str, guard: str = None) -> tuple:
+    """
+    (literal, compiled pattern). Patterns that start with a word boundary or a
+    digit class get no literal-prefix speedup from re and try every position
+    on a miss, so a substring check for a literal they require runs first.
+    """
+    if guard is None:
+        word = _WORD_PATTERN_RE.fullmatch(pattern)
+        guard = word.group(1) if word else ""
+    return guard, re.compile(pattern)
+
+
+_EXPERIENCE_RES = [
+    _guarded(pattern, guard) for pattern, guard in zip(EXPERIENCE_PATTERNS, ("year", "year", "yr"))
+]
+_LOCATION_RES = [
+    (location, [_guarded(pattern) for pattern in patterns])
+    for location, patterns in LOCATION_PATTERNS.items()
+]
+_DATE_RANGE_RE = re.compile(DATE_RANGE_PATTERN)
+
+
+def _years_from_ranges(ranges: List[tuple]) -> int:
+    """Total years covered by employment date ranges, with overlaps merged"""
+    current_year = datetime.now().year
+    spans = []
+    for start, end in ranges:
+        start_year = int(start)
+        end_year = current_year if not end[:1].isdigit() else int(end)
+        if start_year <= end_year <= current_year:
+            spans.append((start_year, end_year))
+    if not spans:
+        return 0
+
+    spans.sort()
+    total = 0
+    merged_start, merged_end = spans[0]
+    for start, end in spans[1:]:
+        if start <= merged_end:
+            merged_end = max(merged_end, end)
+        else:
+            total += merged_end - merged_start
+            merged_start, merged_end = start, end
+    total += merged_end - merged_start
+    return total
+
+
+def _employment_ranges(text_lower: str) -> List[tuple]:
+    """(start, end) year pairs, skipping ranges on education lines"""
+    ranges = []
+    for match in _DATE_RANGE_RE.finditer(text_lower):
+        line_start = text_lower.rfind("\n", 0, match.start()) + 1
+        line_end = text_lower.find("\n", match.end())
+        line = text_lower[line_start:line_end if line_end != -1 else len(text_lower)]
+        if not any(hint in line for hint in EDUCATION_HINTS):
+            ranges.append((match.group("range_start"), match.group("range_end")))
+    return ranges
+
+
+def analyze_resume(text: str) -> Dict:
+    """
+    Analyze resume/skills text from a single lowercased copy.
+    Returns skills (keyword matches, in SKILL_KEYWORDS order), experience_years,
+    work_location, is_resume and remote_preference.
+    """
+    text_lower = text.lower()
+
+    # Substring checks run at memchr speed, far faster than any per-position regex
+    literals = {term for term in _LITERALS if term in text_lower}
+
+    experience_years = None
+    for guard, pattern in _EXPERIENCE_RES:
+        match = guard in text_lower and pattern.search(text_lower)
+        if match:
+            experience_years = int(match.group(1))
+            break
+    if experience_years is None:
+        experience_years = _years_from_ranges(_employment_ranges(text_lower)) or DEFAULT_EXPERIENCE_YEARS
+
+    work_location = next(
+        (
+            location for location, patterns in _LOCATION_RES
+            if any(guard in text_lower and pattern.search(text_lower) for guard, pattern in patterns)
+        ),
+        DEFAULT_WORK_LOCATION
+    )
+
+    indicator_count = len(literals & _INDICATOR_SET)
+
+    return {
+        'skills': [skill for skill in _SKILL_ORDER if skill in literals],
+        'experience_years': experience_years,
+        'work_location': work_location,
+        'is_resume': indicator_count >= 2 or len(text) > 200,
+        'remote_preference': "remote" in literals or "wfh" in literals,
+    }
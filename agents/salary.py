@@ -0,0 +1,207 @@
+"""
+Salary normalization and a sorted salary index.
+Upstream salaries arrive as display strings ("$90,000-$120,000",
+"90K–140K a year", "$45 - $60 an hour", "Not specified") or, for Adzuna,
+as numbers. They are parsed once at ingest into numeric annual min/max,
+currency and period, so discovery can drop postings below a candidate's
+salary floor before scoring them and the recommender can rank by pay
+without re-parsing strings.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+# Annualization factors (40h weeks, 260 working days)
+PERIOD_MULTIPLIERS = {'year': 1, 'month': 12, 'week': 52, 'day': 260, 'hour': 2080}
+PERIOD_PATTERNS = [
+    ('hour', re.compile(r"\b(?:hour|hourly|hr|/h)\b|/\s*hr?\b")),
+    ('day', re.compile(r"\b(?:day|daily)\b")),
+    ('week', re.compile(r"\b(?:week|weekly|wk)\b")),
+    ('month', re.compile(r"\b(?:month|monthly|mo)\b")),
+    ('year', re.compile(r"\b(?:year|yearly|yr|annual|annually|annum|p\.?a\.?)\b")),
+]
+CURRENCY_SYMBOLS = {'$': 'USD', '£': 'GBP', '€': 'EUR', '₹': 'INR', '¥': 'JPY'}
+CURRENCY_CODE_RE = re.compile(r"\b(USD|GBP|EUR|INR|CAD|AUD|NZD|CHF|JPY|SGD)\b", re.IGNORECASE)
+AMOUNT_RE = re.compile(r"(\d{1,3}(?:[,.\s]\d{3})+|\d+(?:\.\d+)?)\s*([kKmM])?(?![\w])")
+UNSPECIFIED = ("", "not specified", "n/a", "competitive", "negotiable", "doe")
+DEFAULT_CURRENCY = "USD"
+
+# Only an explicit ask ("expected salary: $120k", "looking for 25 LPA") counts,
+# and only with a currency or k/LPA marker: a bare "salary ... 2,000,000" is
+# more often a payroll figure than an expectation
+EXPECTATION_RE = re.compile(
+    r"\b(?:(?:expected|desired|target)\s+(?:salary|compensation|ctc|pay)|salary\s+expectations?|looking\s+for)\b"
+    r"[\s:=\-–]*(?:(?:is|of|around|about|approx\.?|at\s+least|min(?:imum)?|a\s+salary\s+of)\s+)*"
+    r"(?P<symbol>[$£€₹¥])?\s*(?P<amount>\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)\s*"
+    r"(?P<unit>k|lpa|lakhs?|l)?\b\s*(?P<code>USD|GBP|EUR|INR|CAD|AUD|NZD|CHF|JPY|SGD)?\b",
+    re.IGNORECASE
+)
+EXPECTATION_PERIOD_RE = re.compile(r"\s*(?:/|per\s+|an?\s+)\s*(hour|hr|month|mo|year|yr|annum)\b", re.IGNORECASE)
+LAKH = 100000
+
+
+class SalaryRange(NamedTuple):
+    min: float
+    max: float
+    currency: str
+    period: str
+
+    def annual(self) -> "SalaryRange":
+        factor = PERIOD_MULTIPLIERS[self.period]
+        return SalaryRange(self.min * factor, self.max * factor, self.currency, 'year')
+
+
+def _amount(digits: str, suffix: Optional[str]) -> float:
+    if re.fullmatch(r"\d{1,3}(?:[,.\s]\d{3})+", digits):
+        value = float(re.sub(r"[,.\s]", "", digits))
+    else:
+        value = float(digits)
+    if suffix:
+        value *= 1000 if suffix.lower() == 'k' else 1000000
+    return value
+
+
+def parse_salary(text, default_currency: str = DEFAULT_CURRENCY) -> Optional[SalaryRange]:
+    """Parse a salary display string, or None when it names no amount"""
+    if not text or str(text).strip().lower() in UNSPECIFIED:
+        return None
+    text = str(text)
+    matches = AMOUNT_RE.findall(text)[:2]
+    if not matches:
+        return None
+
+    # "90–140K": a bare first number borrows the suffix of the second
+    if len(matches) == 2 and not matches[0][1] and matches[1][1] and float(matches[0][0].replace(",", "")) < 1000:
+        matches[0] = (matches[0][0], matches[1][1])
+    amounts = [_amount(digits, suffix) for digits, suffix in matches]
+    low, high = min(amounts), max(amounts)
+    if high <= 0:
+        return None
+
+    lowered = text.lower()
+    period = next((name for name, pattern in PERIOD_PATTERNS if pattern.search(lowered)), None)
+    if period is None:
+        period = 'hour' if high < 200 else 'month' if high < 20000 else 'year'
+
+    code = CURRENCY_CODE_RE.search(text)
+    if code:
+        currency = code.group(1).upper()
+    else:
+        currency = next((code for symbol, code in CURRENCY_SYMBOLS.items() if symbol in text), default_currency)
+    return SalaryRange(low, high, currency, period)
+
+
+def salary_fields(salary) -> Dict[str, object]:
+    """
+    Numeric job fields for a salary string or SalaryRange: annual min/max,
+    currency and the period it was quoted in (all None when unknown)
+    """
+    parsed = salary if isinstance(salary, SalaryRange) else parse_salary(salary)
+    if parsed is None:
+        return {'salary_min': None, 'salary_max': None, 'salary_currency': None, 'salary_period': None}
+    annual = parsed.annual()
+    return {
+        'salary_min': int(annual.min),
+        'salary_max': int(annual.max),
+        'salary_currency': parsed.currency,
+        'salary_period': parsed.period,
+    }
+
+
+def meets_salary_floor(job: dict, floor, currency: str = DEFAULT_CURRENCY) -> bool:
+    """False only for jobs known to pay below `floor` in the same currency"""
+    if not floor or job.get('salary_max') is None or job.get('salary_currency') != currency:
+        return True
+    return job['salary_max'] >= floor
+
+
+def salary_expectation(text: str) -> Optional[SalaryRange]:
+    """
+    Annual salary a candidate explicitly asks for in their text
+    ("expected salary: $120k", "desired salary 25 LPA"), or None.
+    Amounts without a currency symbol/code or a k/LPA marker are skipped.
+    """
+    for match in EXPECTATION_RE.finditer(text or ""):
+        symbol, unit, code = match.group('symbol'), (match.group('unit') or '').lower(), match.group('code')
+        if not (symbol or unit or code):
+            continue
+        amount = float(match.group('amount').replace(",", ""))
+        if unit == 'k':
+            amount *= 1000
+        elif unit:
+            amount *= LAKH
+            code = code or 'INR'
+        if amount <= 0:
+            continue
+        currency = code.upper() if code else CURRENCY_SYMBOLS.get(symbol, DEFAULT_CURRENCY)
+
+        period = 'year'
+        quoted = EXPECTATION_PERIOD_RE.match(text, match.end())
+        if quoted and unit not in ('lpa', 'lakh', 'lakhs', 'l'):
+            period = next(name for name, pattern in PERIOD_PATTERNS if pattern.search(quoted.group(1).lower()))
+        return SalaryRange(amount, amount, currency, period).annual()
+    return None
+
+
+class SalaryRangeIndex:
+    """
+    Job keys sorted by annual maximum salary, for range queries with bisect.
+    Jobs without a (same-currency) salary are not indexed and never excluded.
+    """
+
+    def __init__(self, currency: str = DEFAULT_CURRENCY):
+        self.currency = currency
+        self._maxes: List[int] = []
+        self._keys: List[str] = []
+        self._by_key: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def add(self, job: dict):
+        key = job.get('job_id')
+        if not key:
+            return
+        self.remove(key)
+        if job.get('salary_max') is None or job.get('salary_currency') != self.currency:
+            return
+        position = bisect_left(self._maxes, job['salary_max'])
+        self._maxes.insert(position, job['salary_max'])
+        self._keys.insert(position, key)
+        self._by_key[key] = job['salary_max']
+
+    def remove(self, key: str):
+        salary_max = self._by_key.pop(key, None)
+        if salary_max is None:
+            return
+        position = bisect_left(self._maxes, salary_max)
+        while self._keys[position] != key:
+            position += 1
+        del self._maxes[position]
+        del self._keys[position]
+
+    def rebuild(self, jobs: Iterable[dict]):
+        pairs = sorted(
+            (job['salary_max'], job['job_id']) for job in jobs
+            if job.get('job_id') and job.get('salary_max') is not None and job.get('salary_currency') == self.currency
+        )
+        self._maxes = [salary_max for salary_max, _ in pairs]
+        self._keys = [key for _, key in pairs]
+        self._by_key = {key: salary_max for salary_max, key in pairs}
+
+    def below(self, floor) -> List[str]:
+        """Keys of jobs whose annual maximum is under `floor`: the sorted prefix up to its bisect point"""
+        if not floor:
+            return []
+        return self._keys[:bisect_left(self._maxes, floor)]
+
+
+def rank_by_salary(jobs: Iterable[dict], count: int = None) -> List[dict]:
+    """Jobs with a known salary, best-paying first"""
+    ranked = sorted(
+        (job for job in jobs if job.get('salary_max') is not None),
+        key=lambda job: (job['salary_max'], job.get('salary_min') or 0),
+        reverse=True
+    )
+    return ranked[:count] if count else ranked
@@ -0,0 +1,184 @@
+"""
+Saved searches with reverse (job-to-candidate) matching.
+Subscribed candidate profiles are indexed percolator-style: one posting
+list of candidates per skill. Each newly ingested job is matched by
+looking up only the skills that occur in its text and counting hits per
+candidate over just those posting lists (numpy unique with counts), so
+the cost follows the subscribers that share a skill with the job, not
+the total number of saved searches.
+"""
+
+import json
+import os
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Set
+
+import numpy as np
+
+from job_text import NormalizedText, job_match_text, normalize_skills
+from models import job_version
+
+SAVED_SEARCH_PATH = os.getenv("SAVED_SEARCH_PATH", "data/saved_searches.json")
+# A job alerts a candidate when it mentions this many of their skills (or all, if fewer)
+MIN_MATCHED_SKILLS = int(os.getenv("ALERT_MIN_MATCHED_SKILLS", "2"))
+ALERT_MAX_JOBS = int(os.getenv("ALERT_MAX_JOBS", "5"))
+# Job versions already percolated, so re-fetched postings don't alert twice
+PERCOLATED_LIMIT = 50000
+# Count hits with bincount instead of sorting once a job's postings reach 1/this of all slots
+DENSE_POSTINGS_FACTOR = 4
+# Fields sent in an alert (enough for job_version and a short job card)
+ALERT_FIELDS = ('job_id', 'title', 'company', 'location', 'salary', 'remote', 'description', 'url', 'source')
+
+
+class SavedSearchIndex:
+    """Inverted index of saved profiles by skill"""
+
+    def __init__(self, min_matched: int = MIN_MATCHED_SKILLS):
+        self.min_matched = min_matched
+        # candidate id -> {'skills': [...], 'remote_only': bool}
+        self.searches: Dict[str, dict] = {}
+        # Candidates are numbered so hit counting is array work over posting arrays
+        self.slots: Dict[str, int] = {}
+        self.candidate_ids: List[str] = []
+        self._free_slots: List[int] = []
+        self.required = np.zeros(0, dtype=np.int32)  # skills a job must mention; 0 = free slot
+        self.remote_only = np.zeros(0, dtype=bool)
+        # skill -> slots, split so single words use a token lookup
+        self.word_postings: Dict[str, Set[int]] = defaultdict(set)
+        self.phrase_postings: Dict[str, Set[int]] = defaultdict(set)
+        self._arrays: Dict[str, np.ndarray] = {}
+        self.percolated = OrderedDict()
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.searches)
+
+    def _postings(self, skill: str) -> Dict[str, Set[int]]:
+        return self.phrase_postings if " " in skill else self.word_postings
+
+    def _posting_array(self, skill: str) -> np.ndarray:
+        array = self._arrays.get(skill)
+        if array is None:
+            array = self._arrays[skill] = np.fromiter(self._postings(skill)[skill], dtype=np.int64)
+        return array
+
+    def _allocate_slot(self, candidate_id: str) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self.candidate_ids[slot] = candidate_id
+        else:
+            slot = len(self.candidate_ids)
+            self.candidate_ids.append(candidate_id)
+            if slot >= len(self.required):
+                size = max(1024, 2 * len(self.required))
+                self.required = np.resize(self.required, size)
+                self.required[slot:] = 0
+                self.remote_only = np.resize(self.remote_only, size)
+        self.slots[candidate_id] = slot
+        return slot
+
+    def subscribe(self, candidate_id: str, skills: Iterable[str], remote_only: bool = False):
+        """Save (or replace) a candidate's search"""
+        self.unsubscribe(candidate_id)
+        skills = sorted(set(normalize_skills(skills)))
+        if not skills:
+            return
+        self.searches[candidate_id] = {'skills': skills, 'remote_only': remote_only}
+        slot = self._allocate_slot(candidate_id)
+        self.required[slot] = min(self.min_matched, len(skills))
+        self.remote_only[slot] = remote_only
+        for skill in skills:
+            self._postings(skill)[skill].add(slot)
+            self._arrays.pop(skill, None)
+        self.dirty = True
+
+    def unsubscribe(self, candidate_id: str) -> bool:
+        search = self.searches.pop(candidate_id, None)
+        if search is None:
+            return False
+        slot = self.slots.pop(candidate_id)
+        for skill in search['skills']:
+            postings = self._postings(skill)
+            postings[skill].discard(slot)
+            if not postings[skill]:
+                del postings[skill]
+            self._arrays.pop(skill, None)
+        self.required[slot] = 0
+        self.candidate_ids[slot] = None
+        self._free_slots.append(slot)
+        self.dirty = True
+        return True
+
+    def match(self, job_text: NormalizedText, remote: bool = False) -> List[str]:
+        """Candidates whose saved search this job satisfies"""
+        tokens = job_text.tokens
+        if len(tokens) < len(self.word_postings):
+            present = [token for token in tokens if token in self.word_postings]
+        else:
+            present = [skill for skill in self.word_postings if skill in tokens]
+        present.extend(phrase for phrase in self.phrase_postings if job_text.contains(phrase))
+        if not present:
+            return []
+
+        # Only the slots in the touched posting lists are counted and compared. Sorting
+        # them is cheapest while they are few; once they cover a large share of all
+        # subscribers, one counting pass is faster than the sort
+        touched = np.concatenate([self._posting_array(skill) for skill in present])
+        if len(touched) * DENSE_POSTINGS_FACTOR >= len(self.required):
+            counts = np.bincount(touched)
+            slots = np.flatnonzero(counts)
+            hits = counts[slots]
+        else:
+            slots, hits = np.unique(touched, return_counts=True)
+        required = self.required[slots]
+        matched = (required > 0) & (hits >= required)
+        if not remote:
+            matched &= ~self.remote_only[slots]
+        return [self.candidate_ids[slot] for slot in slots[matched].tolist()]
+
+    def percolate(self, jobs: Iterable[dict], exclude: str = None) -> Dict[str, List[dict]]:
+        """
+        Match newly ingested jobs against every saved search.
+        Jobs already percolated with the same content are skipped.
+        Returns candidate id -> alert jobs (at most ALERT_MAX_JOBS each).
+        """
+        alerts = defaultdict(list)
+        if not self.searches:
+            return alerts
+        for job in jobs:
+            job_id = job.get('job_id')
+            if not job_id:
+                continue
+            version = job_version(job)
+            if self.percolated.get(job_id) == version:
+                continue
+            self.percolated[job_id] = version
+            self.percolated.move_to_end(job_id)
+            if len(self.percolated) > PERCOLATED_LIMIT:
+                self.percolated.popitem(last=False)
+
+            job_text = job_match_text(job)
+            for candidate_id in self.match(job_text, bool(job.get('remote'))):
+                if candidate_id != exclude and len(alerts[candidate_id]) < ALERT_MAX_JOBS:
+                    alerts[candidate_id].append({field: job.get(field) for field in ALERT_FIELDS})
+        return alerts
+
+    def save(self, path: str = SAVED_SEARCH_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({'searches': self.searches}, f, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+        self.dirty = False
+
+    @classmethod
+    def open(cls, path: str = SAVED_SEARCH_PATH) -> "SavedSearchIndex":
+        """Load saved searches from `path`, or start empty if there are none"""
+        index = cls()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for candidate_id, search in json.load(f)['searches'].items():
+                    index.subscribe(candidate_id, search['skills'], search.get('remote_only', False))
+        index.dirty = False
+        return index
@@ -0,0 +1,125 @@
+"""
+Batched compatibility scoring.
+Revives the formula of the archived Compatibility Scorer agent
+(archives/scorer_agent.py) as a vectorized stage: many jobs are scored
+against many candidate profiles in one numpy pass instead of one
+JobListing message at a time.
+
+    score = min(100, match_score * 100
+                     + requirement coverage * 10
+                     + 5 if remote
+                     + 3 if a salary is listed)
+
+Requirement coverage is the share of a job's requirements that contain a
+candidate skill or are contained in one (the scorer's substring rule, on
+lowercased strings; a requirement listed twice counts twice). Any salary
+other than "Not specified" earns the bonus, as in the scorer. The one
+deliberate difference: an empty skill list gets no coverage, where the
+scorer substituted a hard-coded demo profile.
+Requirement/skill pairs are checked once per unique string pair and
+cached; everything per job-candidate pair is matrix arithmetic.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+REQUIREMENT_WEIGHT = 10.0
+REMOTE_BONUS = 5.0
+SALARY_BONUS = 3.0
+MAX_SCORE = 100.0
+
+# (requirement, skill) -> substring match, shared across passes
+_pair_cache: Dict[Tuple[str, str], bool] = {}
+_PAIR_CACHE_LIMIT = 500000
+
+
+def _pair_matches(requirement: str, skill: str) -> bool:
+    key = (requirement, skill)
+    matched = _pair_cache.get(key)
+    if matched is None:
+        matched = skill in requirement or requirement in skill
+        if len(_pair_cache) >= _PAIR_CACHE_LIMIT:
+            _pair_cache.clear()
+        _pair_cache[key] = matched
+    return matched
+
+
+def _index(values) -> Dict[str, int]:
+    vocabulary = {}
+    for value in values:
+        vocabulary.setdefault(value, len(vocabulary))
+    return vocabulary
+
+
+def _job_requirements(job: dict) -> List[str]:
+    return [req.lower() for req in job.get('requirements') or [] if isinstance(req, str)]
+
+
+def _has_salary(job: dict) -> bool:
+    salary = job.get('salary', job.get('salary_range'))
+    return bool(salary) and salary != "Not specified"
+
+
+def score_matrix(jobs: Sequence[dict], profiles: Sequence[Sequence[str]]) -> np.ndarray:
+    """
+    Compatibility of every job with every profile (a list of skills).
+    Returns a float32 (len(jobs), len(profiles)) matrix of 0-100 scores.
+    """
+    n_jobs, n_profiles = len(jobs), len(profiles)
+    if n_jobs == 0 or n_profiles == 0:
+        return np.zeros((n_jobs, n_profiles), dtype=np.float32)
+
+    job_requirements = [_job_requirements(job) for job in jobs]
+    profile_skills = [[skill.lower() for skill in skills if isinstance(skill, str)] for skills in profiles]
+    requirement_ids = _index(req for reqs in job_requirements for req in reqs)
+    skill_ids = _index(skill for skills in profile_skills for skill in skills)
+
+    # Job x requirement counts (duplicates count, as in the scorer) and profile x skill incidence
+    job_req = np.zeros((n_jobs, len(requirement_ids)), dtype=np.float32)
+    for row, reqs in enumerate(job_requirements):
+        np.add.at(job_req[row], [requirement_ids[req] for req in reqs], 1.0)
+    profile_skill = np.zeros((n_profiles, len(skill_ids)), dtype=np.float32)
+    for row, skills in enumerate(profile_skills):
+        profile_skill[row, [skill_ids[skill] for skill in skills]] = 1.0
+
+    # Requirement x skill substring matches, one check per unique pair
+    req_skill = np.zeros((len(requirement_ids), len(skill_ids)), dtype=np.float32)
+    for req, r in requirement_ids.items():
+        for skill, s in skill_ids.items():
+            if _pair_matches(req, skill):
+                req_skill[r, s] = 1.0
+
+    # Requirement covered by a profile if any of its skills matches it
+    covered = (req_skill @ profile_skill.T) > 0                  # (requirements, profiles)
+    covered_counts = job_req @ covered.astype(np.float32)          # (jobs, profiles)
+    requirement_counts = job_req.sum(axis=1, keepdims=True)
+    coverage = np.divide(
+        covered_counts, requirement_counts,
+        out=np.zeros_like(covered_counts), where=requirement_counts > 0
+    )
+
+    match_scores = np.array([float(job.get('match_score', 0) or 0) for job in jobs], dtype=np.float32)
+    bonuses = np.array(
+        [REMOTE_BONUS * bool(job.get('remote')) + SALARY_BONUS * _has_salary(job) for job in jobs],
+        dtype=np.float32
+    )
+    scores = (match_scores * 100 + bonuses)[:, None] + coverage * REQUIREMENT_WEIGHT
+    return np.minimum(scores, MAX_SCORE)
+
+
+def score_batches(batches: Sequence[Tuple[Sequence[dict], Sequence[str]]]) -> List[np.ndarray]:
+    """
+    Score several (jobs, candidate skills) batches in one pass.
+    Returns one score vector per batch, aligned with its jobs.
+    """
+    batches = list(batches)
+    all_jobs = [job for jobs, _ in batches for job in jobs]
+    matrix = score_matrix(all_jobs, [skills for _, skills in batches])
+
+    results = []
+    offset = 0
+    for column, (jobs, _) in enumerate(batches):
+        results.append(matrix[offset:offset + len(jobs), column])
+        offset += len(jobs)
+    return results
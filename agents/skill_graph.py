@@ -0,0 +1,183 @@
+"""
+Compiled skill relationship graph.
+SKILLS_KNOWLEDGE_GRAPH (originally written for the Skills Mapper agent) is
+compiled once at import into integer node ids, adjacency tuples and
+precomputed k-hop neighborhoods, so expanding a skill is a dict lookup.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+# MeTTa Knowledge Graph (Simulated)
+SKILLS_KNOWLEDGE_GRAPH = {
+    "python": {
+        "related": ["django", "flask", "pandas", "data science", "machine learning"],
+        "category": "Programming",
+        "demand": "very high",
+        "avg_salary": 120000
+    },
+    "javascript": {
+        "related": ["react", "node.js", "vue.js", "typescript"],
+        "category": "Programming",
+        "demand": "very high",
+        "avg_salary": 115000
+    },
+    "react": {
+        "related": ["javascript", "redux", "next.js", "typescript"],
+        "category": "Frontend",
+        "demand": "very high",
+        "avg_salary": 110000
+    },
+    "machine learning": {
+        "related": ["tensorflow", "pytorch", "python", "data science", "ai"],
+        "category": "AI/ML",
+        "demand": "very high",
+        "avg_salary": 145000
+    },
+    "aws": {
+        "related": ["docker", "kubernetes", "terraform", "devops"],
+        "category": "Cloud",
+        "demand": "very high",
+        "avg_salary": 135000
+    },
+    "docker": {
+        "related": ["kubernetes", "aws", "devops", "ci/cd"],
+        "category": "DevOps",
+        "demand": "very high",
+        "avg_salary": 125000
+    },
+    "sql": {
+        "related": ["postgresql", "mysql", "database", "data analysis"],
+        "category": "Database",
+        "demand": "high",
+        "avg_salary": 105000
+    },
+    "leadership": {
+        "related": ["project management", "agile", "team building"],
+        "category": "Soft Skills",
+        "demand": "very high",
+        "avg_salary": 155000
+    }
+}
+
+# Common spellings and abbreviations mapped to the canonical skill name
+SKILL_ALIASES = {
+    "k8s": "kubernetes",
+    "kube": "kubernetes",
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue.js",
+    "vue": "vue.js",
+    "nextjs": "next.js",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "py": "python",
+    "sklearn": "scikit-learn",
+    "tf": "tensorflow",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "amazon web services": "aws",
+    "google cloud": "gcp",
+    "cicd": "ci/cd",
+    "ci-cd": "ci/cd",
+    "continuous integration": "ci/cd",
+}
+
+MAX_HOPS = 2
+# Partial credit given to a related skill, by hop distance
+HOP_WEIGHTS = {0: 1.0, 1: 0.5, 2: 0.25}
+
+
+class SkillGraph:
+    """Undirected skill graph with precomputed k-hop neighborhoods"""
+
+    def __init__(self, knowledge_graph: Dict[str, dict], max_hops: int = MAX_HOPS):
+        self.max_hops = max_hops
+        self.node_ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.categories: Dict[int, str] = {}
+
+        edges = []
+        for skill, info in knowledge_graph.items():
+            source = self._node(skill)
+            self.categories[source] = info.get("category", "")
+            for related in info.get("related", []):
+                edges.append((source, self._node(related)))
+
+        neighbors = [set() for _ in self.names]
+        for source, target in edges:
+            if source != target:
+                neighbors[source].add(target)
+                neighbors[target].add(source)
+        self.adjacency: Tuple[Tuple[int, ...], ...] = tuple(tuple(sorted(n)) for n in neighbors)
+
+        # node id -> ((neighbor id, hops), ...) sorted by distance, excluding the node itself
+        self.neighborhoods: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+            self._bfs(node) for node in range(len(self.names))
+        )
+        # skill name -> {related skill name: weight}, the O(1) lookup used by the agents
+        self.expansions: Dict[str, Dict[str, float]] = {
+            name: {self.names[other]: HOP_WEIGHTS.get(hops, 0.0) for other, hops in self.neighborhoods[node]}
+            for name, node in self.node_ids.items()
+        }
+
+    def _node(self, skill: str) -> int:
+        skill = skill.lower()
+        node = self.node_ids.get(skill)
+        if node is None:
+            node = self.node_ids[skill] = len(self.names)
+            self.names.append(skill)
+        return node
+
+    def _bfs(self, start: int) -> Tuple[Tuple[int, int], ...]:
+        seen = {start: 0}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            hops = seen[node]
+            if hops == self.max_hops:
+                continue
+            for other in self.adjacency[node]:
+                if other not in seen:
+                    seen[other] = hops + 1
+                    queue.append(other)
+        del seen[start]
+        return tuple(sorted(seen.items(), key=lambda item: (item[1], item[0])))
+
+    def related(self, skill: str) -> Dict[str, float]:
+        """Related skills with partial-credit weights (empty for unknown skills); aliases like "k8s" resolve first"""
+        return self.expansions.get(canonical_skill(skill), {})
+
+    def category(self, skill: str) -> str:
+        node = self.node_ids.get(canonical_skill(skill))
+        return self.categories.get(node, "") if node is not None else ""
+
+    def expand(self, skills: Iterable[str], max_hops: int = 1) -> Dict[str, float]:
+        """
+        Expand a skill list with related skills.
+        Returns {skill: weight}; the candidate's own skills keep weight 1.0
+        and related skills get the best weight over all paths.
+        """
+        min_weight = HOP_WEIGHTS.get(max_hops, 0.0)
+        expanded = {skill.lower(): 1.0 for skill in skills}
+        for skill in list(expanded):
+            for related, weight in self.related(skill).items():
+                if weight >= min_weight and weight > expanded.get(related, 0.0):
+                    expanded[related] = weight
+        return expanded
+
+
+def canonical_skill(skill: str) -> str:
+    """Map an alias like "k8s" to its canonical skill name"""
+    skill = skill.lower()
+    return SKILL_ALIASES.get(skill, skill)
+
+
+skill_graph = SkillGraph(SKILLS_KNOWLEDGE_GRAPH)
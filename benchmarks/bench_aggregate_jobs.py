@@ -0,0 +1,105 @@
+"""
+Benchmark: end-to-end job aggregation throughput.
+Starts the mock job board (tools/mock_job_board.py) in-process, points every
+fetcher at it and runs JobBoardAggregator.aggregate_jobs for many synthetic
+profiles at a fixed concurrency. No API quota is used. Profiles can come from a
+synthetic corpus (tools/synth_corpus.py) and the mock can replay its
+cassettes instead of synthesizing responses.
+
+Usage:
+    python benchmarks/bench_aggregate_jobs.py [--profiles 200] [--concurrency 20]
+        [--latency-ms 150] [--error-rate 0.0] [--jobs 20] [--description-chars 1500]
+        [--resumes data/corpus/resumes.jsonl] [--cassettes data/corpus/cassettes]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "agents"))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+sys.path.insert(0, ROOT)
+
+from aiohttp import web  # noqa: E402
+
+from mock_job_board import SKILLS, MockJobBoard, build_parser  # noqa: E402
+from synth_corpus import iter_records  # noqa: E402
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+async def run(args):
+    mock_args = build_parser().parse_args([
+        "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.latency_ms / 3),
+        "--error-rate", str(args.error_rate), "--jobs", str(args.jobs),
+        "--description-chars", str(args.description_chars), "--seed", "7",
+    ] + (["--cassettes", args.cassettes] if args.cassettes else []))
+    runner = web.AppRunner(MockJobBoard(mock_args).app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+
+    # Configure before importing the agent module, which reads these at import time
+    os.environ.update({
+        "JOB_BOARD_BASE_URL": f"http://127.0.0.1:{args.port}",
+        "ADZUNA_APP_ID": "bench", "ADZUNA_APP_KEY": "bench",
+        "FINDWORK_API_KEY": "bench", "SERPAPI_API_KEY": "bench",
+        "RATE_LIMIT_ADZUNA": "1000000/1", "RATE_LIMIT_FINDWORK": "1000000/1",
+        "RATE_LIMIT_GOOGLE_JOBS": "1000000/1",
+    })
+    from job_discovery_agent import JobBoardAggregator
+
+    if args.resumes:
+        records = iter_records(args.resumes)
+        profiles = [record['skills'] for record, _ in zip(records, range(args.profiles))]
+    else:
+        rng = random.Random(3)
+        profiles = [rng.sample(SKILLS, rng.randint(3, 8)) for _ in range(args.profiles)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    found = []
+
+    async def one(skills):
+        async with semaphore:
+            start = time.perf_counter()
+            jobs = await JobBoardAggregator().aggregate_jobs(skills)
+            latencies.append((time.perf_counter() - start) * 1000)
+            found.append(len(jobs))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(skills) for skills in profiles))
+    elapsed = time.perf_counter() - start
+    await runner.cleanup()
+
+    print(f"{len(profiles)} profiles, concurrency {args.concurrency}, "
+          f"mock latency {args.latency_ms:.0f} ms, error rate {args.error_rate:.0%}")
+    print(f"Throughput: {len(profiles) / elapsed:.1f} profiles/s ({elapsed:.2f}s total)")
+    print(f"Latency: p50 {percentile(latencies, 50):.0f} ms | p95 {percentile(latencies, 95):.0f} ms | "
+          f"p99 {percentile(latencies, 99):.0f} ms")
+    print(f"Jobs per profile: mean {statistics.mean(found):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=150)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--description-chars", type=int, default=1500)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--resumes", help="resumes.jsonl from tools/synth_corpus.py; their skills are the profiles")
+    parser.add_argument("--cassettes", help="cassette directory for the mock, e.g. from synth_corpus.py --cassettes")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Microbenchmark: JobListingBatch wire encodings.
+Compares plain JSON against the zlib-columnar encoding for several batch
+sizes, reporting payload size and encode/decode time.
+
+Usage:
+    python benchmarks/bench_batch_codec.py [--sizes 15 100 1000 10000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agents"))
+
+from batch_codec import ENCODING_ZLIB_COLUMNAR, decode_jobs, encode_jobs  # noqa: E402
+
+SOURCES = ["Adzuna", "FindWork", "Google Jobs", "Remotive"]
+LOCATIONS = ["Remote", "New York, NY", "San Francisco, CA", "Austin, TX", "Worldwide"]
+SALARIES = ["Not specified", "$90,000-$120,000", "$120,000-$150,000", "Competitive"]
+SKILLS = ["python", "django", "react", "aws", "docker", "kubernetes", "sql", "go", "typescript"]
+WORDS = "we are looking for an engineer to build and scale our platform with modern tooling".split()
+
+
+def make_jobs(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        source = rng.choice(SOURCES)
+        jobs.append({
+            'job_id': f"{source}_{100000 + i}",
+            'title': f"{rng.choice(['Senior', 'Junior', 'Staff', ''])} {rng.choice(SKILLS).title()} Engineer".strip(),
+            'company': f"Company {rng.randint(1, max(count // 10, 5))}",
+            'location': rng.choice(LOCATIONS),
+            'description': " ".join(rng.choice(WORDS) for _ in range(80))[:500],
+            'url': f"https://jobs.example.com/{source.lower()}/{i}",
+            'salary': rng.choice(SALARIES),
+            'remote': rng.random() < 0.6,
+            'source': source,
+            'match_score': round(rng.uniform(0.15, 1.0), 2),
+            'requirements': rng.sample(SKILLS, rng.randint(0, 5)),
+        })
+    return jobs
+
+
+def timed(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[15, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'jobs':>7} | {'json bytes':>11} | {'compact bytes':>13} | {'ratio':>6} | "
+          f"{'json enc ms':>11} | {'json dec ms':>11} | {'cmp enc ms':>10} | {'cmp dec ms':>10}")
+    print("-" * 100)
+    for size in args.sizes:
+        jobs = make_jobs(size)
+        plain = json.dumps(jobs, separators=(",", ":"))
+        encoding, payload = encode_jobs(jobs, ENCODING_ZLIB_COLUMNAR)
+        assert decode_jobs(encoding, payload, jobs) == jobs
+
+        json_enc = timed(lambda: json.dumps(jobs, separators=(",", ":")), args.repeat)
+        json_dec = timed(lambda: json.loads(plain), args.repeat)
+        cmp_enc = timed(lambda: encode_jobs(jobs, ENCODING_ZLIB_COLUMNAR), args.repeat)
+        cmp_dec = timed(lambda: decode_jobs(encoding, payload, jobs), args.repeat)
+        compact_size = len(payload) if payload else len(plain)
+
+        print(f"{size:>7} | {len(plain):>11,} | {compact_size:>13,} | {len(plain) / compact_size:>5.1f}x | "
+              f"{json_enc:>11.2f} | {json_dec:>11.2f} | {cmp_enc:>10.2f} | {cmp_dec:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
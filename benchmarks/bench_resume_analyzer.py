@@ -0,0 +1,158 @@
+"""
+Benchmark: resume analysis.
+Compares analyze_resume against the four separate
+scans it replaced (keyword skills, experience regexes, work-location
+regexes, resume indicators) on synthetic resumes of increasing size.
+The replaced candidate_agent functions are kept below as the reference.
+
+Usage:
+    python benchmarks/bench_resume_analyzer.py [--sizes 2000 20000 200000] [--repeat 20]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "agents"))
+sys.path.insert(0, ROOT)
+
+from resume_analyzer import SKILL_KEYWORDS, analyze_resume  # noqa: E402
+
+SECTIONS = [
+    "Senior Software Engineer, Acme Corp {start} - {end}",
+    "Built microservices with {skill} and {skill}; led migration to {skill}.",
+    "Responsibilities: owned the {skill} platform, mentored engineers, on-call rotation.",
+    "Achievements: cut p99 latency by 40% using {skill} caching and {skill}.",
+    "Project: internal tooling in {skill} deployed on {skill} with ci/cd pipelines.",
+    "Open to hybrid or remote roles, currently work from home.",
+    "Education: B.Sc Computer Science, State University {start} - {end}",
+]
+
+
+def make_resume(size: int, seed: int = 3, location_cue: bool = True) -> str:
+    rng = random.Random(seed)
+    sections = SECTIONS if location_cue else [section for section in SECTIONS if "remote" not in section]
+    lines = ["Jane Doe - Backend Engineer", "Summary: 7+ years of experience building distributed systems."]
+    length = sum(len(line) for line in lines)
+    while length < size:
+        start = rng.randint(2005, 2020)
+        line = rng.choice(sections).format(
+            start=start, end=rng.choice([start + rng.randint(1, 4), "present"]), skill="{skill}"
+        )
+        while "{skill}" in line:
+            line = line.replace("{skill}", rng.choice(SKILL_KEYWORDS), 1)
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+# ---- reference: the candidate_agent functions analyze_resume replaced ----
+
+def extract_experience_years(text: str) -> int:
+    """Extract years of experience from text"""
+    patterns = [
+        r'(\d+)\+?\s*years?\s*(?:of)?\s*(?:experience)?',
+        r'experience[:\s]+(\d+)\+?\s*years?',
+        r'(\d+)\s*yrs?\.?\s*(?:experience)?',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text.lower())
+        if match:
+            return int(match.group(1))
+    return 3
+
+
+def is_resume_text(text: str) -> bool:
+    """Detect if text is a resume"""
+    resume_indicators = [
+        'experience', 'education', 'skills', 'work history',
+        'employment', 'university', 'bachelor', 'master',
+        'degree', 'graduated', 'certification', 'project',
+        'responsibilities', 'achievements'
+    ]
+    text_lower = text.lower()
+    matches = sum(1 for indicator in resume_indicators if indicator in text_lower)
+    return matches >= 2 or len(text) > 200
+
+
+def extract_work_location(text: str) -> str:
+    """Detect the preferred work location from resume text. Defaults to 'remote'."""
+    text_lower = text.lower()
+
+    patterns = {
+        "remote": [
+            r"\bremote\b",
+            r"work\s*from\s*home",
+            r"telecommute",
+            r"virtually",
+            r"off-site",
+        ],
+        "hybrid": [
+            r"\bhybrid\b",
+            r"partly\s*remote",
+            r"flexible\s*work",
+            r"mix(ed)?\s*(remote|office)",
+        ],
+        "onsite": [
+            r"\bonsite\b",
+            r"on[-\s]*premise",
+            r"office\s*based",
+            r"client\s*location",
+        ],
+    }
+
+    for location, regex_list in patterns.items():
+        for regex in regex_list:
+            if re.search(regex, text_lower):
+                return location
+
+    return "remote"
+
+
+def legacy_analyze(text: str) -> dict:
+    text_lower = text.lower()
+    return {
+        'skills': [skill for skill in SKILL_KEYWORDS if skill in text_lower],
+        'experience_years': extract_experience_years(text),
+        'work_location': extract_work_location(text),
+        'is_resume': is_resume_text(text),
+        'remote_preference': "remote" in text.lower() or "wfh" in text.lower(),
+    }
+
+
+def best_of(func, text: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 200000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'chars':>9} | {'location cue':>12} | {'legacy ms':>10} | {'analyzer ms':>14} | speedup")
+    for size, location_cue in ((size, cue) for size in args.sizes for cue in (True, False)):
+        text = make_resume(size, location_cue=location_cue)
+        legacy = legacy_analyze(text)
+        current = analyze_resume(text)
+        assert set(current['skills']) == set(legacy['skills'])
+        assert current['experience_years'] == legacy['experience_years']
+        assert current['work_location'] == legacy['work_location']
+        assert current['is_resume'] == legacy['is_resume']
+
+        legacy_ms = best_of(legacy_analyze, text, args.repeat)
+        current_ms = best_of(analyze_resume, text, args.repeat)
+        print(f"{len(text):>9,} | {'yes' if location_cue else 'no':>12} | {legacy_ms:>10.2f} | {current_ms:>14.2f} | {legacy_ms / current_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: batched compatibility scoring.
+Scores a synthetic job set against many candidate profiles with
+scoring_service.score_matrix and compares it with the per-job loop of the
+archived scorer agent's formula.
+
+Usage:
+    python benchmarks/bench_scoring_service.py [--jobs 2000] [--profiles 200] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agents"))
+
+from scoring_service import score_matrix  # noqa: E402
+
+SKILLS = [
+    "python", "django", "flask", "react", "javascript", "typescript", "node.js", "aws", "docker",
+    "kubernetes", "terraform", "sql", "postgresql", "machine learning", "pytorch", "go",
+    "java", "spring", "ci/cd", "devops", "pandas", "data science", "redis", "kafka",
+]
+
+
+def make_jobs(count: int, rng: random.Random) -> list:
+    # Requirements may repeat or carry stray case/whitespace, as upstream keyword lists do
+    requirements = SKILLS + ["AWS", " python", "node.js "]
+    return [{
+        'match_score': rng.random(),
+        'requirements': rng.choices(requirements, k=rng.randint(0, 6)),
+        'remote': rng.random() < 0.5,
+        'salary': rng.choice(["Not specified", "Competitive", "$100,000-$140,000"]),
+    } for _ in range(count)]
+
+
+def legacy_score(job: dict, candidate_skills: list) -> float:
+    """Per-job formula from archives/scorer_agent.calculate_compatibility_score"""
+    score = job['match_score'] * 100
+    if job['requirements']:
+        matching = [
+            req for req in job['requirements']
+            if any(cs.lower() in req.lower() or req.lower() in cs.lower() for cs in candidate_skills)
+        ]
+        score = min(score + len(matching) / len(job['requirements']) * 10, 100)
+    if job['remote']:
+        score = min(score + 5, 100)
+    if job['salary'] and job['salary'] != "Not specified":
+        score = min(score + 3, 100)
+    return score
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(9)
+    jobs = make_jobs(args.jobs, rng)
+    profiles = [rng.sample(SKILLS, rng.randint(3, 8)) for _ in range(args.profiles)]
+    pairs = args.jobs * args.profiles
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        matrix = score_matrix(jobs, profiles)
+        timings.append(time.perf_counter() - start)
+    vectorized_ms = min(timings) * 1000
+
+    sample = profiles[:max(1, args.profiles // 20)]
+    start = time.perf_counter()
+    legacy = [[legacy_score(job, skills) for skills in sample] for job in jobs]
+    legacy_ms = (time.perf_counter() - start) * 1000 * args.profiles / len(sample)
+
+    worst = max(abs(legacy[j][p] - float(matrix[j, p])) for j in range(len(jobs)) for p in range(len(sample)))
+    print(f"{pairs:,} job-candidate pairs (max deviation from per-job formula: {worst:.4f})")
+    print(f"Vectorized: {vectorized_ms:.1f} ms ({pairs / vectorized_ms:,.0f} pairs/ms)")
+    print(f"Per-job loop (extrapolated): {legacy_ms:.1f} ms ({pairs / legacy_ms:,.0f} pairs/ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: semantic job matching.
+Embeds a synthetic job corpus in batches into the discovery agent's
+PersistentJobIndex (FAISS when installed, numpy otherwise) and measures
+nearest-neighbor query latency for candidate profiles.
+
+Usage:
+    python benchmarks/bench_semantic_search.py [--jobs 100000] [--queries 200] [--k 15]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agents"))
+
+from embeddings import embed_profile, embedder  # noqa: E402
+from job_index import PersistentJobIndex  # noqa: E402
+
+SKILLS = [
+    "python", "django", "flask", "react", "javascript", "typescript", "node.js", "aws", "docker",
+    "kubernetes", "k8s", "terraform", "sql", "postgresql", "machine learning", "pytorch", "go",
+    "java", "spring", "ci/cd", "devops", "pandas", "data science", "redis", "kafka",
+]
+FILLER = (
+    "we are looking for an engineer to join our growing team build reliable services "
+    "collaborate with product and design own features end to end mentor others"
+).split()
+
+
+def make_job_texts(count: int, seed: int = 11) -> list:
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        words = rng.sample(SKILLS, rng.randint(2, 6)) + [rng.choice(FILLER) for _ in range(rng.randint(20, 60))]
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+    return texts
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=15)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    texts = make_job_texts(args.jobs)
+    # Never saved, so the path is only a label
+    index = PersistentJobIndex("bench_semantic_search")
+    print(f"Embedder: {type(embedder).__name__} (dim={embedder.dim}) | index backend: {index.backend}")
+
+    start = time.perf_counter()
+    for offset in range(0, len(texts), args.batch_size):
+        chunk = texts[offset:offset + args.batch_size]
+        index.upsert([
+            {'job_id': str(offset + i), 'title': '', 'description': text, 'match_text': text}
+            for i, text in enumerate(chunk)
+        ])
+    build_seconds = time.perf_counter() - start
+    print(f"Embedded + indexed {len(index):,} jobs in {build_seconds:.2f}s "
+          f"({len(index) / build_seconds:,.0f} jobs/s)")
+
+    rng = random.Random(5)
+    profiles = [embed_profile(rng.sample(SKILLS, rng.randint(3, 8))) for _ in range(args.queries)]
+
+    latencies = []
+    for profile in profiles:
+        start = time.perf_counter()
+        index.search(profile, args.k)
+        latencies.append((time.perf_counter() - start) * 1000)
+    print(f"Single query (k={args.k}): p50 {percentile(latencies, 50):.2f} ms | "
+          f"p95 {percentile(latencies, 95):.2f} ms | p99 {percentile(latencies, 99):.2f} ms | "
+          f"mean {statistics.mean(latencies):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Microbenchmark suite for the matching and scoring hot paths.
+Runs each function on fixed synthetic inputs at several sizes (resume
+length, candidate skill count, jobs per batch) and reports ops/sec and the
+peak memory allocated by one call. Inputs are seeded, so runs on different
+commits measure the same work.
+
+    extract_skills        candidate_agent.extract_skills_from_text (keyword scan)
+    analyze_resume        resume_analyzer.analyze_resume (skills, experience, location, resume check)
+    match_score           JobBoardAggregator._calculate_match_score, per batch of jobs
+    skill_match           recommender_agent.analyze_skill_match_local, per batch of jobs
+    readiness_score       recommender_agent.calculate_readiness_score_local, per batch of jobs
+
+Usage:
+    python benchmarks/run_benchmarks.py [--filter match] [--min-time 0.2] [--repeat 3]
+        [--json results.json] [--compare baseline.json]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "agents"))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, ROOT)
+
+from bench_resume_analyzer import make_resume  # noqa: E402
+from candidate_agent import extract_skills_from_text  # noqa: E402
+from job_discovery_agent import JobBoardAggregator  # noqa: E402
+from job_text import DESCRIPTION_LIMIT, job_match_text, normalize_job_text  # noqa: E402
+from mock_job_board import SKILLS, JobFactory  # noqa: E402
+from recommender_agent import analyze_skill_match_local, calculate_readiness_score_local  # noqa: E402
+from resume_analyzer import analyze_resume  # noqa: E402
+from skill_graph import skill_graph  # noqa: E402
+
+RESUME_SIZES = (2000, 20000, 200000)
+SKILL_COUNTS = (3, 10, 25)
+BATCH_SIZES = (15, 100, 1000)
+DEFAULT_SKILLS = 8
+DEFAULT_BATCH = 100
+
+
+def make_jobs(count: int, seed: int = 5) -> list:
+    """Discovery-shaped job dicts built from the mock job board's postings"""
+    factory = JobFactory(seed, 1500)
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(count):
+        posting = factory._posting("")
+        jobs.append({
+            'job_id': f"Bench_{posting['id']}",
+            'title': posting['title'],
+            'company': posting['company'],
+            'location': posting['location'],
+            'description': posting['description'],
+            'match_text': normalize_job_text(posting['title'], posting['description']).text[:DESCRIPTION_LIMIT],
+            'requirements': posting['skills'] if rng.random() < 0.5 else [],
+            'salary': f"${posting['salary_min']:,}-${posting['salary_max']:,}",
+            'remote': posting['location'] in ("Remote", "Anywhere"),
+            'match_score': rng.random(),
+        })
+    return jobs
+
+
+def make_skills(count: int, seed: int = 11) -> list:
+    return random.Random(seed).sample(SKILLS, min(count, len(SKILLS))) + [
+        f"skill{i}" for i in range(max(0, count - len(SKILLS)))
+    ]
+
+
+def resume_cases():
+    for size in RESUME_SIZES:
+        text = make_resume(size)
+        label = f"{size // 1000}k chars"
+        yield "extract_skills", label, lambda text=text: extract_skills_from_text(text)
+        yield "analyze_resume", label, lambda text=text: analyze_resume(text)
+
+
+def match_score_case(jobs: list, skills: list):
+    aggregator = JobBoardAggregator()
+    skills = [skill.lower() for skill in skills]
+    aggregator.skill_expansions = {
+        skill: {related: credit for related, credit in skill_graph.related(skill).items() if credit >= 0.5}
+        for skill in skills[:5]
+    }
+    texts = [job_match_text(job) for job in jobs]
+    for text in texts:
+        text.tokens
+    return lambda: [aggregator._calculate_match_score(text, skills) for text in texts]
+
+
+def skill_match_case(jobs: list, skills: list):
+    texts = [job_match_text(job) for job in jobs]
+    skills_lower = [skill.lower() for skill in skills]
+    expanded = skill_graph.expand(skills_lower)
+    return lambda: [
+        analyze_skill_match_local(job, skills, text, skills_lower, expanded)
+        for job, text in zip(jobs, texts)
+    ]
+
+
+def readiness_case(jobs: list, skills: list):
+    analyses = [analyze_skill_match_local(job, skills) for job in jobs]
+    return lambda: [
+        calculate_readiness_score_local(analysis, 4, job)
+        for analysis, job in zip(analyses, jobs)
+    ]
+
+
+def job_cases():
+    default_jobs = make_jobs(DEFAULT_BATCH)
+    for count in SKILL_COUNTS:
+        skills = make_skills(count)
+        label = f"{count} skills x {DEFAULT_BATCH} jobs"
+        yield "match_score", label, match_score_case(default_jobs, skills)
+        yield "skill_match", label, skill_match_case(default_jobs, skills)
+    default_skills = make_skills(DEFAULT_SKILLS)
+    for count in BATCH_SIZES:
+        jobs = make_jobs(count)
+        label = f"{DEFAULT_SKILLS} skills x {count} jobs"
+        yield "match_score", label, match_score_case(jobs, default_skills)
+        yield "skill_match", label, skill_match_case(jobs, default_skills)
+        yield "readiness_score", label, readiness_case(jobs, default_skills)
+
+
+def measure(func, min_time: float, repeat: int) -> dict:
+    """Best-of-`repeat` ops/sec over runs of at least `min_time`, and peak allocation of one call"""
+    func()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9)))
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    func()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return {
+        'ops_per_sec': round(1 / best, 2),
+        'mean_us': round(best * 1e6, 2),
+        'peak_alloc_kib': round(peak / 1024, 1),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return {(r['name'], r['size']): r for r in json.load(f)['results']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="only benchmarks whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timed run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="write machine-readable results here")
+    parser.add_argument("--compare", help="results JSON from another commit to compare against")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    results = []
+    print(f"{'benchmark':<18} {'size':<24} {'ops/sec':>12} {'mean':>12} {'peak alloc':>12}"
+          f"{'  vs baseline' if baseline else ''}")
+    for cases in (resume_cases, job_cases):
+        for name, size, func in cases():
+            if args.filter not in name:
+                continue
+            # extract_skills_from_text prints its keyword-fallback notice on every call
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                result = {'name': name, 'size': size, **measure(func, args.min_time, args.repeat)}
+            results.append(result)
+            line = (f"{name:<18} {size:<24} {result['ops_per_sec']:>12,.1f} "
+                    f"{result['mean_us']:>10,.1f}us {result['peak_alloc_kib']:>9,.1f}KiB")
+            previous = baseline.get((name, size))
+            if previous:
+                line += f"  {result['ops_per_sec'] / previous['ops_per_sec'] - 1:+.1%}"
+            print(line, flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                'commit': git_commit(),
+                'timestamp': datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results,
+            }, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,13 @@
+import os
+
 CANDIDATE_AGENT_ADDRESS = "agent1q08kycnalue0xwhgl888cwlaxlfaqmyyfmzrlvqqpd38c9xh57hlgk893l8"
 JOB_DISCOVERY_ADDRESS = "agent1qd8vlyl2wte96ktqxl4uvhqac3m5uq2ag999qe0fhvr5qzywv0k9720yjmz"
 RECOMMENDER_ADDRESS = "agent1q2g24508ufjrlcusjxk7cmg53f7udtu4a49a5e76zfj77x207sj5us5xwt6"
-TEST_AGENT_ADDRESS="agent1q2qwx5y844xhy0uqnzjy2xjs6ykmhq7dznvxwh6u9z3g7unq39l92eredxe"
\ No newline at end of file
+TEST_AGENT_ADDRESS="agent1q2qwx5y844xhy0uqnzjy2xjs6ykmhq7dznvxwh6u9z3g7unq39l92eredxe"
+
+# Job Discovery worker pool; profiles are sharded across it by skill (see agents/hash_ring.py)
+JOB_DISCOVERY_ADDRESSES = [
+    address.strip()
+    for address in os.getenv("JOB_DISCOVERY_ADDRESSES", "").split(",")
+    if address.strip()
+] or [JOB_DISCOVERY_ADDRESS]
@@ -0,0 +1,266 @@
+"""
+Local mock of the four job-board APIs used by the Job Discovery agent.
+Serves Adzuna, FindWork, SerpAPI (Google Jobs) and Remotive responses from
+recorded cassettes, or synthesizes native-format payloads, with tunable
+latency, error rate, 429 rate and payload size.
+
+Point the discovery agent at it with:
+    JOB_BOARD_BASE_URL=http://127.0.0.1:8765
+(plus any non-empty ADZUNA_APP_ID/ADZUNA_APP_KEY, FINDWORK_API_KEY and
+SERPAPI_API_KEY so the fetchers run).
+
+Cassettes are JSON files named adzuna.json, findwork.json, serpapi.json and
+remotive.json, each {"responses": [{"status": 200, "body": {...}}, ...]},
+served round-robin. Record them from the real APIs with --record, which
+proxies every request upstream and appends the response.
+
+Usage:
+    python tools/mock_job_board.py [--port 8765] [--cassettes DIR] [--record]
+        [--latency-ms 150] [--jitter-ms 50] [--error-rate 0.0] [--throttle-rate 0.0]
+        [--jobs 20] [--description-chars 1500] [--seed 7]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from urllib.parse import unquote_plus
+
+from aiohttp import ClientSession, web
+
+# source -> (path, real upstream host)
+ROUTES = {
+    'adzuna': ("/v1/api/jobs/{country}/search/{page}", "https://api.adzuna.com"),
+    'findwork': ("/api/jobs/", "https://findwork.dev"),
+    'serpapi': ("/search", "https://serpapi.com"),
+    'remotive': ("/api/remote-jobs", "https://remotive.com"),
+}
+
+SKILLS = [
+    "python", "django", "flask", "fastapi", "react", "javascript", "typescript", "node.js", "vue.js",
+    "aws", "docker", "kubernetes", "terraform", "sql", "postgresql", "mongodb", "redis", "kafka",
+    "machine learning", "pytorch", "tensorflow", "pandas", "go", "java", "spring", "ci/cd", "devops",
+]
+TITLES = ["Software Engineer", "Backend Developer", "Frontend Engineer", "Full Stack Developer",
+          "Data Engineer", "ML Engineer", "DevOps Engineer", "Platform Engineer", "Site Reliability Engineer"]
+LEVELS = ["", "Senior ", "Staff ", "Junior ", "Lead "]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises",
+             "Soylent", "Tyrell", "Cyberdyne", "Aperture", "Black Mesa", "Vandelay", "Wonka"]
+LOCATIONS = ["Remote", "New York, NY", "San Francisco, CA", "Austin, TX", "Berlin", "London", "Anywhere"]
+FILLER = (
+    "You will design build and operate reliable services, collaborate with product and design, "
+    "review code, mentor engineers and own features end to end. We value clear writing, "
+    "pragmatic testing and calm on-call rotations. Benefits include health cover, learning budget "
+    "and flexible hours. "
+)
+
+
+class JobFactory:
+    """Synthesizes job postings in each source's native JSON shape"""
+
+    def __init__(self, seed: int, description_chars: int, now: datetime = None):
+        self.rng = random.Random(seed)
+        self.description_chars = description_chars
+        self.ids = itertools.count(1)
+        # Posting dates are relative to this; fix it for byte-identical output across runs
+        self.now = now
+
+    def _posting(self, query: str) -> dict:
+        rng = self.rng
+        skills = rng.sample(SKILLS, rng.randint(3, 6))
+        if query:
+            skills[0] = query
+        body = f"<p>We are hiring! Must know <b>{'</b>, <b>'.join(skills)}</b>.</p>"
+        while len(body) < self.description_chars:
+            body += f"<p>{FILLER}</p>"
+        salary_min = rng.randrange(60, 180) * 1000
+        posted = (self.now or datetime.now(timezone.utc)) - timedelta(days=rng.randint(0, 20), hours=rng.randint(0, 23))
+        return {
+            'id': next(self.ids),
+            'title': f"{rng.choice(LEVELS)}{rng.choice(TITLES)}",
+            'company': rng.choice(COMPANIES),
+            'location': rng.choice(LOCATIONS),
+            'description': body[:self.description_chars],
+            'skills': skills,
+            'salary_min': salary_min,
+            'salary_max': salary_min + rng.randrange(10, 60) * 1000,
+            'posted': posted.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+
+    def adzuna(self, query: str, count: int) -> dict:
+        results = []
+        for job in (self._posting(query) for _ in range(count)):
+            results.append({
+                'id': str(job['id']),
+                'title': job['title'],
+                'description': job['description'],
+                'created': job['posted'],
+                'redirect_url': f"https://www.adzuna.com/details/{job['id']}",
+                'salary_min': job['salary_min'],
+                'salary_max': job['salary_max'],
+                'company': {'display_name': job['company']},
+                'location': {'display_name': job['location']},
+            })
+        return {'count': len(results), 'results': results}
+
+    def findwork(self, query: str, count: int) -> dict:
+        results = []
+        for job in (self._posting(query) for _ in range(count)):
+            results.append({
+                'id': job['id'],
+                'role': job['title'],
+                'company_name': job['company'],
+                'text': job['description'],
+                'url': f"https://findwork.dev/{job['id']}",
+                'location': job['location'],
+                'remote': job['location'] in ("Remote", "Anywhere"),
+                'keywords': ",".join(job['skills']),
+                'date_posted': job['posted'],
+            })
+        return {'count': len(results), 'next': None, 'previous': None, 'results': results}
+
+    def serpapi(self, query: str, count: int) -> dict:
+        results = []
+        for job in (self._posting(query) for _ in range(count)):
+            results.append({
+                'job_id': f"serp{job['id']}",
+                'title': job['title'],
+                'company_name': job['company'],
+                'location': job['location'],
+                'description': job['description'],
+                'share_link': f"https://www.google.com/search?ibp=htl;jobs#{job['id']}",
+                'detected_extensions': {
+                    'salary': f"{job['salary_min'] // 1000}K–{job['salary_max'] // 1000}K a year",
+                    'posted_at': "2 days ago",
+                },
+            })
+        return {'search_metadata': {'status': "Success"}, 'jobs_results': results}
+
+    def remotive(self, query: str, count: int) -> dict:
+        results = []
+        for job in (self._posting(query) for _ in range(count)):
+            results.append({
+                'id': job['id'],
+                'url': f"https://remotive.com/remote-jobs/software-dev/{job['id']}",
+                'title': job['title'],
+                'company_name': job['company'],
+                'category': "Software Development",
+                'candidate_required_location': job['location'],
+                'salary': f"${job['salary_min']:,} - ${job['salary_max']:,}",
+                'publication_date': job['posted'][:-1],
+                'description': job['description'],
+            })
+        return {'job-count': len(results), 'jobs': results}
+
+
+def search_query(source: str, request: web.Request) -> str:
+    """The skill a fetcher searched for, so synthesized postings match it"""
+    if source == 'adzuna':
+        return unquote_plus(request.query.get('what', ''))
+    if source == 'findwork':
+        return request.query.get('search', '')
+    if source == 'serpapi':
+        return request.query.get('q', '').split(" OR ")[0].replace(" jobs", "")
+    return ""
+
+
+class MockJobBoard:
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.factory = JobFactory(args.seed, args.description_chars)
+        self.cassettes = {}
+        self.cursors = {source: itertools.count() for source in ROUTES}
+        self.stats = Counter()
+        if args.cassettes:
+            for source in ROUTES:
+                path = os.path.join(args.cassettes, f"{source}.json")
+                if os.path.exists(path):
+                    with open(path, encoding="utf-8") as f:
+                        self.cassettes[source] = json.load(f)['responses']
+
+    async def _delay(self):
+        latency = self.args.latency_ms + self.rng.uniform(-self.args.jitter_ms, self.args.jitter_ms)
+        if latency > 0:
+            await asyncio.sleep(latency / 1000)
+
+    async def _record(self, source: str, request: web.Request) -> web.Response:
+        upstream = ROUTES[source][1] + request.rel_url.path_qs
+        headers = {k: v for k, v in request.headers.items() if k.lower() in ("authorization", "user-agent")}
+        async with ClientSession() as session:
+            async with session.get(upstream, headers=headers) as response:
+                body = await response.json(content_type=None)
+                status = response.status
+        responses = self.cassettes.setdefault(source, [])
+        responses.append({'status': status, 'body': body})
+        os.makedirs(self.args.cassettes, exist_ok=True)
+        with open(os.path.join(self.args.cassettes, f"{source}.json"), "w", encoding="utf-8") as f:
+            json.dump({'responses': responses}, f)
+        return web.json_response(body, status=status)
+
+    def handler(self, source: str):
+        async def handle(request: web.Request) -> web.Response:
+            self.stats[f"{source}_requests"] += 1
+            if self.args.record:
+                return await self._record(source, request)
+
+            await self._delay()
+            roll = self.rng.random()
+            if roll < self.args.error_rate:
+                self.stats[f"{source}_500"] += 1
+                return web.json_response({'error': "mock failure"}, status=500)
+            if roll < self.args.error_rate + self.args.throttle_rate:
+                self.stats[f"{source}_429"] += 1
+                return web.json_response({'error': "rate limited"}, status=429, headers={'Retry-After': "1"})
+
+            recorded = self.cassettes.get(source)
+            if recorded:
+                response = recorded[next(self.cursors[source]) % len(recorded)]
+                return web.json_response(response['body'], status=response.get('status', 200))
+            body = getattr(self.factory, source)(search_query(source, request), self.args.jobs)
+            return web.json_response(body)
+        return handle
+
+    async def stats_handler(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.stats))
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        for source, (path, _) in ROUTES.items():
+            app.router.add_get(path, self.handler(source))
+        app.router.add_get("/__stats", self.stats_handler)
+        return app
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cassettes", help="directory of recorded responses")
+    parser.add_argument("--record", action="store_true", help="proxy to the real APIs and save cassettes")
+    parser.add_argument("--latency-ms", type=float, default=150)
+    parser.add_argument("--jitter-ms", type=float, default=50)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--jobs", type=int, default=20, help="postings per synthesized response")
+    parser.add_argument("--description-chars", type=int, default=1500)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    if args.record and not args.cassettes:
+        raise SystemExit("--record needs --cassettes DIR")
+    board = MockJobBoard(args)
+    print(f"Mock job board on http://{args.host}:{args.port} "
+          f"(cassettes: {', '.join(board.cassettes) or 'none, synthesizing'})")
+    web.run_app(board.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Deterministic synthetic corpus for scale testing.
+Generates resumes (skills from the resume analyzer's vocabulary, varied
+experience phrasing and work-location cues) and job postings in each
+upstream's native JSON shape (Adzuna, FindWork, SerpAPI, Remotive, via the
+mock job board's JobFactory). Records are streamed to disk one JSON line
+at a time, so millions of them never sit in memory. The same --seed and
+--as-of always produce the same files.
+
+Output in --out:
+    resumes.jsonl        {"id", "text", "skills", "experience_years", "work_location"}
+                         (the last three are the intended ground truth)
+    jobs/<source>.jsonl  one native posting per line, as found in that API's result list
+    cassettes/<source>.json
+                         with --cassettes: the first --cassette-pages pages in the
+                         mock job board's cassette format (mock_job_board.py --cassettes)
+
+Usage:
+    python tools/synth_corpus.py --out data/corpus [--resumes 10000] [--jobs 100000]
+        [--sources adzuna findwork serpapi remotive] [--page-size 20] [--description-chars 1500]
+        [--cassettes] [--cassette-pages 50] [--gzip] [--seed 7] [--as-of 2025-01-01]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "agents"))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+from mock_job_board import COMPANIES, ROUTES, TITLES, JobFactory  # noqa: E402
+from resume_analyzer import SKILL_KEYWORDS  # noqa: E402
+
+FIRST_NAMES = ["Alex", "Priya", "Sam", "Wei", "Maria", "Omar", "Fatima", "John", "Aisha", "Lucas", "Mei", "Arjun"]
+LAST_NAMES = ["Smith", "Khan", "Garcia", "Chen", "Okafor", "Novak", "Haque", "Silva", "Müller", "Tanaka"]
+CITIES = ["Austin, TX", "Berlin", "Bangalore", "London", "Toronto", "Lagos", "New York, NY", "Lisbon"]
+# Phrasing the analyzer's experience patterns understand, plus date-ranges-only resumes
+EXPERIENCE_PHRASES = [
+    "{n}+ years of experience building production software.",
+    "Software engineer with {n} years experience across startups and enterprises.",
+    "Experience: {n} years in backend and cloud engineering.",
+    "{n} yrs experience shipping web products.",
+    None,
+]
+LOCATION_CUES = {
+    "remote": ["Looking for fully remote roles.", "Prefer to work from home.", "Happy to telecommute."],
+    "hybrid": ["Open to hybrid work.", "Interested in flexible work arrangements.", "Prefer a mixed office and home schedule."],
+    "onsite": ["Prefer onsite roles.", "Looking for office based positions in {city}."],
+    None: ["Based in {city}."],
+}
+BULLETS = [
+    "Built and operated services with {skill} and {skill}.",
+    "Led the migration of a legacy platform to {skill}.",
+    "Cut p95 latency by {pct}% by introducing {skill} caching.",
+    "Mentored {count} engineers and ran code reviews for the {skill} team.",
+    "Automated deployments with {skill}, reducing release time by {pct}%.",
+]
+
+
+class ResumeFactory:
+    """Synthesizes resumes whose intended skills, experience and location are known"""
+
+    def __init__(self, seed: int, as_of: datetime):
+        self.rng = random.Random(seed)
+        self.year = as_of.year
+
+    def resume(self, index: int) -> dict:
+        rng = self.rng
+        skills = rng.sample(SKILL_KEYWORDS, rng.randint(3, 12))
+        years = rng.randint(0, 20)
+        location = rng.choice(["remote", "hybrid", "onsite", None])
+        city = rng.choice(CITIES)
+
+        lines = [
+            f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            f"{rng.choice(TITLES)} | {city}",
+            "",
+            "SUMMARY",
+        ]
+        phrase = rng.choice(EXPERIENCE_PHRASES)
+        if phrase and years:
+            lines.append(phrase.format(n=years))
+        lines.append(rng.choice(LOCATION_CUES[location]).format(city=city))
+        lines.extend(["", "SKILLS", ", ".join(skills), "", "WORK HISTORY"])
+
+        # Consecutive roles covering the experience, most recent first
+        end = self.year
+        remaining = years
+        while remaining > 0:
+            span = min(remaining, rng.randint(1, 5))
+            start = end - span
+            lines.append(
+                f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)} {start} - {'present' if end == self.year else end}"
+            )
+            for _ in range(rng.randint(1, 3)):
+                bullet = rng.choice(BULLETS).format(
+                    skill="{skill}", pct=rng.randint(10, 60), count=rng.randint(2, 8)
+                )
+                while "{skill}" in bullet:
+                    bullet = bullet.replace("{skill}", rng.choice(skills), 1)
+                lines.append(f"- {bullet}")
+            remaining -= span
+            end = start
+
+        graduated = self.year - years - rng.randint(0, 2)
+        lines.extend(["", "EDUCATION", f"B.Sc Computer Science, State University {graduated - 4} - {graduated}"])
+        return {
+            'id': f"resume-{index:07d}",
+            'text': "\n".join(lines),
+            'skills': skills,
+            'experience_years': years,
+            'work_location': location or "remote",
+        }
+
+
+def _open(path: str, compress: bool):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if compress:
+        return gzip.open(path + ".gz", "wt", encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def iter_records(path: str):
+    """Stream records back from a corpus JSONL file (plain or .gz)"""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _page_results(source: str, page: dict) -> list:
+    return page['jobs'] if source == 'remotive' else page.get('jobs_results', page.get('results', []))
+
+
+def write_resumes(args, as_of: datetime) -> int:
+    factory = ResumeFactory(args.seed, as_of)
+    with _open(os.path.join(args.out, "resumes.jsonl"), args.gzip) as f:
+        for i in range(args.resumes):
+            f.write(json.dumps(factory.resume(i), ensure_ascii=False) + "\n")
+    return args.resumes
+
+
+def write_jobs(args, source: str, as_of: datetime) -> int:
+    """Stream `args.jobs` postings for one source, keeping the first pages as a cassette"""
+    # Per-source seeds, so adding a source doesn't change the others' output
+    seed = args.seed * 1000 + sorted(ROUTES).index(source)
+    factory = JobFactory(seed, args.description_chars, as_of)
+    query_rng = random.Random(seed + 100)
+    cassette = []
+    written = 0
+    with _open(os.path.join(args.out, "jobs", f"{source}.jsonl"), args.gzip) as f:
+        while written < args.jobs:
+            count = min(args.page_size, args.jobs - written)
+            page = getattr(factory, source)(query_rng.choice(SKILL_KEYWORDS), count)
+            for posting in _page_results(source, page):
+                f.write(json.dumps(posting, ensure_ascii=False) + "\n")
+            if args.cassettes and len(cassette) < args.cassette_pages:
+                cassette.append({'status': 200, 'body': page})
+            written += count
+
+    if args.cassettes:
+        path = os.path.join(args.out, "cassettes", f"{source}.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({'responses': cassette}, f, ensure_ascii=False)
+    return written
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--resumes", type=int, default=10000)
+    parser.add_argument("--jobs", type=int, default=100000, help="postings per source")
+    parser.add_argument("--sources", nargs="+", choices=sorted(ROUTES), default=sorted(ROUTES))
+    parser.add_argument("--page-size", type=int, default=20, help="postings per synthesized API response")
+    parser.add_argument("--description-chars", type=int, default=1500)
+    parser.add_argument("--cassettes", action="store_true", help="also write mock job board cassettes")
+    parser.add_argument("--cassette-pages", type=int, default=50, help="responses per cassette (loaded into memory)")
+    parser.add_argument("--gzip", action="store_true", help="gzip the JSONL files")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--as-of", default=None, help="reference date YYYY-MM-DD for posting dates and resumes (default: today)")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    as_of = datetime.strptime(args.as_of, "%Y-%m-%d") if args.as_of else datetime.now(timezone.utc)
+    as_of = as_of.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=timezone.utc)
+
+    started = time.perf_counter()
+    count = write_resumes(args, as_of)
+    print(f"resumes: {count:,} ({time.perf_counter() - started:.1f}s)", flush=True)
+    for source in args.sources:
+        started = time.perf_counter()
+        count = write_jobs(args, source, as_of)
+        print(f"{source}: {count:,} postings ({time.perf_counter() - started:.1f}s)", flush=True)
+    print(f"Corpus written to {args.out} (as of {as_of:%Y-%m-%d}, seed {args.seed})")
+
+
+if __name__ == "__main__":
+    main()